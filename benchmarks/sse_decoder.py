@@ -0,0 +1,57 @@
+"""Measures the throughput of `weavaidev.sse.SSEDecoder` on a large synthetic stream.
+
+Usage:
+    python benchmarks/sse_decoder.py --events 200000 --chunk-size 4096
+"""
+
+import argparse
+import sys
+import time
+from typing import Tuple
+
+from weavaidev.sse import SSEDecoder
+
+
+def build_stream(events: int, data_lines: int, line_ending: bytes) -> bytes:
+    event = line_ending.join(
+        [b"event: token", b"id: 0000000"]
+        + [b"data: " + b"x" * 48 for _ in range(data_lines)]
+        + [b"", b""]
+    )
+    return b": keep-alive" + line_ending + event * events
+
+
+def run(body: bytes, chunk_size: int, repeat: int) -> Tuple[int, float]:
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    best = float("inf")
+    for _ in range(repeat):
+        decoder = SSEDecoder()
+        started_at = time.perf_counter()
+        count = 0
+        for chunk in chunks:
+            count += len(decoder.feed(chunk))
+        best = min(best, time.perf_counter() - started_at)
+    return count, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--data-lines", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, nargs="+", default=[64, 4096, 65536])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, line_ending in (("LF", b"\n"), ("CRLF", b"\r\n")):
+        body = build_stream(args.events, args.data_lines, line_ending)
+        for chunk_size in args.chunk_size:
+            count, seconds = run(body, chunk_size, args.repeat)
+            sys.stdout.write(
+                f"{name:>4} chunk={chunk_size:>6}  events={count}  "
+                f"{count / seconds:>12,.0f} events/s  "
+                f"{len(body) / seconds / 2**20:>8.1f} MiB/s\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,3 +4,13 @@ from pydantic import BaseModel, SecretStr
 class Config(BaseModel):
     auth_token: SecretStr
     env: str
+
+
+def __getattr__(name: str):
+    # WeavClient is imported on first access, so `from weavaidev import Config` stays
+    # cheap for code that uses the operations classes directly.
+    if name == "WeavClient":
+        from weavaidev.client import WeavClient
+
+        return WeavClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
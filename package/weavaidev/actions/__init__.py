@@ -1,7 +1,10 @@
+from typing import Iterable, List, Optional
+
 import requests
 from weavaidev import Config
 from weavaidev.actions.exceptions import ActionOperationsException
-from weavaidev.actions.models import Action, ActionTypes
+from weavaidev.actions.models import Action, ActionTypes, ActionValidationResult
+from weavaidev.actions.validation import ActionPayload, ActionSchemaCache
 from weavaidev.config_models import (
     AUTHENTICATION_FAILED_MESSAGE,
     ServiceEndpoints,
@@ -11,10 +14,17 @@ from weavaidev.config_models import (
 
 
 class ActionOperations:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        schema_ttl: Optional[float] = 300.0,
+        session: Optional[requests.Session] = None,
+    ):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.AGENT)
+        self.schemas = ActionSchemaCache(self, ttl=schema_ttl)
 
     def get_action_types(self) -> ActionTypes:
         """
@@ -32,7 +42,7 @@ class ActionOperations:
             message, and response data for debugging.
         """
         url = f"{self.base_url}/{self.endpoints.GET_ACTION_TYPES}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -80,7 +90,7 @@ class ActionOperations:
         url = f"{self.base_url}/{self.endpoints.GET_ACTION_TYPE_CONFIGURATIONS}".format(
             ACTION_TYPE=action_type
         )
-        response = requests.get(
+        response = self.session.get(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -103,3 +113,29 @@ class ActionOperations:
                 response_data=response.json(),
             )
         return Action.model_validate(response.json())
+
+    def validate_actions(
+        self, actions: Iterable[ActionPayload], action_type: Optional[str] = None
+    ) -> List[ActionValidationResult]:
+        """
+        Validates action configurations locally against the JSON schemas of their action types.
+
+        The schemas are fetched with `get_action_types` and compiled once, then cached in `self.schemas`
+        for `schema_ttl` seconds, so invalid configurations are found without sending them to the agent
+        service. Requires the optional `jsonschema` dependency (`pip install weavaidev[validation]`).
+
+        Args:
+            actions (Iterable[ActionPayload]): The action configurations, as dictionaries or models such as
+                `weavaidev.agents.models.Action`.
+            action_type (Optional[str]): The action type of every configuration. Defaults to None, which
+                uses each configuration's `type` field.
+
+        Returns:
+            List[ActionValidationResult]: One result per configuration, in order, with its validation
+                issues. Unknown action types are reported as issues.
+
+        Raises:
+            ActionOperationsException: Raised if the action types have to be fetched and the request fails.
+            ImportError: Raised if jsonschema is not installed.
+        """
+        return self.schemas.validate_many(actions, action_type=action_type)
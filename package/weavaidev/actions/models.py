@@ -19,3 +19,23 @@ class Action(BaseModel):
 class ActionTypes(BaseModel):
     type: str
     json_schema: Dict[str, Any]
+
+
+class ActionValidationIssue(BaseModel):
+    path: str
+    message: str
+    validator: Optional[str] = None
+
+
+class ActionValidationResult(BaseModel):
+    index: int
+    type: Optional[str] = None
+    valid: bool = True
+    issues: List[ActionValidationIssue] = Field(default_factory=list)
+
+
+class ActionSchemaRefreshResult(BaseModel):
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
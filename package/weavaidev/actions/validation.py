@@ -0,0 +1,213 @@
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel
+from weavaidev.actions.models import (
+    ActionSchemaRefreshResult,
+    ActionValidationIssue,
+    ActionValidationResult,
+)
+
+if TYPE_CHECKING:
+    from weavaidev.actions import ActionOperations
+
+ActionPayload = Union[Dict[str, Any], BaseModel]
+
+
+class _CompiledSchema:
+    __slots__ = ("fingerprint", "validator", "error")
+
+    def __init__(self, fingerprint: str, validator: Any, error: Optional[str]):
+        self.fingerprint = fingerprint
+        self.validator = validator
+        self.error = error
+
+
+class ActionSchemaCache:
+    """Compiled JSON-schema validators for the action types, keyed by type.
+
+    The `json_schema` of every type returned by `get_action_types` is compiled once
+    into a `jsonschema` validator for the schema's draft, with format checking. A
+    refresh fetches the types again and only recompiles the schemas whose content
+    changed. The cache is loaded on first use and refreshed when it is older than `ttl`
+    seconds (never, if `ttl` is None) or when a payload names a type it does not know,
+    so once loaded, validation runs locally without requests.
+
+    Requires the optional `jsonschema` dependency.
+    """
+
+    def __init__(self, operations: "ActionOperations", ttl: Optional[float] = 300.0):
+        self.operations = operations
+        self.ttl = ttl
+        self._schemas: Optional[Dict[str, _CompiledSchema]] = None
+        self._loaded_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def action_types(self) -> List[str]:
+        return list(self._get_schemas())
+
+    def is_fresh(self) -> bool:
+        return self._schemas is not None and (
+            self.ttl is None or time.monotonic() - self._loaded_at < self.ttl
+        )
+
+    def refresh(self) -> ActionSchemaRefreshResult:
+        """Fetches the action types and compiles the schemas that are new or changed.
+
+        Raises:
+            ActionOperationsException: Raised if fetching the action types fails; the cached validators are
+                kept.
+            ImportError: Raised if jsonschema is not installed.
+
+        Returns:
+            ActionSchemaRefreshResult: The number of action types added, updated, unchanged and removed.
+        """
+        validators = _jsonschema_validators()
+        action_types = self.operations.get_action_types()
+        with self._lock:
+            previous = self._schemas or {}
+            schemas = {}
+            result = ActionSchemaRefreshResult()
+            for action_type in action_types:
+                fingerprint = json.dumps(
+                    action_type.json_schema, sort_keys=True, separators=(",", ":")
+                )
+                compiled = previous.get(action_type.type)
+                if compiled is not None and compiled.fingerprint == fingerprint:
+                    result.unchanged += 1
+                else:
+                    if compiled is None:
+                        result.added += 1
+                    else:
+                        result.updated += 1
+                    compiled = _compile(
+                        validators, action_type.json_schema, fingerprint
+                    )
+                schemas[action_type.type] = compiled
+            result.removed = len(previous.keys() - schemas.keys())
+            self._schemas = schemas
+            self._loaded_at = time.monotonic()
+        return result
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._schemas = None
+            self._loaded_at = float("-inf")
+
+    def validate(
+        self, action: ActionPayload, action_type: Optional[str] = None
+    ) -> List[ActionValidationIssue]:
+        """Validates one action payload and returns its issues, empty if it is valid."""
+        return self.validate_many([action], action_type=action_type)[0].issues
+
+    def validate_many(
+        self, actions: Iterable[ActionPayload], action_type: Optional[str] = None
+    ) -> List[ActionValidationResult]:
+        """Validates action payloads against the schemas of their action types.
+
+        Args:
+            actions (Iterable[ActionPayload]): The action payloads, as dictionaries or models such as
+                `weavaidev.agents.models.Action`. Models are dumped in JSON mode without their None fields.
+            action_type (Optional[str]): The action type of every payload. Defaults to None, which uses each
+                payload's `type` field.
+
+        Raises:
+            ActionOperationsException: Raised if the action types have to be fetched and fetching them fails.
+            ImportError: Raised if jsonschema is not installed.
+
+        Returns:
+            List[ActionValidationResult]: One result per payload, in order, with its issues sorted by path.
+        """
+        payloads = [_as_payload(action) for action in actions]
+        types = [
+            action_type or (payload.get("type") if isinstance(payload, dict) else None)
+            for payload in payloads
+        ]
+        schemas = self._get_schemas()
+        if (
+            any(isinstance(name, str) and name not in schemas for name in types)
+            and not self._refreshed_recently()
+        ):
+            # A type may have been added since the cache was loaded.
+            self.refresh()
+            schemas = self._get_schemas()
+
+        results = []
+        for index, (payload, name) in enumerate(zip(payloads, types)):
+            result = ActionValidationResult(index=index, type=name)
+            result.issues = _issues(payload, name, schemas)
+            result.valid = not result.issues
+            results.append(result)
+        return results
+
+    def _get_schemas(self) -> Dict[str, _CompiledSchema]:
+        if not self.is_fresh():
+            self.refresh()
+        return self._schemas
+
+    def _refreshed_recently(self) -> bool:
+        # Avoids refetching the types for every batch that names an unknown type.
+        return time.monotonic() - self._loaded_at < 1.0
+
+
+def _jsonschema_validators():
+    try:
+        from jsonschema import validators
+    except ImportError as exc:
+        raise ImportError(
+            "Action validation requires jsonschema, install it with `pip install weavaidev[validation]`"
+        ) from exc
+    return validators
+
+
+def _compile(validators, schema: Dict[str, Any], fingerprint: str) -> _CompiledSchema:
+    from jsonschema.exceptions import SchemaError
+
+    validator_class = validators.validator_for(schema)
+    try:
+        validator_class.check_schema(schema)
+    except SchemaError as exc:
+        # Reported for every payload of this type instead of failing the whole refresh.
+        return _CompiledSchema(fingerprint, None, exc.message)
+    return _CompiledSchema(
+        fingerprint,
+        validator_class(schema, format_checker=validator_class.FORMAT_CHECKER),
+        None,
+    )
+
+
+def _as_payload(action: ActionPayload) -> Any:
+    if isinstance(action, BaseModel):
+        return action.model_dump(mode="json", exclude_none=True)
+    return action
+
+
+def _issues(
+    payload: Any, action_type: Any, schemas: Dict[str, _CompiledSchema]
+) -> List[ActionValidationIssue]:
+    if not isinstance(action_type, str) or not action_type:
+        return [ActionValidationIssue(path="$.type", message="Missing action type")]
+    compiled = schemas.get(action_type)
+    if compiled is None:
+        return [
+            ActionValidationIssue(
+                path="$.type", message=f"Unknown action type {action_type!r}"
+            )
+        ]
+    if compiled.validator is None:
+        return [
+            ActionValidationIssue(
+                path="$",
+                message=f"Invalid schema for action type {action_type!r}: {compiled.error}",
+            )
+        ]
+    issues = [
+        ActionValidationIssue(
+            path=error.json_path, message=error.message, validator=error.validator
+        )
+        for error in compiled.validator.iter_errors(payload)
+    ]
+    return sorted(issues, key=lambda issue: issue.path)
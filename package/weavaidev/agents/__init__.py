@@ -1,16 +1,20 @@
-import contextlib
-from typing import List
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 import requests
-from pydantic import ValidationError
 from weavaidev import Config
 from weavaidev.agents.exceptions import AgentServiceException
+from weavaidev.agents.fanout import AgentFanOut, FanOutStrategy
 from weavaidev.agents.models import (
     AgentConfiguration,
     AgentConfigurations,
     GetAgentRequest,
     GetAgentResponse,
 )
+from weavaidev.agents.registry import AgentRegistry
+from weavaidev.agents.streaming import AgentResponseStream
 from weavaidev.config_models import (
     AUTHENTICATION_FAILED_MESSAGE,
     VALIDATION_FAILED_MESSAGE,
@@ -18,13 +22,28 @@ from weavaidev.config_models import (
     ServiceType,
     get_base_url,
 )
+from weavaidev.sse import EventStream
+
+if TYPE_CHECKING:
+    from weavaidev.chats.history import ChatHistoryCache
 
 
 class AgentOperations:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        registry_ttl: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        history_cache: Optional["ChatHistoryCache"] = None,
+    ):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.AGENT)
+        self.registry: Optional[AgentRegistry] = (
+            AgentRegistry(self, ttl=registry_ttl) if registry_ttl is not None else None
+        )
+        self.history_cache = history_cache
 
     def get_all_agents(self) -> AgentConfigurations:
         """Fetches all available agent types.
@@ -40,7 +59,7 @@ class AgentOperations:
             AgentConfigurations: A response object containing a list of available agent configurations.
         """
         url = f"{self.base_url}/{self.endpoints.GET_AGENT_CONFIGURATIONS}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -76,7 +95,10 @@ class AgentOperations:
         """Fetches the response from an agent based on the user input.
 
         This method sends a request to retrieve the response of a specified agent
-        for a given user input, chat ID, and other parameters.
+        for a given user input, chat ID, and other parameters. The whole response is
+        read before returning; use `iter_agent_response` to process events as they arrive.
+        When the operations were created with a `ChatHistoryCache`, the user input and the
+        events carrying chat messages are appended to the cached history of `chat_id`.
 
         Args:
             - user_input (str): The user's input to which the agent responds.
@@ -92,14 +114,144 @@ class AgentOperations:
         Returns:
             List[GetAgentResponse]: A list of agent responses parsed from server-sent events (SSE).
         """
-        url = f"{self.base_url}/{self.endpoints.GET_AGENT_RESPONSE}"
+        with self.iter_agent_response(
+            user_input=user_input, chat_id=chat_id, agent_id=agent_id, stream=stream
+        ) as events:
+            return list(events)
+
+    def iter_agent_response(
+        self,
+        user_input: str,
+        chat_id: str,
+        agent_id: str,
+        stream: bool = True,
+        max_reconnects: int = 0,
+    ) -> AgentResponseStream:
+        """Sends a request to an agent and returns its response as a stream of events.
+
+        The method returns as soon as the response headers arrive; iterating the returned
+        `AgentResponseStream` yields each `GetAgentResponse` as soon as it is decoded. Stop
+        early with `close` (or a `with` block) to release the connection. When the operations
+        were created with a `ChatHistoryCache`, the user input and the events carrying chat
+        messages are appended to the cached history of `chat_id` once the stream is exhausted.
+
+        Args:
+            - user_input (str): The user's input to which the agent responds.
+            - chat_id (str): The unique identifier for the chat session.
+            - agent_id (str): The unique identifier of agent to use for generating the response.
+            - stream (bool): A flag indicating whether the response should be streamed. Defaults to True.
+            - max_reconnects (int): How many times a connection lost mid-stream is re-established, waiting for the
+                server's `retry` delay and sending the last event ID as `Last-Event-ID`. Defaults to 0.
+                A reconnect POSTs the agent request again: if the server ignores `Last-Event-ID`, the agent
+                runs again and its events are repeated from the start.
+
+        Raises:
+            AgentServiceException: Raised if authentication fails (status code 401).
+            AgentServiceException: Raised if form validation fails (status code 422).
+            AgentServiceException: Raised if any other error occurs while getting the agent response.
+
+        Returns:
+            AgentResponseStream: The agent's events, which also records the time to the first event in `metrics`.
+        """
         get_agent_request_body = GetAgentRequest(
             user_input=user_input, chat_id=chat_id, stream=stream, agent_id=agent_id
         )
-        response = requests.post(
+        started_at = time.perf_counter()
+        response = self._post_agent_request(get_agent_request_body)
+        return AgentResponseStream(
+            EventStream(
+                response,
+                started_at,
+                reconnect=lambda last_event_id: self._post_agent_request(
+                    get_agent_request_body, last_event_id
+                ),
+                max_reconnects=max_reconnects,
+            ),
+            on_complete=(
+                partial(
+                    self.history_cache.append_agent_responses,
+                    chat_id,
+                    user_input=user_input,
+                )
+                if self.history_cache is not None
+                else None
+            ),
+        )
+
+    async def aiter_agent_response(
+        self,
+        user_input: str,
+        chat_id: str,
+        agent_id: str,
+        stream: bool = True,
+        max_reconnects: int = 0,
+    ) -> AgentResponseStream:
+        """Async variant of `iter_agent_response`; iterate the result with `async for`."""
+        return await asyncio.to_thread(
+            self.iter_agent_response,
+            user_input=user_input,
+            chat_id=chat_id,
+            agent_id=agent_id,
+            stream=stream,
+            max_reconnects=max_reconnects,
+        )
+
+    def fan_out_agent_response(
+        self,
+        user_input: str,
+        chat_id: str,
+        agent_ids: Iterable[str],
+        strategy: FanOutStrategy = "all",
+        max_reconnects: int = 0,
+    ) -> AgentFanOut:
+        """Queries several agents concurrently and streams their events interleaved.
+
+        Each agent is sent the same `user_input` and `chat_id` from its own thread. Iterating
+        the returned `AgentFanOut` (with `for` or `async for`) yields `AgentFanOutEvent`s tagged
+        with the agent ID as they arrive, and `collect` groups them by agent.
+
+        Args:
+            - user_input (str): The user's input to which the agents respond.
+            - chat_id (str): The unique identifier for the chat session.
+            - agent_ids (Iterable[str]): The unique identifiers of the agents to query, e.g. from `get_all_agents`.
+            - strategy (str): "all" to wait for every agent, or "first" to stop at the first agent that finishes and
+                close the other streams. Defaults to "all".
+            - max_reconnects (int): Passed to `iter_agent_response` for every agent. Defaults to 0.
+
+        Raises:
+            ValueError: Raised if the strategy is unknown.
+            AgentServiceException: Raised while iterating if every agent fails; individual failures are
+                recorded in `AgentFanOut.errors`.
+
+        Returns:
+            AgentFanOut: The interleaved events; `winner` holds the first agent to finish.
+        """
+        return AgentFanOut(
+            self,
+            user_input=user_input,
+            chat_id=chat_id,
+            agent_ids=agent_ids,
+            strategy=strategy,
+            max_reconnects=max_reconnects,
+        )
+
+    def _post_agent_request(
+        self,
+        get_agent_request_body: GetAgentRequest,
+        last_event_id: Optional[str] = None,
+    ) -> requests.Response:
+        url = f"{self.base_url}/{self.endpoints.GET_AGENT_RESPONSE}"
+        headers = {
+            "Authorization": f"Bearer {self.config.auth_token._secret_value}",
+            "Accept": "text/event-stream",
+        }
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = last_event_id
+        response = self.session.post(
             url=url,
             json=get_agent_request_body.model_dump(),
-            headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
+            headers=headers,
+            stream=True,
         )
         if response.status_code == 401:
             raise AgentServiceException(
@@ -119,31 +271,7 @@ class AgentOperations:
                 message="Failed to get agent types",
                 response_data=response.json(),
             )
-
-        def parse_sse_event(event_string: str) -> GetAgentResponse:
-            lines = event_string.splitlines()
-            event_data = {}
-
-            for line in lines:
-                if line.startswith("data:"):
-                    event_data["data"] = line[len("data: ") :].strip()
-                elif line.startswith("id:"):
-                    event_data["id"] = line[len("id: ") :].strip()
-                elif line.startswith("event:"):
-                    event_data["event"] = line[len("event: ") :].strip()
-                elif line.startswith("retry:"):
-                    event_data["retry"] = int(line[len("retry: ") :].strip())
-
-            with contextlib.suppress(ValidationError):
-                return GetAgentResponse(**event_data)
-
-        resp = []
-        for line in response.iter_lines():
-            if line:
-                decoded_line = line.decode("utf-8")
-                event = parse_sse_event(decoded_line)
-                resp.append(event)
-        return resp
+        return response
 
     def get_agent(self, agent_id: str) -> AgentConfiguration:
         """
@@ -163,13 +291,20 @@ class AgentOperations:
                 - "Failed to get agent history" for any other unexpected error codes.
 
         Notes:
+            - When the operations were created with `registry_ttl`, the configuration is served from the
+            `AgentRegistry` if it knows the agent, and is only fetched from the API otherwise.
             - If the request succeeds, the response's first item (assumed to contain the agent data) is transformed by renaming
             `_id` to `id` to fit the `AgentConfiguration` model requirements.
             - The method expects the response data to contain a list where the first item holds the agent configuration data.
         """
 
+        if self.registry is not None:
+            agent = self.registry.get(agent_id)
+            if agent is not None:
+                return agent
+
         url = f"{self.base_url}/{self.endpoints.GET_AGENT.format(AGENT_ID=agent_id)}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -0,0 +1,152 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+)
+
+from weavaidev.agents.models import AgentFanOutEvent, GetAgentResponse
+from weavaidev.agents.streaming import AgentResponseStream
+from weavaidev.utils import aiter_in_thread
+
+if TYPE_CHECKING:
+    from weavaidev.agents import AgentOperations
+
+FanOutStrategy = Literal["all", "first"]
+
+_DONE = object()
+
+
+class AgentFanOut:
+    """Sends the same question to several agents at once and interleaves their events.
+
+    Every agent is queried from its own thread as soon as the fan-out is created, and
+    iterating yields an `AgentFanOutEvent`, tagged with the agent ID, as each event
+    arrives. With the `all` strategy iteration ends once every agent has finished;
+    with `first`, it ends as soon as one agent finishes and the streams of the others
+    are closed. Either way `winner` is the first agent to finish successfully.
+
+    An agent whose request or stream fails is recorded in `errors` and does not stop
+    the others; if every agent fails, the first error is raised.
+    """
+
+    def __init__(
+        self,
+        operations: "AgentOperations",
+        user_input: str,
+        chat_id: str,
+        agent_ids: Iterable[str],
+        strategy: FanOutStrategy = "all",
+        max_reconnects: int = 0,
+    ):
+        if strategy not in ("all", "first"):
+            raise ValueError(f"Unknown fan-out strategy: {strategy}")
+        self.operations = operations
+        self.user_input = user_input
+        self.chat_id = chat_id
+        self.agent_ids = list(dict.fromkeys(agent_ids))
+        self.strategy = strategy
+        self.max_reconnects = max_reconnects
+        self.winner: Optional[str] = None
+        self.errors: Dict[str, Exception] = {}
+        self._queue: "queue.Queue" = queue.Queue()
+        self._streams: Dict[str, AgentResponseStream] = {}
+        self._cancelled: Set[str] = set()
+        self._lock = threading.Lock()
+        self._iterator: Optional[Iterator[AgentFanOutEvent]] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.agent_ids), 1),
+            thread_name_prefix="weavaidev-agent-fan-out",
+        )
+        for agent_id in self.agent_ids:
+            self._executor.submit(self._run, agent_id)
+
+    def __enter__(self) -> "AgentFanOut":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[AgentFanOutEvent]:
+        if self._iterator is None:
+            self._iterator = self._iter_events()
+        return self._iterator
+
+    def __aiter__(self) -> AsyncIterator[AgentFanOutEvent]:
+        return aiter_in_thread(iter(self), self.close)
+
+    def collect(self) -> Dict[str, List[GetAgentResponse]]:
+        """Consumes the remaining events and returns them grouped by agent ID."""
+        responses: Dict[str, List[GetAgentResponse]] = {}
+        for event in self:
+            responses.setdefault(event.agent_id, []).append(event.response)
+        return responses
+
+    def close(self) -> None:
+        """Closes every open stream; agents that have not finished are abandoned."""
+        self._cancel(self.agent_ids)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_events(self) -> Iterator[AgentFanOutEvent]:
+        remaining = set(self.agent_ids)
+        try:
+            while remaining:
+                agent_id, item = self._queue.get()
+                if agent_id not in remaining:
+                    continue
+                if item is _DONE:
+                    remaining.discard(agent_id)
+                    if self.winner is None:
+                        self.winner = agent_id
+                    if self.strategy == "first":
+                        self._cancel(remaining)
+                        remaining.clear()
+                elif isinstance(item, Exception):
+                    remaining.discard(agent_id)
+                    self.errors[agent_id] = item
+                else:
+                    yield AgentFanOutEvent(agent_id=agent_id, response=item)
+            if self.agent_ids and len(self.errors) == len(self.agent_ids):
+                raise self.errors[self.agent_ids[0]]
+        finally:
+            self.close()
+
+    def _run(self, agent_id: str) -> None:
+        try:
+            stream = self.operations.iter_agent_response(
+                user_input=self.user_input,
+                chat_id=self.chat_id,
+                agent_id=agent_id,
+                max_reconnects=self.max_reconnects,
+            )
+            with self._lock:
+                cancelled = agent_id in self._cancelled
+                if not cancelled:
+                    self._streams[agent_id] = stream
+            if cancelled:
+                stream.close()
+                return
+            for event in stream:
+                self._queue.put((agent_id, event))
+            self._queue.put((agent_id, _DONE))
+        except Exception as exc:
+            self._queue.put((agent_id, exc))
+
+    def _cancel(self, agent_ids: Iterable[str]) -> None:
+        with self._lock:
+            streams = []
+            for agent_id in agent_ids:
+                self._cancelled.add(agent_id)
+                stream = self._streams.pop(agent_id, None)
+                if stream is not None:
+                    streams.append(stream)
+        for stream in streams:
+            stream.close()
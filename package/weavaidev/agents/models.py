@@ -107,3 +107,8 @@ class AgentConfiguration(BaseModel):
 
 class AgentConfigurations(BaseModel):
     configurations: Optional[List[AgentConfiguration]] = []
+
+
+class AgentFanOutEvent(BaseModel):
+    agent_id: str
+    response: GetAgentResponse
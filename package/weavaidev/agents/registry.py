@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from loguru import logger
+from weavaidev.agents.models import AgentConfiguration
+
+if TYPE_CHECKING:
+    from weavaidev.agents import AgentOperations
+
+
+class _Snapshot:
+    __slots__ = (
+        "agents",
+        "by_id",
+        "by_name",
+        "by_action_type",
+        "by_folder_id",
+        "by_intent",
+        "loaded_at",
+    )
+
+    def __init__(self, agents: List[AgentConfiguration], loaded_at: float):
+        self.agents = agents
+        self.loaded_at = loaded_at
+        self.by_id = {agent.id: agent for agent in agents}
+        by_name = defaultdict(list)
+        by_action_type = defaultdict(list)
+        by_folder_id = defaultdict(list)
+        by_intent = defaultdict(list)
+        for agent in agents:
+            by_name[agent.name].append(agent)
+            folder_ids = set()
+            for action_type in dict.fromkeys(action.type for action in agent.actions):
+                by_action_type[action_type].append(agent)
+            for action in agent.actions:
+                folder_ids.update(action.folder_ids)
+                if action.folder_id:
+                    folder_ids.add(action.folder_id)
+            publish_folder_id = (
+                agent.publish_results_configuration.publish_action.folder_id
+            )
+            if publish_folder_id:
+                folder_ids.add(publish_folder_id)
+            for folder_id in folder_ids:
+                by_folder_id[folder_id].append(agent)
+            for name in dict.fromkeys(intent.name for intent in agent.intents.intents):
+                by_intent[name].append(agent)
+        self.by_name: Dict[str, List[AgentConfiguration]] = dict(by_name)
+        self.by_action_type: Dict[str, List[AgentConfiguration]] = dict(by_action_type)
+        self.by_folder_id: Dict[str, List[AgentConfiguration]] = dict(by_folder_id)
+        self.by_intent: Dict[str, List[AgentConfiguration]] = dict(by_intent)
+
+
+class AgentRegistry:
+    """An indexed, periodically refreshed view of the agent configurations.
+
+    The registry is loaded with a single `get_all_agents` call and indexes the agents by
+    ID, name, action type, folder ID (from the actions' `folder_ids`/`folder_id` and the
+    publish action) and intent name, so lookups do not scan the configurations. Within
+    `ttl` seconds of loading, lookups are served as is; for a further `stale_ttl`
+    seconds they are still served while a reload runs in the background; after that
+    the next lookup reloads synchronously.
+
+    Each reload swaps in a new set of indexes, so lookups never observe a partially
+    built registry. Returned configurations are shared and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        operations: "AgentOperations",
+        ttl: float = 300.0,
+        stale_ttl: float = 300.0,
+    ):
+        self.operations = operations
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._refreshing = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def agents(self) -> List[AgentConfiguration]:
+        return list(self._current().agents)
+
+    def get(self, agent_id: str) -> Optional[AgentConfiguration]:
+        return self._current().by_id.get(agent_id)
+
+    def find_by_name(self, name: str) -> List[AgentConfiguration]:
+        return list(self._current().by_name.get(name, []))
+
+    def find_by_action_type(self, action_type: str) -> List[AgentConfiguration]:
+        return list(self._current().by_action_type.get(action_type, []))
+
+    def find_by_folder_id(self, folder_id: str) -> List[AgentConfiguration]:
+        return list(self._current().by_folder_id.get(folder_id, []))
+
+    def find_by_intent(self, intent_name: str) -> List[AgentConfiguration]:
+        return list(self._current().by_intent.get(intent_name, []))
+
+    def is_fresh(self) -> bool:
+        snapshot = self._snapshot
+        return snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl
+
+    def refresh(self) -> None:
+        """Reloads the agent configurations synchronously."""
+        with self._load_lock:
+            self._load()
+
+    def invalidate(self) -> None:
+        """Forces the next lookup to reload the agent configurations."""
+        with self._lock:
+            self._snapshot = None
+
+    def _current(self) -> _Snapshot:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                age = time.monotonic() - snapshot.loaded_at
+                if age < self.ttl:
+                    return snapshot
+                if age < self.ttl + self.stale_ttl:
+                    if not self._refreshing:
+                        self._refreshing = True
+                        self._refresh_executor().submit(self._refresh_in_background)
+                    return snapshot
+
+        with self._load_lock:
+            # Another caller may have reloaded while this one was waiting.
+            snapshot = self._snapshot
+            if snapshot is None or time.monotonic() - snapshot.loaded_at >= self.ttl:
+                snapshot = self._load()
+            return snapshot
+
+    def _load(self) -> _Snapshot:
+        configurations = self.operations.get_all_agents().configurations or []
+        snapshot = _Snapshot(configurations, time.monotonic())
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    def _refresh_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="weavaidev-agent-registry"
+            )
+        return self._executor
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:
+            logger.warning(f"Background refresh of agent registry failed: {exc}")
+        finally:
+            with self._lock:
+                self._refreshing = False
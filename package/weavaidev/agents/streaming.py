@@ -0,0 +1,70 @@
+from typing import AsyncIterator, Callable, Iterator, List, Optional
+
+from weavaidev.agents.models import GetAgentResponse
+from weavaidev.sse import EventStream, StreamMetrics
+from weavaidev.utils import aiter_in_thread
+
+
+class AgentResponseStream:
+    """An agent response read from the open connection one event at a time.
+
+    The body is decoded with `SSEDecoder`, and every dispatched event becomes a
+    `GetAgentResponse` yielded as soon as its terminating blank line arrives, so nothing
+    is buffered beyond the current event. Iteration can be stopped at any point;
+    `close`, leaving a `with` block or breaking out of an `async for` closes the
+    connection. `metrics.time_to_first_event` is the time from sending the request to
+    the first event.
+
+    When `on_complete` is given, the events are also kept and passed to it once the
+    stream is exhausted; a stream closed early does not call it.
+    """
+
+    def __init__(
+        self,
+        events: EventStream,
+        on_complete: Optional[Callable[[List[GetAgentResponse]], None]] = None,
+    ):
+        self.events = events
+        self.on_complete = on_complete
+        self._iterator: Optional[Iterator[GetAgentResponse]] = None
+
+    def __enter__(self) -> "AgentResponseStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[GetAgentResponse]:
+        if self._iterator is None:
+            self._iterator = self._iter_events()
+        return self._iterator
+
+    def __aiter__(self) -> AsyncIterator[GetAgentResponse]:
+        return aiter_in_thread(iter(self), self.close)
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        return self.events.metrics
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        return self.events.decoder.last_event_id
+
+    def close(self) -> None:
+        self.events.close()
+
+    def _iter_events(self) -> Iterator[GetAgentResponse]:
+        responses: List[GetAgentResponse] = []
+        for event in self.events:
+            # Decoded fields are already strings and ints, so validation can be skipped.
+            response = GetAgentResponse.model_construct(
+                id=event.id if event.id is not None else "",
+                event=event.event,
+                data=event.data,
+                retry=event.retry,
+            )
+            if self.on_complete is not None:
+                responses.append(response)
+            yield response
+        if self.on_complete is not None:
+            self.on_complete(responses)
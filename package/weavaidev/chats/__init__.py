@@ -1,26 +1,54 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
 import requests
 from weavaidev import Config
+from weavaidev.chats.batch import (
+    BatchQuestion,
+    ChatBatchCheckpoint,
+    batch_question,
+    chat_results_dataframe,
+)
 from weavaidev.chats.exceptions import ChatServiceException
+from weavaidev.chats.export import ChatLogExporter, ExportFormat
+from weavaidev.chats.history import ChatHistoryCache, Validators
 from weavaidev.chats.models import (
+    ChatBatchQuestion,
+    ChatBatchResult,
     ChatHistoryResponse,
+    ChatLogExportResult,
     ChatLogsResponse,
     ChatRequest,
     ChatResponse,
     GetChatLogsRequest,
 )
+from weavaidev.chats.streaming import ChatStream
 from weavaidev.config_models import (
     AUTHENTICATION_FAILED_MESSAGE,
     ServiceEndpoints,
     ServiceType,
     get_base_url,
 )
+from weavaidev.sse import EventStream
+from weavaidev.utils import RateLimiter, iter_as_completed
 
 
 class ChatOperations:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        history_cache: Optional[ChatHistoryCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.CHATS)
+        self.history_cache = history_cache
 
     def get_chat_logs(
         self,
@@ -67,7 +95,7 @@ class ChatOperations:
         ]
         filtered_params = [(k, v) for k, v in params if v is not None and v != ""]
 
-        response = requests.get(
+        response = self.session.get(
             url=url,
             params=filtered_params,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -86,10 +114,59 @@ class ChatOperations:
             )
         return ChatLogsResponse(**response.json())
 
+    def export_chat_logs(
+        self,
+        output_dir: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        window: timedelta = timedelta(days=1),
+        file_format: ExportFormat = "JSONL",
+        page_size: int = 100,
+        max_workers: int = 4,
+        is_sop_chat: bool = False,
+    ) -> ChatLogExportResult:
+        """Exports the chat logs of a date range to per-window files, fetching windows concurrently.
+
+        The range is split into windows of `window` length; each window is paged with `get_chat_logs` and
+        its messages are written to its own JSON Lines or Parquet file in `output_dir`. Progress is
+        checkpointed in `output_dir/manifest.json`, so running the export again resumes it.
+
+        Args:
+            - output_dir (str): The directory receiving the part files and the manifest.
+            - start_datetime (datetime): The start of the range.
+            - end_datetime (datetime): The end of the range.
+            - window (timedelta): The length of each window. Defaults to one day.
+            - file_format (str): "JSONL", or "PARQUET", which requires `pip install weavaidev[parquet]`. Defaults to "JSONL".
+            - page_size (int): The number of messages requested per page. Defaults to 100.
+            - max_workers (int): The maximum number of windows exported concurrently. Defaults to 4.
+            - is_sop_chat (bool): A flag to filter SOP chats. Defaults to False.
+
+        Raises:
+            ChatServiceException: Raised if fetching the chat logs of a window fails.
+            ValueError: Raised if the window is not positive, the format is unknown, or `output_dir` holds an
+                export in another format or with another window length.
+
+        Returns:
+            ChatLogExportResult: The number of windows exported and skipped, the rows written and the part files.
+        """
+        return ChatLogExporter(
+            self,
+            output_dir=output_dir,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            window=window,
+            file_format=file_format,
+            page_size=page_size,
+            max_workers=max_workers,
+            is_sop_chat=is_sop_chat,
+        ).run()
+
     def get_chat_history(self, chat_id: str) -> ChatHistoryResponse:
         """Fetches the chat history for a specific chat session.
 
-        This method retrieves the entire chat history for the given `chat_id`.
+        This method retrieves the entire chat history for the given `chat_id`. When the operations were
+        created with a `ChatHistoryCache`, the cached history, including the turns appended by `chat` and
+        `stream_chat`, is returned while fresh and otherwise revalidated with a conditional request.
 
         Args:
             chat_id (str): The unique identifier of the chat session for which the history
@@ -102,15 +179,28 @@ class ChatOperations:
         Returns:
             ChatHistoryResponse: A response object containing the list of messages for the chat session.
         """
+        if self.history_cache is None:
+            return self._fetch_chat_history(chat_id)[0]
+        return self.history_cache.get(
+            chat_id, lambda validators: self._fetch_chat_history(chat_id, validators)
+        )
+
+    def _fetch_chat_history(
+        self, chat_id: str, validators: Validators = (None, None)
+    ) -> Optional[Tuple[ChatHistoryResponse, Validators]]:
         url = f"{self.base_url}/{self.endpoints.CHAT_HISTORY}"
         params = [("chat_id", chat_id)]
+        headers = {"Authorization": f"Bearer {self.config.auth_token._secret_value}"}
+        etag, last_modified = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
 
-        response = requests.get(
-            url=url,
-            params=params,
-            headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
-        )
-        if response.status_code == 401:
+        response = self.session.get(url=url, params=params, headers=headers)
+        if response.status_code == 304:
+            return None
+        elif response.status_code == 401:
             raise ChatServiceException(
                 status_code=response.status_code,
                 message=AUTHENTICATION_FAILED_MESSAGE,
@@ -128,7 +218,10 @@ class ChatOperations:
                 message="Failed to retrieve chat logs",
                 response_data=response.json(),
             )
-        return ChatHistoryResponse(**response.json())
+        return ChatHistoryResponse(**response.json()), (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
 
     def chat(
         self, user_input: str, chat_id: str, file_id: str, stream: bool = False
@@ -142,7 +235,8 @@ class ChatOperations:
             - user_input (str): The user's input text for the chat.
             - file_id (str): The identifier of the file associated with the chat.
             - chat_id (str): The unique identifier of the chat session.
-            - stream (bool, optional): A flag indicating whether the response should be streamed. Defaults to False.
+            - stream (bool, optional): A flag indicating whether the response should be streamed. The streamed reply
+                is consumed and assembled before returning; use `stream_chat` to process it incrementally. Defaults to False.
 
         Raises:
             ChatServiceException: Raised if authentication fails (status code 401).
@@ -151,11 +245,17 @@ class ChatOperations:
         Returns:
             ChatResponse: A response object containing the details of the chat message, search results, and tags.
         """
+        if stream:
+            with self.stream_chat(
+                user_input=user_input, chat_id=chat_id, file_id=file_id
+            ) as chat_stream:
+                return chat_stream.get_final_response()
+
         chat_request = ChatRequest(
             user_input=user_input, chat_id=chat_id, stream=stream, file_id=file_id
         )
         url = f"{self.base_url}/{self.endpoints.CHAT}"
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=chat_request.model_dump(),
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -178,4 +278,180 @@ class ChatOperations:
                 message="Failed to send chat",
                 response_data=response.json(),
             )
-        return ChatResponse(**response.json())
+        chat_response = ChatResponse(**response.json())
+        if self.history_cache is not None:
+            self.history_cache.append_chat_turn(user_input, chat_response)
+        return chat_response
+
+    def chat_many(
+        self,
+        questions: Iterable[BatchQuestion],
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+    ) -> Iterator[ChatBatchResult]:
+        """Asks many questions concurrently, yielding each result as soon as it is answered.
+
+        Questions are sent with `chat` by up to `max_workers` threads, optionally throttled to
+        `requests_per_second`. Every question names the existing chat session it is asked in. With a
+        `checkpoint_path`, every result is appended to a `ChatBatchCheckpoint` and questions already
+        answered there are skipped, so an interrupted batch can be rerun.
+
+        Args:
+            - questions (Iterable[BatchQuestion]): The questions, or `(user_input, file_id, chat_id)` tuples.
+            - max_workers (int): The maximum number of concurrent requests. Defaults to 8.
+            - requests_per_second (Optional[float]): The maximum request rate, or None for no limit. Defaults to None.
+            - checkpoint_path (Optional[str]): The path of a JSON Lines checkpoint of results. Defaults to None.
+
+        Returns:
+            Iterator[ChatBatchResult]: One result per question, in completion order, with its latency and either the
+                `ChatResponse` or the error message of a failed request.
+        """
+        checkpoint = ChatBatchCheckpoint(checkpoint_path) if checkpoint_path else None
+        limiter = RateLimiter(requests_per_second) if requests_per_second else None
+
+        def pending_questions() -> Iterator[ChatBatchQuestion]:
+            for question in questions:
+                question = batch_question(question)
+                if checkpoint is None or not checkpoint.is_answered(
+                    question.question_id
+                ):
+                    yield question
+
+        def ask(question: ChatBatchQuestion) -> ChatBatchResult:
+            if limiter is not None:
+                limiter.acquire()
+            result = ChatBatchResult(
+                question_id=question.question_id,
+                user_input=question.user_input,
+                file_id=question.file_id,
+                chat_id=question.chat_id,
+                latency_seconds=0.0,
+            )
+            started_at = time.perf_counter()
+            try:
+                result.response = self.chat(
+                    user_input=question.user_input,
+                    chat_id=question.chat_id,
+                    file_id=question.file_id,
+                )
+            except Exception as exc:
+                # Recorded for this question only, including responses that fail validation.
+                result.error = str(exc)
+            result.latency_seconds = time.perf_counter() - started_at
+            if checkpoint is not None:
+                checkpoint.record(result)
+            return result
+
+        for _, future in iter_as_completed(
+            ask, pending_questions(), max_workers=max_workers
+        ):
+            yield future.result()
+
+    def chat_many_dataframe(
+        self,
+        questions: Iterable[BatchQuestion],
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Runs `chat_many` to completion and returns the answers as a DataFrame.
+
+        With a `checkpoint_path`, the results of these questions from previous runs are included, so the
+        frame covers the whole batch, in question order. See `chat_results_dataframe` for the columns.
+        """
+        questions = [batch_question(question) for question in questions]
+        results = {
+            result.question_id: result
+            for result in self.chat_many(
+                questions,
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+                checkpoint_path=checkpoint_path,
+            )
+        }
+        if checkpoint_path:
+            results = {
+                result.question_id: result
+                for result in ChatBatchCheckpoint(checkpoint_path).results()
+            }
+        question_ids = dict.fromkeys(question.question_id for question in questions)
+        return chat_results_dataframe(
+            results[key] for key in question_ids if key in results
+        )
+
+    def stream_chat(self, user_input: str, chat_id: str, file_id: str) -> ChatStream:
+        """Sends a chat message and returns the reply as a stream of events.
+
+        The request is sent with `stream=True` over a persistent connection and the
+        method returns as soon as the response headers arrive. Iterating the returned
+        `ChatStream` yields each `ChatStreamEvent` as it is received; afterwards,
+        `ChatStream.response` holds the assembled `ChatResponse`, including its
+        `search_results`, and `ChatStream.metrics` the time to first and last byte.
+
+        Args:
+            - user_input (str): The user's input text for the chat.
+            - chat_id (str): The unique identifier of the chat session.
+            - file_id (str): The identifier of the file associated with the chat.
+
+        Raises:
+            ChatServiceException: Raised if authentication fails (status code 401).
+            ChatServiceException: Raised if the chat could not be found (status code 404).
+            ChatServiceException: Raised if any other error occurs while sending the chat message.
+
+        Returns:
+            ChatStream: The streamed reply. Close it, or use it as a context manager, when not reading it to the end.
+        """
+        chat_request = ChatRequest(
+            user_input=user_input, chat_id=chat_id, stream=True, file_id=file_id
+        )
+        url = f"{self.base_url}/{self.endpoints.CHAT}"
+        started_at = time.perf_counter()
+        response = self.session.post(
+            url=url,
+            json=chat_request.model_dump(),
+            headers={
+                "Authorization": f"Bearer {self.config.auth_token._secret_value}",
+                "Accept": "text/event-stream",
+            },
+            stream=True,
+        )
+        if response.status_code == 401:
+            raise ChatServiceException(
+                status_code=response.status_code,
+                message=AUTHENTICATION_FAILED_MESSAGE,
+                response_data=response.json(),
+            )
+        elif response.status_code == 404:
+            raise ChatServiceException(
+                status_code=response.status_code,
+                message="Could not find chat",
+                response_data=response.json(),
+            )
+        elif response.status_code != 200:
+            raise ChatServiceException(
+                status_code=response.status_code,
+                message="Failed to send chat",
+                response_data=response.json(),
+            )
+        return ChatStream(
+            EventStream(response, started_at),
+            chat_request,
+            on_complete=(
+                partial(self.history_cache.append_chat_turn, user_input)
+                if self.history_cache is not None
+                else None
+            ),
+        )
+
+    async def astream_chat(
+        self, user_input: str, chat_id: str, file_id: str
+    ) -> ChatStream:
+        """Async variant of `stream_chat`.
+
+        The request is sent from a worker thread; iterate the returned stream with
+        `async for` and call `aget_final_response` to obtain the assembled reply.
+        """
+        return await asyncio.to_thread(
+            self.stream_chat, user_input=user_input, chat_id=chat_id, file_id=file_id
+        )
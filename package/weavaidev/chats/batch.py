@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Iterable, List, Tuple, Union
+
+import pandas as pd
+from weavaidev.chats.models import ChatBatchQuestion, ChatBatchResult
+
+BatchQuestion = Union[ChatBatchQuestion, Tuple[str, str, str]]
+
+
+def batch_question(question: BatchQuestion) -> ChatBatchQuestion:
+    """Returns the question, given as a model or a `(user_input, file_id, chat_id)` tuple, with its ID."""
+    if not isinstance(question, ChatBatchQuestion):
+        user_input, file_id, chat_id = question
+        question = ChatBatchQuestion(
+            user_input=user_input, file_id=file_id, chat_id=chat_id
+        )
+    return question.model_copy(update={"question_id": question_id(question)})
+
+
+def question_id(question: ChatBatchQuestion) -> str:
+    """Returns the question's `question_id`, or a stable hash of its input and file."""
+    if question.question_id:
+        return question.question_id
+    digest = hashlib.sha1(f"{question.file_id}\0{question.user_input}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ChatBatchCheckpoint:
+    """A JSON Lines file of batch chat results, one per answered or failed question.
+
+    Questions with a successful result are skipped when a batch is rerun with the same
+    checkpoint; failed questions are asked again and their new result is appended.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._results: Dict[str, ChatBatchResult] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as checkpoint:
+                for line in checkpoint:
+                    line = line.strip()
+                    if line:
+                        result = ChatBatchResult.model_validate_json(line)
+                        self._results[result.question_id] = result
+
+    def is_answered(self, question_id: str) -> bool:
+        with self._lock:
+            result = self._results.get(question_id)
+        return result is not None and result.error is None
+
+    def results(self) -> List[ChatBatchResult]:
+        with self._lock:
+            return list(self._results.values())
+
+    def record(self, result: ChatBatchResult) -> None:
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as checkpoint:
+                checkpoint.write(result.model_dump_json() + "\n")
+                checkpoint.flush()
+            self._results[result.question_id] = result
+
+
+def chat_results_dataframe(results: Iterable[ChatBatchResult]) -> pd.DataFrame:
+    """Builds one row per question with its answer, latency and ranked search results.
+
+    `search_results` holds the `SearchResult`s of the answer as dictionaries ordered by
+    `rank`; the best-ranked result is also spread over the `top_*` columns.
+    """
+    columns: Dict[str, list] = {
+        name: []
+        for name in (
+            "question_id",
+            "user_input",
+            "file_id",
+            "chat_id",
+            "message_id",
+            "answer",
+            "latency_seconds",
+            "error",
+            "top_file_name",
+            "top_page_number",
+            "top_score",
+            "search_results",
+        )
+    }
+    for result in results:
+        response = result.response
+        rankings = (
+            sorted(response.search_results, key=lambda item: item.rank)
+            if response is not None
+            else []
+        )
+        top = rankings[0] if rankings else None
+        columns["question_id"].append(result.question_id)
+        columns["user_input"].append(result.user_input)
+        columns["file_id"].append(result.file_id)
+        columns["chat_id"].append(result.chat_id)
+        columns["message_id"].append(response.message_id if response else None)
+        columns["answer"].append(response.text if response else None)
+        columns["latency_seconds"].append(result.latency_seconds)
+        columns["error"].append(result.error)
+        columns["top_file_name"].append(top.file_name if top else None)
+        columns["top_page_number"].append(top.page_number if top else None)
+        columns["top_score"].append(top.score if top else None)
+        columns["search_results"].append(
+            [
+                item.model_dump(
+                    include={"rank", "score", "file_id", "file_name", "page_number"}
+                )
+                for item in rankings
+            ]
+        )
+    frame = pd.DataFrame(columns)
+    frame["top_page_number"] = frame["top_page_number"].astype("Int64")
+    frame["top_score"] = frame["top_score"].astype("Float64")
+    return frame
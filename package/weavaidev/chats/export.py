@@ -0,0 +1,235 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterator, List, Literal, Optional, Tuple
+
+import pandas as pd
+from weavaidev.chats.models import ChatLogExportResult, Message
+from weavaidev.utils import iter_as_completed, write_dataframe_chunks
+
+if TYPE_CHECKING:
+    from weavaidev.chats import ChatOperations
+
+ExportFormat = Literal["JSONL", "PARQUET"]
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+Window = Tuple[datetime, datetime]
+
+
+class ChatLogExporter:
+    """Exports the chat logs of a date range to one JSON Lines or Parquet file per window.
+
+    The range is split into windows of `window` length that are exported concurrently,
+    each paging through `get_chat_logs` with `skip`/`limit` up to its `total_records`
+    and streaming the messages straight into its part file, so only one page per worker
+    is held in memory. A message stamped exactly at a window boundary is kept only in the
+    later window.
+
+    Finished windows are recorded in `manifest.json` in the output directory, and part
+    files are written under a temporary name and renamed when complete, so an
+    interrupted export can be resumed by running it again with the same arguments. The
+    manifest also records the format and window length, and resuming with different
+    ones is refused, since the recorded windows would not line up.
+    """
+
+    def __init__(
+        self,
+        operations: "ChatOperations",
+        output_dir: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        window: timedelta = timedelta(days=1),
+        file_format: ExportFormat = "JSONL",
+        page_size: int = 100,
+        max_workers: int = 4,
+        is_sop_chat: bool = False,
+    ):
+        if window <= timedelta(0):
+            raise ValueError("window must be positive")
+        if file_format not in ("JSONL", "PARQUET"):
+            raise ValueError(f"Unsupported export format: {file_format}")
+        self.operations = operations
+        self.output_dir = output_dir
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+        self.window = window
+        self.file_format = file_format
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.is_sop_chat = is_sop_chat
+        self.manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+
+    def windows(self) -> List[Window]:
+        windows = []
+        start = self.start_datetime
+        while start < self.end_datetime:
+            end = min(start + self.window, self.end_datetime)
+            windows.append((start, end))
+            start = end
+        return windows
+
+    def run(self) -> ChatLogExportResult:
+        """Exports every window that is not yet in the manifest.
+
+        Raises:
+            ChatServiceException: Raised if fetching the chat logs of a window fails. Windows that finished
+                before the failure stay recorded in the manifest.
+            ValueError: Raised if the output directory holds an export in another format or with another
+                window length.
+
+        Returns:
+            ChatLogExportResult: The number of windows exported and skipped, the rows written and the part files.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        result = ChatLogExportResult()
+        pending = []
+        for window in self.windows():
+            result.windows += 1
+            entry = manifest["windows"].get(_window_key(window))
+            if entry is None:
+                pending.append(window)
+                continue
+            result.skipped_windows += 1
+            result.rows += entry["rows"]
+            if entry["path"]:
+                result.files.append(entry["path"])
+
+        for window, future in iter_as_completed(
+            self._export_window, pending, max_workers=self.max_workers
+        ):
+            path, rows = future.result()
+            manifest["windows"][_window_key(window)] = {"path": path, "rows": rows}
+            self._save_manifest(manifest)
+            result.exported_windows += 1
+            result.rows += rows
+            if path:
+                result.files.append(path)
+        result.files.sort()
+        return result
+
+    def _export_window(self, window: Window) -> Tuple[Optional[str], int]:
+        extension = "jsonl" if self.file_format == "JSONL" else "parquet"
+        file_name = f"chat_logs_{window[0]:%Y%m%dT%H%M%S}_{window[1]:%Y%m%dT%H%M%S}"
+        path = os.path.join(self.output_dir, f"{file_name}.{extension}")
+        temporary_path = f"{path}.part"
+
+        if self.file_format == "JSONL":
+            rows = 0
+            with open(temporary_path, "w", encoding="utf-8") as output:
+                for messages in self._iter_pages(window):
+                    for message in messages:
+                        output.write(message.model_dump_json())
+                        output.write("\n")
+                    rows += len(messages)
+        else:
+            rows = write_dataframe_chunks(
+                (
+                    _messages_frame(messages)
+                    for messages in self._iter_pages(window)
+                    if messages
+                ),
+                temporary_path,
+                file_format="PARQUET",
+                schema=_message_schema(),
+            )
+
+        if not rows:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return None, 0
+        os.replace(temporary_path, path)
+        return path, rows
+
+    def _iter_pages(self, window: Window) -> Iterator[List[Message]]:
+        upper_bound = _as_utc(window[1])
+        skip = 0
+        while True:
+            page = self.operations.get_chat_logs(
+                skip=skip,
+                limit=self.page_size,
+                start_datetime=window[0].isoformat(),
+                end_datetime=window[1].isoformat(),
+                is_sop_chat=self.is_sop_chat,
+            )
+            messages = page.messages or []
+            if window[1] < self.end_datetime:
+                messages = [
+                    message
+                    for message in messages
+                    if _as_utc(message.timestamp) != upper_bound
+                ]
+            yield messages
+            skip += self.page_size
+            if not page.messages or skip >= page.total_records:
+                return
+
+    def _load_manifest(self) -> dict:
+        window_seconds = self.window.total_seconds()
+        if not os.path.exists(self.manifest_path):
+            return {
+                "file_format": self.file_format,
+                "window_seconds": window_seconds,
+                "windows": {},
+            }
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["file_format"] != self.file_format:
+            raise ValueError(
+                f"{self.output_dir} holds a {manifest['file_format']} export, not {self.file_format}"
+            )
+        # Manifests written before the window length was recorded adopt this one.
+        recorded_seconds = manifest.setdefault("window_seconds", window_seconds)
+        if recorded_seconds != window_seconds:
+            raise ValueError(
+                f"{self.output_dir} holds an export with {timedelta(seconds=recorded_seconds)} windows, "
+                f"not {self.window}"
+            )
+        return manifest
+
+    def _save_manifest(self, manifest: dict) -> None:
+        temporary_path = f"{self.manifest_path}.part"
+        with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temporary_path, self.manifest_path)
+
+
+def _window_key(window: Window) -> str:
+    return f"{window[0].isoformat()}/{window[1].isoformat()}"
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _messages_frame(messages: List[Message]) -> pd.DataFrame:
+    frame = pd.DataFrame([message.model_dump() for message in messages])
+    frame["timestamp"] = pd.to_datetime(
+        [_as_utc(message.timestamp) for message in messages], utc=True
+    )
+    return frame
+
+
+def _message_schema():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        # write_dataframe_chunks raises the ImportError with installation instructions.
+        return None
+
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("type", pa.string()),
+            ("valid", pa.bool_()),
+            ("vote", pa.string()),
+            ("chat_id", pa.string()),
+            ("user_id", pa.string()),
+            ("tags", pa.list_(pa.string())),
+            ("text", pa.string()),
+        ]
+    )
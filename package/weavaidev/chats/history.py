@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from weavaidev.chats.models import ChatHistoryMessage, ChatHistoryResponse, ChatResponse
+
+if TYPE_CHECKING:
+    from weavaidev.agents.models import GetAgentResponse
+
+USER_MESSAGE_TYPE = "user"
+
+# A user turn appended locally has no server ID; it takes the ID of the reply it
+# prompted with this suffix and is dropped once the server returns that reply.
+_USER_TURN_SUFFIX = ":user_input"
+
+Validators = Tuple[Optional[str], Optional[str]]
+HistoryFetcher = Callable[
+    [Validators], Optional[Tuple[ChatHistoryResponse, Validators]]
+]
+
+
+class _History:
+    __slots__ = ("server_messages", "local_messages", "validators", "validated_at")
+
+    def __init__(self):
+        self.server_messages: List[ChatHistoryMessage] = []
+        self.local_messages: List[ChatHistoryMessage] = []
+        self.validators: Validators = (None, None)
+        self.validated_at = float("-inf")
+
+
+class ChatHistoryCache:
+    """A client-side cache of chat histories, keyed by `chat_id`.
+
+    The user's input and the reply of `chat`, `stream_chat`, `get_agent_response` and
+    exhausted agent streams are appended locally, so a history read within `ttl` seconds
+    of its last validation is answered without a request. Older histories are
+    revalidated with a conditional request (`If-None-Match` / `If-Modified-Since` from
+    the previous response's `ETag` / `Last-Modified`); a `304 Not Modified` keeps the
+    cached transcript, otherwise the server's messages replace the cached ones. The
+    history endpoint cannot return only the messages added since a point, so any change
+    to a chat makes its revalidation download the full transcript again. Locally appended messages are merged by `message_id` and
+    kept after the server's messages until the server returns them. A user turn is
+    appended with `type` `"user"` and the `message_id` of its reply followed by
+    `:user_input`, and is dropped once the server returns that reply.
+
+    At most `max_chats` histories are kept, least recently used first out. Returned
+    responses are copies of the message lists and can be modified freely, but the
+    messages themselves are shared.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_chats: int = 1024):
+        self.ttl = ttl
+        self.max_chats = max_chats
+        self._histories: "OrderedDict[str, _History]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chat_id: str, fetch: HistoryFetcher) -> ChatHistoryResponse:
+        """Returns the merged history of a chat, revalidating it with `fetch` when stale.
+
+        `fetch` is called with the stored `(etag, last_modified)` validators and returns
+        `None` when the history is not modified, or the new history and its validators.
+        """
+        with self._lock:
+            history = self._histories.get(chat_id)
+            if history is not None:
+                self._histories.move_to_end(chat_id)
+                if time.monotonic() - history.validated_at < self.ttl:
+                    return self._merged(history)
+            validators = history.validators if history is not None else (None, None)
+
+        fetched = fetch(validators)
+        if fetched is None:
+            with self._lock:
+                history = self._histories.get(chat_id)
+                stale = history is None or history.validators != validators
+            if stale:
+                # Evicted, invalidated or revalidated meanwhile: the 304 does not refer
+                # to what is cached now, so fetch the whole history.
+                fetched = fetch((None, None))
+
+        with self._lock:
+            history = self._entry(chat_id)
+            if fetched is not None:
+                response, history.validators = fetched
+                history.server_messages = list(response.messages)
+                known = {message.message_id for message in history.server_messages}
+                history.local_messages = [
+                    message
+                    for message in history.local_messages
+                    if message.message_id.removesuffix(_USER_TURN_SUFFIX) not in known
+                ]
+            history.validated_at = time.monotonic()
+            return self._merged(history)
+
+    def append(self, chat_id: str, message: ChatHistoryMessage) -> None:
+        """Appends a message to the cached history, replacing one with the same `message_id`."""
+        with self._lock:
+            history = self._entry(chat_id)
+            for messages in (history.server_messages, history.local_messages):
+                for index, cached in enumerate(messages):
+                    if cached.message_id == message.message_id:
+                        messages[index] = message
+                        return
+            history.local_messages.append(message)
+
+    def append_chat_turn(self, user_input: str, response: ChatResponse) -> None:
+        """Appends the user's input and the reply to it."""
+        self.append_user_input(response.chat_id, user_input, response.message_id)
+        self.append_chat_response(response)
+
+    def append_user_input(
+        self, chat_id: str, user_input: str, reply_message_id: str
+    ) -> None:
+        self.append(
+            chat_id,
+            ChatHistoryMessage(
+                message_id=f"{reply_message_id}{_USER_TURN_SUFFIX}",
+                chat_id=chat_id,
+                text=user_input,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                type=USER_MESSAGE_TYPE,
+                vote="",
+                search_results=[],
+                generate_button=None,
+                tags=[],
+            ),
+        )
+
+    def append_chat_response(self, response: ChatResponse) -> None:
+        self.append(
+            response.chat_id,
+            ChatHistoryMessage(
+                message_id=response.message_id,
+                chat_id=response.chat_id,
+                text=response.text,
+                timestamp=response.timestamp.isoformat(),
+                type=response.type,
+                vote=response.vote,
+                search_results=[
+                    result.model_dump() for result in response.search_results
+                ],
+                generate_button=(
+                    response.generate_button.lower() == "true"
+                    if response.generate_button
+                    else None
+                ),
+                tags=list(response.tags),
+            ),
+        )
+
+    def append_agent_responses(
+        self,
+        chat_id: str,
+        events: Iterable["GetAgentResponse"],
+        user_input: Optional[str] = None,
+    ) -> int:
+        """Appends the events whose data is a chat message and returns how many were appended.
+
+        When `user_input` is given and a message was appended, the user's input is
+        appended before it.
+        """
+        messages = []
+        for event in events:
+            try:
+                payload = json.loads(event.data or "")
+            except ValueError:
+                continue
+            if not isinstance(payload, dict) or not payload.get("message_id"):
+                continue
+            payload.setdefault("chat_id", chat_id)
+            try:
+                message = ChatHistoryMessage.model_validate(payload)
+            except ValidationError:
+                continue
+            messages.append(message)
+        if user_input is not None and messages:
+            self.append_user_input(chat_id, user_input, messages[0].message_id)
+        for message in messages:
+            self.append(chat_id, message)
+        return len(messages)
+
+    def invalidate(self, chat_id: str) -> None:
+        with self._lock:
+            self._histories.pop(chat_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histories.clear()
+
+    def _entry(self, chat_id: str) -> _History:
+        history = self._histories.get(chat_id)
+        if history is None:
+            history = self._histories[chat_id] = _History()
+            while len(self._histories) > self.max_chats:
+                self._histories.popitem(last=False)
+        self._histories.move_to_end(chat_id)
+        return history
+
+    @staticmethod
+    def _merged(history: _History) -> ChatHistoryResponse:
+        return ChatHistoryResponse.model_construct(
+            messages=history.server_messages + history.local_messages
+        )
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Optional, Any
 from datetime import datetime
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
 
 
 class GetChatLogsRequest(BaseModel):
@@ -80,3 +81,37 @@ class ChatResponse(BaseModel):
     search_results: List[SearchResult]
     generate_button: Optional[str] = ""
     tags: List[str]
+
+
+class ChatStreamEvent(BaseModel):
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    token: str = ""
+    search_results: List[SearchResult] = []
+    response: Optional[ChatResponse] = None
+
+
+class ChatLogExportResult(BaseModel):
+    windows: int = 0
+    exported_windows: int = 0
+    skipped_windows: int = 0
+    rows: int = 0
+    files: List[str] = []
+
+
+class ChatBatchQuestion(BaseModel):
+    user_input: str
+    file_id: str
+    chat_id: str
+    question_id: Optional[str] = None
+
+
+class ChatBatchResult(BaseModel):
+    question_id: str
+    user_input: str
+    file_id: str
+    chat_id: str
+    latency_seconds: float
+    response: Optional[ChatResponse] = None
+    error: Optional[str] = None
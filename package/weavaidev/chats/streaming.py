@@ -0,0 +1,175 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from pydantic import ValidationError
+from weavaidev.chats.models import (
+    ChatRequest,
+    ChatResponse,
+    ChatStreamEvent,
+    SearchResult,
+)
+from weavaidev.sse import EventStream, ServerSentEvent, StreamMetrics
+from weavaidev.utils import aiter_in_thread
+
+_TOKEN_KEYS = ("token", "delta", "content")
+_DONE = "[DONE]"
+
+
+class ChatStream:
+    """An in-progress streamed chat reply.
+
+    Iterating yields a `ChatStreamEvent` per server-sent event, with `token` holding the
+    text delta it carries. Event data is interpreted as follows: JSON objects that are
+    complete `ChatResponse` payloads become the final response, objects with a `token`,
+    `delta` or `content` key contribute that text, other objects contribute their fields
+    (e.g. `search_results`, `message_id`) to the final response, and anything else is
+    treated as a plain text token. If the server answers with a regular JSON body
+    instead of an event stream, a single event carrying the whole response is yielded.
+
+    Once the stream is exhausted, `response` holds the assembled `ChatResponse`, which is
+    also passed to `on_complete` if given, and `metrics` the time to first byte, first
+    event and last byte.
+    """
+
+    def __init__(
+        self,
+        events: EventStream,
+        chat_request: ChatRequest,
+        on_complete: Optional[Callable[[ChatResponse], None]] = None,
+    ):
+        self.events = events
+        self.chat_request = chat_request
+        self.on_complete = on_complete
+        self.response: Optional[ChatResponse] = None
+        self._tokens: List[str] = []
+        self._fields: Dict[str, Any] = {}
+        self._search_results: List[SearchResult] = []
+        self._iterator: Optional[Iterator[ChatStreamEvent]] = None
+
+    def __enter__(self) -> "ChatStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[ChatStreamEvent]:
+        if self._iterator is None:
+            self._iterator = self._iter_events()
+        return self._iterator
+
+    def __aiter__(self) -> AsyncIterator[ChatStreamEvent]:
+        return aiter_in_thread(iter(self), self.close)
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        return self.events.metrics
+
+    @property
+    def text(self) -> str:
+        """The text received so far."""
+        return "".join(self._tokens)
+
+    def get_final_response(self) -> ChatResponse:
+        """Consumes the remaining events and returns the assembled `ChatResponse`."""
+        for _ in self:
+            pass
+        return self.response
+
+    async def aget_final_response(self) -> ChatResponse:
+        async for _ in self:
+            pass
+        return self.response
+
+    def close(self) -> None:
+        self.events.close()
+
+    def _iter_events(self) -> Iterator[ChatStreamEvent]:
+        content_type = self.events.response.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            try:
+                body = b"".join(self.events.iter_bytes())
+            finally:
+                self.close()
+            self.response = ChatResponse.model_validate_json(body)
+            self.events.metrics.time_to_first_event = (
+                self.events.metrics.time_to_last_byte
+            )
+            self.events.metrics.events_received = 1
+            if self.on_complete is not None:
+                self.on_complete(self.response)
+            yield ChatStreamEvent(
+                data=body.decode("utf-8"),
+                token=self.response.text,
+                search_results=self.response.search_results,
+                response=self.response,
+            )
+            return
+
+        for sse in self.events:
+            if sse.data.strip() == _DONE:
+                continue
+            event = self._to_chat_event(sse)
+            if event.token:
+                self._tokens.append(event.token)
+            if event.search_results:
+                self._search_results = event.search_results
+            if event.response is not None:
+                self.response = event.response
+            yield event
+        if self.response is None:
+            self.response = self._assemble()
+        if self.on_complete is not None:
+            self.on_complete(self.response)
+
+    def _to_chat_event(self, sse: ServerSentEvent) -> ChatStreamEvent:
+        event = ChatStreamEvent(event=sse.event, data=sse.data, id=sse.id)
+        try:
+            payload = json.loads(sse.data)
+        except ValueError:
+            payload = sse.data
+        if not isinstance(payload, dict):
+            event.token = payload if isinstance(payload, str) else sse.data
+            return event
+
+        if all(
+            name in payload
+            for name, field in ChatResponse.model_fields.items()
+            if field.is_required()
+        ):
+            try:
+                event.response = ChatResponse.model_validate(payload)
+                event.search_results = event.response.search_results
+                return event
+            except ValidationError:
+                pass
+        for key in _TOKEN_KEYS:
+            if isinstance(payload.get(key), str):
+                event.token = payload[key]
+                break
+        if payload.get("search_results"):
+            event.search_results = [
+                SearchResult.model_validate(result)
+                for result in payload["search_results"]
+            ]
+        self._fields.update(
+            (key, value)
+            for key, value in payload.items()
+            if key in ChatResponse.model_fields
+            and key not in ("text", "search_results")
+        )
+        return event
+
+    def _assemble(self) -> ChatResponse:
+        fields = {
+            "message_id": "",
+            "chat_id": self.chat_request.chat_id,
+            "timestamp": datetime.now(timezone.utc),
+            "type": "",
+            "vote": "",
+            "tags": [],
+            **self._fields,
+        }
+        return ChatResponse.model_validate(
+            {**fields, "text": self.text, "search_results": self._search_results}
+        )
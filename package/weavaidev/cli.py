@@ -0,0 +1,90 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from dotenv import load_dotenv
+from weavaidev import Config
+from weavaidev.folders import FolderOperations
+from weavaidev.folders.models import FileSyncResult
+
+
+def _print_progress(completed: int, total: int, file_result: FileSyncResult) -> None:
+    sys.stderr.write(
+        f"[{completed}/{total}] {file_result.status:<9} {file_result.path}\n"
+    )
+
+
+def _sync_directory(args: argparse.Namespace, config: Config) -> int:
+    result = FolderOperations(config).sync_directory(
+        root=args.root,
+        folder_prefix=args.folder_prefix,
+        manifest_path=args.manifest,
+        max_workers=args.workers,
+        dry_run=args.dry_run,
+        progress=None if args.quiet else _print_progress,
+    )
+    sys.stdout.write(
+        f"Scanned {result.files_scanned} files in {result.elapsed_seconds:.1f}s: "
+        f"{result.uploaded} uploaded, {result.unchanged} unchanged, "
+        f"{result.duplicates} duplicates, {result.planned} to upload, "
+        f"{result.failed} failed\n"
+    )
+    sys.stdout.write(
+        f"Uploaded {result.bytes_uploaded / 2**20:.1f} MiB "
+        f"at {result.bytes_per_second / 2**20:.2f} MiB/s\n"
+    )
+    if result.folders_created:
+        sys.stdout.write(f"Created folders: {', '.join(result.folders_created)}\n")
+    for path, error in result.failures.items():
+        sys.stderr.write(f"Failed {path}: {error}\n")
+    return 1 if result.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="weavaidev",
+        description="weav.ai developer library command line. Reads AUTH_TOKEN and ENV "
+        "from the environment or from an env file.",
+    )
+    parser.add_argument(
+        "--env-file", default=".env", help="The env file to load (default: .env)."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser(
+        "sync-dir",
+        help="Mirror a local directory into folders, uploading new or changed files.",
+    )
+    sync.add_argument("root", help="The local directory to mirror.")
+    sync.add_argument(
+        "--folder-prefix",
+        help="The folder name for the root directory (default: its directory name).",
+    )
+    sync.add_argument(
+        "--manifest",
+        help="The sync manifest path (default: .weavaidev-sync.json in the root).",
+    )
+    sync.add_argument(
+        "--workers", type=int, default=4, help="Concurrent uploads (default: 4)."
+    )
+    sync.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be uploaded without uploading.",
+    )
+    sync.add_argument(
+        "--quiet", action="store_true", help="Do not print per-file progress."
+    )
+    sync.set_defaults(handler=_sync_directory)
+
+    args = parser.parse_args(argv)
+    load_dotenv(args.env_file)
+    auth_token, env = os.getenv("AUTH_TOKEN"), os.getenv("ENV")
+    if not auth_token or not env:
+        parser.error("AUTH_TOKEN and ENV must be set in the environment or env file")
+    return args.handler(args, Config(auth_token=auth_token, env=env))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
+
+import requests
+from weavaidev import Config
+from weavaidev.transport import DEFAULT_POOL_MAXSIZE, TransportMetrics, WeavSession
+
+if TYPE_CHECKING:
+    from weavaidev.actions import ActionOperations
+    from weavaidev.agents import AgentOperations
+    from weavaidev.chats import ChatOperations
+    from weavaidev.chats.history import ChatHistoryCache
+    from weavaidev.documents import DocumentOperations
+    from weavaidev.folders import FolderOperations
+    from weavaidev.forms import FormOperations
+    from weavaidev.forms.cache import AnalyticsCache
+    from weavaidev.workflows import WorkflowOperations
+
+
+class WeavClient:
+    """A single entry point to every service, built from one `Config`.
+
+    The service operations are attributes that are imported and created on first
+    access, so only the services that are used are paid for. They all send their
+    requests through one session: a `WeavSession` with a connection pool of
+    `pool_maxsize` per host, an optional shared rate limit of `requests_per_second`
+    with bursts of `burst`, and the request counters exposed as `metrics`, unless
+    another `session` is given.
+
+    The chat history and analytics caches are opt-in: none is built unless a
+    `history_cache` (for `chats` and `agents`) or an `analytics_cache` (for `forms`) is
+    given, and the given instances are shared by the operations using them. The agent
+    registry of `agents` is cached for `registry_ttl` seconds when given, and the action
+    schemas of `actions` for `schema_ttl` seconds unless it is None.
+
+    `metrics` counts requests and the time until their response headers; the timing of
+    streamed responses, such as the time to the first event, is reported by the
+    `metrics` of each stream instead.
+
+    Example:
+        >>> with WeavClient(Config(auth_token=token, env=env)) as client:
+        ...     folders = client.folders.get_writable_folders()
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        session: Optional[requests.Session] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        history_cache: Optional["ChatHistoryCache"] = None,
+        analytics_cache: Optional["AnalyticsCache"] = None,
+        registry_ttl: Optional[float] = None,
+        schema_ttl: Optional[float] = 300.0,
+    ):
+        self.config = config
+        self.session = (
+            session
+            if session is not None
+            else WeavSession(
+                pool_maxsize=pool_maxsize,
+                requests_per_second=requests_per_second,
+                burst=burst,
+            )
+        )
+        self.history_cache = history_cache
+        self.analytics_cache = analytics_cache
+        self.registry_ttl = registry_ttl
+        self.schema_ttl = schema_ttl
+
+    def __enter__(self) -> "WeavClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled connections of the shared session and the cache refresh threads."""
+        self.session.close()
+        if self.analytics_cache is not None:
+            self.analytics_cache.close()
+
+    @property
+    def metrics(self) -> Optional[TransportMetrics]:
+        """The request counters of the shared session, or None if it is not a `WeavSession`."""
+        if isinstance(self.session, WeavSession):
+            return self.session.metrics
+        return None
+
+    @cached_property
+    def documents(self) -> "DocumentOperations":
+        from weavaidev.documents import DocumentOperations
+
+        return DocumentOperations(self.config, session=self.session)
+
+    @cached_property
+    def forms(self) -> "FormOperations":
+        from weavaidev.forms import FormOperations
+
+        return FormOperations(
+            self.config, analytics_cache=self.analytics_cache, session=self.session
+        )
+
+    @cached_property
+    def workflows(self) -> "WorkflowOperations":
+        from weavaidev.workflows import WorkflowOperations
+
+        return WorkflowOperations(self.config, session=self.session)
+
+    @cached_property
+    def chats(self) -> "ChatOperations":
+        from weavaidev.chats import ChatOperations
+
+        return ChatOperations(
+            self.config, history_cache=self.history_cache, session=self.session
+        )
+
+    @cached_property
+    def agents(self) -> "AgentOperations":
+        from weavaidev.agents import AgentOperations
+
+        return AgentOperations(
+            self.config,
+            registry_ttl=self.registry_ttl,
+            session=self.session,
+            history_cache=self.history_cache,
+        )
+
+    @cached_property
+    def folders(self) -> "FolderOperations":
+        from weavaidev.folders import FolderOperations
+
+        return FolderOperations(self.config, session=self.session)
+
+    @cached_property
+    def actions(self) -> "ActionOperations":
+        from weavaidev.actions import ActionOperations
+
+        return ActionOperations(
+            self.config, schema_ttl=self.schema_ttl, session=self.session
+        )
@@ -1,6 +1,9 @@
+import mimetypes
 import os
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import Any, Dict, Literal, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, Optional, Union
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
@@ -12,23 +15,32 @@ from weavaidev.config_models import (
     ServiceType,
     get_base_url,
 )
+from weavaidev.documents.downloads import DEFAULT_CHUNK_SIZE, stream_download
 from weavaidev.documents.exceptions import DocumentProcessingException
+from weavaidev.documents.lazy import LazyDocument, LazyPageSequence
 from weavaidev.documents.models import (
     CreateDocumentResponse,
     DocumentCategoriesResponse,
     DocumentHierarchyResponse,
     DocumentSummaryResponse,
     DocumentTagResponse,
+    DownloadResult,
     GetPageStatusResponse,
     GetPageTextResponse,
     PageLevelStatusResponse,
 )
+from weavaidev.utils import (
+    DEFAULT_CSV_CHUNK_SIZE,
+    iter_csv_chunks,
+    write_dataframe_chunks,
+)
 
 
 class DocumentOperations:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[requests.Session] = None):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.DOCUMENT)
 
     def create_document(
@@ -51,13 +63,15 @@ class DocumentOperations:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File '{file_path}' not found.")
         url = f"{self.base_url}/{self.endpoints.CREATE_DOCUMENT}"
-        files = {"file_uploaded": open(file_path, "rb")}
         data = {"folder_id": folder_id} if folder_id else {}
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
             "Accept": "application/json",
         }
-        response = requests.post(url, headers=headers, files=files, data=data)
+        with open(file_path, "rb") as file:
+            response = self.session.post(
+                url, headers=headers, files={"file_uploaded": file}, data=data
+            )
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -105,7 +119,7 @@ class DocumentOperations:
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
-        response = requests.get(
+        response = self.session.get(
             url, headers=headers, params=[("bounding_boxes", bounding_boxes)]
         )
 
@@ -158,7 +172,7 @@ class DocumentOperations:
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -205,7 +219,7 @@ class DocumentOperations:
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -252,7 +266,7 @@ class DocumentOperations:
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -303,7 +317,7 @@ class DocumentOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
         params = [("fill_pages", fill_pages)]
-        response = requests.get(url, params=params, headers=headers)
+        response = self.session.get(url, params=params, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -333,6 +347,147 @@ class DocumentOperations:
         final_response["id"] = final_response.pop("_id")
         return CreateDocumentResponse.model_validate(final_response)
 
+    def get_lazy_document(
+        self,
+        document_id: str,
+        prefetch: int = 0,
+        max_workers: int = 4,
+        cache_size: Optional[int] = 64,
+    ) -> LazyDocument:
+        """Fetches a document's metadata and returns a document whose pages load on demand.
+
+        Unlike `get_document(fill_pages=True)`, only the lightweight document metadata is
+        downloaded up front. Each `doc.pages[i]` is fetched with `get_page` the first time
+        it is accessed, and slices or iteration over `doc.pages` stream pages in batches.
+
+        Args:
+            document_id (str): The ID of the document to fetch.
+            prefetch (int): The number of following pages to fetch together with an accessed page. Defaults to 0.
+            max_workers (int): The maximum number of pages fetched concurrently within a batch. Defaults to 4.
+            cache_size (Optional[int]): The maximum number of fetched pages kept in memory, or None for no limit. Defaults to 64.
+
+        Raises:
+            DocumentProcessingException: Raised if authentication fails (status code 401),
+                validation fails (status code 422), or if the document is not found (status code 404).
+                Page fetches raise the same exceptions when the page is accessed.
+
+        Returns:
+            LazyDocument: The document metadata with a lazily loaded `pages` sequence of `GetPageStatusResponse` objects.
+        """
+        metadata = self.get_document(document_id=document_id, fill_pages=False)
+        pages = LazyPageSequence(
+            stubs=metadata.pages,
+            fetch_page=lambda page_number: self.get_page(
+                document_id=document_id, page_number=page_number
+            ),
+            prefetch=prefetch,
+            max_workers=max_workers,
+            cache_size=cache_size,
+        )
+        return LazyDocument(metadata=metadata, pages=pages)
+
+    def download_document(
+        self,
+        document: Union[str, CreateDocumentResponse],
+        destination: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """Streams the original binary of a document to a file or file-like object.
+
+        Args:
+            document (Union[str, CreateDocumentResponse]): The document ID, or a document previously returned by `get_document`/`create_document`.
+            destination (Union[str, os.PathLike, BinaryIO]): The file path to write to, or a writable binary file-like object.
+            chunk_size (int): The number of bytes read and written at a time. Defaults to 1 MiB.
+            resume (bool): A flag to continue a partial download at `destination` with a range request. Defaults to True.
+
+        Raises:
+            DocumentProcessingException: Raised if the document cannot be fetched, the download fails,
+                or the downloaded size does not match the document size.
+
+        Returns:
+            DownloadResult: The number of bytes written and the final size of the downloaded file.
+        """
+        if isinstance(document, str):
+            document = self.get_document(document_id=document, fill_pages=False)
+        url, headers = self._resolve_download_url(document.download_url)
+        return stream_download(
+            url=url,
+            destination=destination,
+            headers=headers,
+            chunk_size=chunk_size,
+            session=self.session,
+            expected_size=document.size,
+            resume=resume,
+        )
+
+    def download_pages(
+        self,
+        document: Union[str, CreateDocumentResponse],
+        destination_dir: str,
+        page_numbers: Optional[List[int]] = None,
+        max_workers: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+    ) -> List[DownloadResult]:
+        """Concurrently streams the binaries of a document's pages into a directory.
+
+        Each page is written to `page_<page_number><extension>` inside `destination_dir`,
+        with the extension derived from the page media type.
+
+        Args:
+            document (Union[str, CreateDocumentResponse]): The document ID, or a document previously returned by `get_document`/`create_document`.
+            destination_dir (str): The directory in which the page files are written. Created if missing.
+            page_numbers (Optional[List[int]]): The page numbers to download. Defaults to all pages.
+            max_workers (int): The maximum number of pages downloaded concurrently. Defaults to 4.
+            chunk_size (int): The number of bytes read and written at a time. Defaults to 1 MiB.
+            resume (bool): A flag to continue partial page downloads with range requests. Defaults to True.
+
+        Raises:
+            DocumentProcessingException: Raised if the document cannot be fetched, any page download fails,
+                or a downloaded size does not match the `Content-Length` reported by the server.
+
+        Returns:
+            List[DownloadResult]: One result per downloaded page, in page order.
+        """
+        if isinstance(document, str):
+            document = self.get_document(document_id=document, fill_pages=False)
+        pages = document.pages
+        if page_numbers is not None:
+            wanted = set(page_numbers)
+            pages = [page for page in pages if page.page_number in wanted]
+        os.makedirs(destination_dir, exist_ok=True)
+
+        def download_page(page) -> DownloadResult:
+            extension = mimetypes.guess_extension(page.media_type) or ""
+            url, headers = self._resolve_download_url(page.download_url)
+            result = stream_download(
+                url=url,
+                destination=os.path.join(
+                    destination_dir, f"page_{page.page_number}{extension}"
+                ),
+                headers=headers,
+                chunk_size=chunk_size,
+                session=self.session,
+                resume=resume,
+            )
+            result.page_number = page.page_number
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            return list(executor.map(download_page, pages))
+
+    def _resolve_download_url(self, download_url: str):
+        # Pre-signed storage URLs are absolute and must not carry our bearer token;
+        # relative URLs are served by the file service itself.
+        if urlparse(download_url).scheme:
+            return download_url, {}
+        url = f"{self.base_url}/{download_url.lstrip('/')}"
+        headers = {
+            "Authorization": f"Bearer {self.config.auth_token._secret_value}",
+        }
+        return url, headers
+
     def get_document_hierarchy(self, document_id: str) -> DocumentHierarchyResponse:
         """Retrieves the hierarchical structure of the document.
 
@@ -352,7 +507,7 @@ class DocumentOperations:
         headers = {
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -404,7 +559,7 @@ class DocumentOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
         params = [("download_format", download_format)]
-        response = requests.get(url, params=params, headers=headers)
+        response = self.session.get(url, params=params, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -436,6 +591,95 @@ class DocumentOperations:
         data = StringIO(response.text)
         return pd.read_csv(data)
 
+    def iter_form_instance_csv(
+        self,
+        document_id: str,
+        chunksize: int = DEFAULT_CSV_CHUNK_SIZE,
+        dtype: Optional[Dict[str, str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams a document's form instance as CSV and parses it in DataFrame chunks.
+
+        Unlike `download_form_instance(download_format="CSV")`, the response body is parsed
+        as it arrives, so peak memory is proportional to `chunksize` rather than to the
+        size of the export.
+
+        Args:
+            document_id (str): The ID of the document for which the form instance is being downloaded.
+            chunksize (int): The maximum number of rows per yielded DataFrame. Defaults to 10000.
+            dtype (Optional[Dict[str, str]]): Column dtypes passed to `pd.read_csv`. Defaults to inferring per chunk.
+
+        Raises:
+            DocumentProcessingException: Raised if authentication fails (status code 401),
+                validation fails (status code 422), or if the document or form instance is not found (status code 404).
+
+        Returns:
+            Iterator[pd.DataFrame]: An iterator over DataFrame chunks of the form instance.
+        """
+        url = f"{self.base_url}/{self.endpoints.DOWNLOAD_FORM_INSTANCE}".format(
+            DOC_ID=document_id
+        )
+        headers = {
+            "Authorization": f"Bearer {self.config.auth_token._secret_value}",
+        }
+        params = [("download_format", "CSV")]
+        response = self.session.get(url, params=params, headers=headers, stream=True)
+
+        if response.status_code == 401:
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message=AUTHENTICATION_FAILED_MESSAGE,
+                response_data=response.json(),
+            )
+        elif response.status_code == 422:
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message=VALIDATION_FAILED_MESSAGE,
+                response_data=response.json(),
+            )
+        elif response.status_code == 404:
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message="Failed to find document",
+                response_data=response.json(),
+            )
+        elif response.status_code != 200:
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message="Failed to download form instance",
+                response_data=response.json(),
+            )
+        return iter_csv_chunks(response, chunksize=chunksize, dtype=dtype)
+
+    def download_form_instance_to_file(
+        self,
+        document_id: str,
+        output_path: str,
+        file_format: Literal["CSV", "PARQUET"] = "CSV",
+        chunksize: int = DEFAULT_CSV_CHUNK_SIZE,
+        dtype: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Streams a document's form instance straight into a CSV or Parquet file.
+
+        Args:
+            document_id (str): The ID of the document for which the form instance is being downloaded.
+            output_path (str): The path of the file to write.
+            file_format (Literal["CSV", "PARQUET"]): The output file format. Parquet requires `pyarrow`. Defaults to "CSV".
+            chunksize (int): The maximum number of rows parsed and written at a time. Defaults to 10000.
+            dtype (Optional[Dict[str, str]]): Column dtypes passed to `pd.read_csv`. Defaults to inferring per chunk.
+
+        Raises:
+            DocumentProcessingException: Raised if authentication fails (status code 401),
+                validation fails (status code 422), or if the document or form instance is not found (status code 404).
+            ImportError: Raised if Parquet output is requested and `pyarrow` is not installed.
+
+        Returns:
+            int: The number of rows written.
+        """
+        chunks = self.iter_form_instance_csv(
+            document_id=document_id, chunksize=chunksize, dtype=dtype
+        )
+        return write_dataframe_chunks(chunks, output_path, file_format=file_format)
+
     def get_document_categories(self) -> DocumentCategoriesResponse:
         """Fetches all available document categories.
 
@@ -451,7 +695,7 @@ class DocumentOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
 
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -494,7 +738,7 @@ class DocumentOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
 
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -540,7 +784,7 @@ class DocumentOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
         }
 
-        response = requests.post(url, headers=headers)
+        response = self.session.post(url, headers=headers)
 
         if response.status_code == 401:
             raise DocumentProcessingException(
@@ -0,0 +1,137 @@
+import os
+from typing import BinaryIO, Dict, Optional, Union
+
+import requests
+from weavaidev.documents.exceptions import DocumentProcessingException
+from weavaidev.documents.models import DownloadResult
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def stream_download(
+    url: str,
+    destination: Union[str, os.PathLike, BinaryIO],
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    expected_size: Optional[int] = None,
+    resume: bool = True,
+    session: Optional[requests.Session] = None,
+) -> DownloadResult:
+    """Streams a binary download to a file path or writable binary file-like object.
+
+    The body is written in `chunk_size` pieces as it arrives, so the file is never held
+    in memory. When `destination` is a path that already holds a partial download and
+    `resume` is True, only the missing bytes are requested with an HTTP range request.
+    If the server rejects the range because the partial file is not a prefix of the
+    file's `Content-Range` size, the partial file is deleted and the download restarts
+    from the beginning. The final size is checked against `Content-Length` and
+    `expected_size`. The request is sent with `session` when given, reusing its
+    connection pool.
+
+    Raises:
+        DocumentProcessingException: Raised if the server responds with an error status,
+            if the connection fails while the body is read, in which case a partial file
+            is kept for resuming, or if the downloaded size does not match the expected
+            size.
+    """
+    request_headers = headers
+    headers = dict(headers or {})
+    is_path = isinstance(destination, (str, os.PathLike))
+    offset = 0
+    if is_path and resume and os.path.exists(destination):
+        offset = os.path.getsize(destination)
+        if expected_size is not None and offset > expected_size:
+            offset = 0
+        elif expected_size is not None and offset == expected_size:
+            return DownloadResult(
+                download_url=url,
+                destination=os.fspath(destination),
+                bytes_written=0,
+                total_bytes=offset,
+                resumed=True,
+            )
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+
+    get = session.get if session is not None else requests.get
+    with get(url, headers=headers, stream=True) as response:
+        if response.status_code == 416 and offset:
+            if _unsatisfied_range_size(response) == offset:
+                return DownloadResult(
+                    download_url=url,
+                    destination=os.fspath(destination),
+                    bytes_written=0,
+                    total_bytes=offset,
+                    resumed=True,
+                )
+            # The partial file is longer than the file, or the file changed: start over.
+            os.remove(destination)
+            return stream_download(
+                url,
+                destination,
+                headers=request_headers,
+                chunk_size=chunk_size,
+                expected_size=expected_size,
+                resume=False,
+                session=session,
+            )
+        if response.status_code not in (200, 206):
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message="Failed to download file",
+                response_data=response.text,
+            )
+        if response.status_code == 200:
+            offset = 0
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and expected_size is None:
+            expected_size = offset + int(content_length)
+
+        if is_path:
+            directory = os.path.dirname(os.fspath(destination))
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            sink = open(destination, "ab" if offset else "wb")
+        else:
+            sink = destination
+        written = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    sink.write(chunk)
+                    written += len(chunk)
+        except requests.RequestException as exc:
+            raise DocumentProcessingException(
+                status_code=response.status_code,
+                message=f"Download interrupted after {offset + written} bytes: {exc}",
+                response_data=url,
+            ) from exc
+        finally:
+            if is_path:
+                sink.close()
+
+    total = offset + written
+    if expected_size is not None and total != expected_size:
+        raise DocumentProcessingException(
+            status_code=response.status_code,
+            message=f"Downloaded {total} bytes, expected {expected_size} bytes",
+            response_data=url,
+        )
+    return DownloadResult(
+        download_url=url,
+        destination=os.fspath(destination) if is_path else None,
+        bytes_written=written,
+        total_bytes=total,
+        resumed=offset > 0,
+    )
+
+
+def _unsatisfied_range_size(response: requests.Response) -> Optional[int]:
+    """The full size from the `Content-Range: bytes */<size>` header of a 416 response."""
+    unit, _, value = response.headers.get("Content-Range", "").partition(" ")
+    if unit != "bytes" or not value.startswith("*/"):
+        return None
+    try:
+        return int(value[2:])
+    except ValueError:
+        return None
@@ -0,0 +1,118 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from weavaidev.documents.models import (
+    CreateDocumentResponse,
+    GetPageStatusResponse,
+    Page,
+)
+
+
+class LazyPageSequence(Sequence):
+    """A read-only sequence of document pages that are fetched on first access.
+
+    Indexing (`pages[i]`) fetches a single page, optionally prefetching the next
+    `prefetch` pages in the same batch. Slicing and iteration return generators that
+    fetch pages batch by batch, so only the pages being consumed are held in memory.
+    Fetched pages are kept in a small LRU cache bounded by `cache_size`.
+    """
+
+    def __init__(
+        self,
+        stubs: List[Page],
+        fetch_page: Callable[[int], GetPageStatusResponse],
+        prefetch: int = 0,
+        max_workers: int = 4,
+        cache_size: Optional[int] = 64,
+    ):
+        self.stubs = stubs
+        self.prefetch = max(prefetch, 0)
+        self.max_workers = max(max_workers, 1)
+        self.cache_size = cache_size
+        self._fetch_page = fetch_page
+        self._cache: "OrderedDict[int, GetPageStatusResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.stubs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._stream(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("page index out of range")
+        batch = range(index, min(index + self.prefetch + 1, len(self)))
+        return self._load(batch)[index]
+
+    def __iter__(self) -> Iterator[GetPageStatusResponse]:
+        return self._stream(range(len(self)))
+
+    def _stream(self, indices: range) -> Iterator[GetPageStatusResponse]:
+        batch_size = self.prefetch + 1
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start : start + batch_size]
+            pages = self._load(batch)
+            for index in batch:
+                yield pages[index]
+
+    def _load(self, indices: Iterable[int]) -> Dict[int, GetPageStatusResponse]:
+        pages = {}
+        missing = []
+        with self._lock:
+            for index in indices:
+                if index in self._cache:
+                    self._cache.move_to_end(index)
+                    pages[index] = self._cache[index]
+                else:
+                    missing.append(index)
+        if not missing:
+            return pages
+
+        page_numbers = [self.stubs[index].page_number for index in missing]
+        if len(missing) == 1:
+            fetched = [self._fetch_page(page_numbers[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(missing))
+            ) as executor:
+                fetched = list(executor.map(self._fetch_page, page_numbers))
+
+        with self._lock:
+            for index, page in zip(missing, fetched):
+                pages[index] = page
+                self._cache[index] = page
+                self._cache.move_to_end(index)
+            if self.cache_size is not None:
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return pages
+
+
+class LazyDocument:
+    """A document whose metadata is loaded eagerly and whose pages are loaded on demand.
+
+    Attribute access falls through to the lightweight `CreateDocumentResponse`
+    metadata (fetched with `fill_pages=False`), except `pages`, which is a
+    `LazyPageSequence` returning full `GetPageStatusResponse` objects.
+    """
+
+    def __init__(self, metadata: CreateDocumentResponse, pages: LazyPageSequence):
+        self.metadata = metadata
+        self.pages = pages
+
+    @property
+    def page_stubs(self) -> List[Page]:
+        return self.metadata.pages
+
+    def __getattr__(self, name):
+        if name == "metadata":
+            raise AttributeError(name)
+        return getattr(self.metadata, name)
+
+    def __repr__(self) -> str:
+        return f"LazyDocument(id={self.metadata.id!r}, pages={len(self.pages)})"
@@ -142,3 +142,12 @@ class DocumentCategoriesResponse(BaseModel):
 
 class DocumentTagResponse(BaseModel):
     tags: List[List[str]] = [[]]
+
+
+class DownloadResult(BaseModel):
+    download_url: str
+    destination: Optional[str] = None
+    page_number: Optional[int] = None
+    bytes_written: int
+    total_bytes: int
+    resumed: bool = False
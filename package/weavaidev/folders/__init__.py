@@ -9,18 +9,22 @@ from weavaidev.config_models import (
     ServiceType,
     get_base_url,
 )
+from weavaidev.folders.catalog import FolderCatalog
 from weavaidev.folders.exceptions import FolderProcessingException
 from weavaidev.folders.models import (
     CreateFolderRequest,
     CreateFolderResponse,
+    DirectorySyncResult,
     WritableFoldersResponse,
 )
+from weavaidev.folders.sync import DirectorySync, ProgressCallback
 
 
 class FolderOperations:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[requests.Session] = None):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.DOCUMENT)
 
     def create_folder(
@@ -51,7 +55,9 @@ class FolderOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
             "Accept": "application/json",
         }
-        response = requests.post(url, headers=headers, json=folder_request.model_dump())
+        response = self.session.post(
+            url, headers=headers, json=folder_request.model_dump()
+        )
 
         if response.status_code == 401:
             raise FolderProcessingException(
@@ -93,7 +99,7 @@ class FolderOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
             "Accept": "application/json",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise FolderProcessingException(
@@ -137,7 +143,7 @@ class FolderOperations:
             "Authorization": f"Bearer {self.config.auth_token._secret_value}",
             "Accept": "application/json",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 401:
             raise FolderProcessingException(
@@ -166,3 +172,66 @@ class FolderOperations:
         final_response = response.json()
         final_response["id"] = final_response.pop("_id")
         return CreateFolderResponse.model_validate(final_response)
+
+    def build_folder_catalog(self, max_workers: int = 8) -> FolderCatalog:
+        """Builds a `FolderCatalog` of the writable folders, fetching their definitions concurrently.
+
+        The catalog answers which folders contain a document, and which workflow and form a folder uses,
+        without further requests. Call `FolderCatalog.refresh` to pick up new or removed folders.
+
+        Args:
+            max_workers (int): The maximum number of folder definitions fetched concurrently. Defaults to 8.
+
+        Raises:
+            FolderProcessingException: Raised if listing the folders or fetching a definition fails.
+
+        Returns:
+            FolderCatalog: The populated catalog.
+        """
+        catalog = FolderCatalog(self, max_workers=max_workers)
+        catalog.refresh()
+        return catalog
+
+    def sync_directory(
+        self,
+        root: str,
+        folder_prefix: Optional[str] = None,
+        manifest_path: Optional[str] = None,
+        max_workers: int = 4,
+        dry_run: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> DirectorySyncResult:
+        """Mirrors a local directory tree into folders, uploading new and changed files in parallel.
+
+        Each directory with files maps to a folder named `<folder_prefix>/<relative path>`, which is reused
+        if it exists and created otherwise. Files already uploaded with the same size and modification time,
+        or the same content, according to the sync manifest are skipped. See `DirectorySync`.
+
+        Args:
+            root (str): The local directory to mirror.
+            folder_prefix (Optional[str]): The name of the folder for `root`. Defaults to the directory's name.
+            manifest_path (Optional[str]): The path of the sync manifest. Defaults to `.weavaidev-sync.json` in `root`.
+            max_workers (int): The maximum number of concurrent uploads. Defaults to 4.
+            dry_run (bool): A flag to report what would be uploaded without creating folders or documents. Defaults to False.
+            progress (Optional[ProgressCallback]): A callable invoked after each file with the number of files processed,
+                the total and the file's `FileSyncResult`. Defaults to None.
+
+        Raises:
+            NotADirectoryError: Raised if `root` is not a directory.
+            FolderProcessingException: Raised if listing or creating folders fails.
+
+        Returns:
+            DirectorySyncResult: The number of files uploaded and skipped, the folders created and the upload throughput.
+        """
+        # Imported here so that importing the folder operations does not import documents.
+        from weavaidev.documents import DocumentOperations
+
+        return DirectorySync(
+            self,
+            DocumentOperations(self.config, session=self.session),
+            root=root,
+            folder_prefix=folder_prefix,
+            manifest_path=manifest_path,
+            max_workers=max_workers,
+            dry_run=dry_run,
+        ).run(progress=progress)
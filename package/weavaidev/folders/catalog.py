@@ -0,0 +1,174 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from weavaidev.folders.exceptions import FolderProcessingException
+from weavaidev.folders.models import (
+    CreateFolderResponse,
+    FolderCatalogRefreshResult,
+    Workflow,
+)
+from weavaidev.utils import iter_concurrently
+
+if TYPE_CHECKING:
+    from weavaidev.folders import FolderOperations
+
+
+class FolderCatalog:
+    """An in-memory index of the writable folders and their definitions.
+
+    Folder definitions are fetched concurrently with `get_folder_definition` and indexed
+    from document ID to folder IDs, from folder ID to its `Workflow`, and from workflow
+    ID and form ID to folder IDs, so every lookup is a dictionary access.
+
+    `refresh` only fetches the definitions of folders that appeared since the previous
+    refresh and drops folders that are no longer writable; `refresh(full=True)` fetches
+    every definition again and re-indexes only the folders that changed. A single
+    folder can be refreshed with `refresh_folder`, e.g. after uploading a document.
+    """
+
+    def __init__(self, operations: "FolderOperations", max_workers: int = 8):
+        self.operations = operations
+        self.max_workers = max_workers
+        self._folders: Dict[str, CreateFolderResponse] = {}
+        self._folders_by_document: Dict[str, Set[str]] = {}
+        self._folders_by_workflow: Dict[str, Set[str]] = {}
+        self._folders_by_form: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    def __contains__(self, folder_id: str) -> bool:
+        return folder_id in self._folders
+
+    @property
+    def folder_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._folders)
+
+    def get_folder(self, folder_id: str) -> Optional[CreateFolderResponse]:
+        return self._folders.get(folder_id)
+
+    def folders_for_document(self, document_id: str) -> List[str]:
+        with self._lock:
+            return list(self._folders_by_document.get(document_id, ()))
+
+    def workflow_for_folder(self, folder_id: str) -> Optional[Workflow]:
+        folder = self._folders.get(folder_id)
+        return folder.workflow if folder is not None else None
+
+    def workflows_for_document(self, document_id: str) -> Dict[str, Workflow]:
+        """Returns the workflow of every folder containing the document, by folder ID."""
+        with self._lock:
+            return {
+                folder_id: self._folders[folder_id].workflow
+                for folder_id in self._folders_by_document.get(document_id, ())
+            }
+
+    def folders_for_workflow(self, workflow_id: str) -> List[str]:
+        with self._lock:
+            return list(self._folders_by_workflow.get(workflow_id, ()))
+
+    def folders_for_form(self, form_id: str) -> List[str]:
+        with self._lock:
+            return list(self._folders_by_form.get(form_id, ()))
+
+    def refresh(self, full: bool = False) -> FolderCatalogRefreshResult:
+        """Synchronises the catalog with the writable folders.
+
+        Args:
+            full (bool): A flag to fetch the definitions of known folders again, picking up new documents and
+                workflow changes. Defaults to False, which only fetches folders not yet in the catalog.
+
+        Raises:
+            FolderProcessingException: Raised if listing the folders or fetching a definition fails. Folders
+                deleted while refreshing are dropped instead.
+
+        Returns:
+            FolderCatalogRefreshResult: The number of folders added, updated, unchanged and removed.
+        """
+        writable = self.operations.get_writable_folders().folders or []
+        folder_ids = list(dict.fromkeys(folder.id for folder in writable))
+        writable_ids = set(folder_ids)
+        with self._lock:
+            removed = [
+                folder_id
+                for folder_id in self._folders
+                if folder_id not in writable_ids
+            ]
+            to_fetch = [
+                folder_id
+                for folder_id in folder_ids
+                if full or folder_id not in self._folders
+            ]
+            for folder_id in removed:
+                self._unindex(self._folders.pop(folder_id))
+
+        result = self._fetch(to_fetch)
+        result.removed += len(removed)
+        result.unchanged += len(folder_ids) - len(to_fetch)
+        return result
+
+    def refresh_folder(self, folder_id: str) -> FolderCatalogRefreshResult:
+        """Fetches the definition of a single folder and updates its index entries."""
+        return self._fetch([folder_id])
+
+    def _fetch(self, folder_ids: Iterable[str]) -> FolderCatalogRefreshResult:
+        folder_ids = list(folder_ids)
+        result = FolderCatalogRefreshResult()
+        definitions = iter_concurrently(
+            self._get_definition, folder_ids, max_workers=self.max_workers
+        )
+        for folder_id, folder in zip(folder_ids, definitions):
+            with self._lock:
+                previous = self._folders.get(folder_id)
+                if folder is None:
+                    if previous is not None:
+                        self._unindex(self._folders.pop(folder_id))
+                        result.removed += 1
+                    continue
+                if previous is None:
+                    result.added += 1
+                elif previous == folder:
+                    result.unchanged += 1
+                    continue
+                else:
+                    self._unindex(previous)
+                    result.updated += 1
+                self._folders[folder_id] = folder
+                self._index(folder)
+        return result
+
+    def _get_definition(self, folder_id: str) -> Optional[CreateFolderResponse]:
+        try:
+            return self.operations.get_folder_definition(folder_id)
+        except FolderProcessingException as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+
+    def _index(self, folder: CreateFolderResponse) -> None:
+        for document_id in folder.document_ids or []:
+            self._folders_by_document.setdefault(document_id, set()).add(folder.id)
+        if folder.workflow.workflow_id:
+            self._folders_by_workflow.setdefault(
+                folder.workflow.workflow_id, set()
+            ).add(folder.id)
+        if folder.workflow.form_id:
+            self._folders_by_form.setdefault(folder.workflow.form_id, set()).add(
+                folder.id
+            )
+
+    def _unindex(self, folder: CreateFolderResponse) -> None:
+        for index, keys in (
+            (self._folders_by_document, folder.document_ids or []),
+            (self._folders_by_workflow, [folder.workflow.workflow_id]),
+            (self._folders_by_form, [folder.workflow.form_id]),
+        ):
+            for key in keys:
+                folder_ids = index.get(key)
+                if folder_ids is None:
+                    continue
+                folder_ids.discard(folder.id)
+                if not folder_ids:
+                    del index[key]
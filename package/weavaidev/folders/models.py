@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -38,3 +38,33 @@ class WritableFolderData(BaseModel):
 
 class WritableFoldersResponse(BaseModel):
     folders: Optional[List[WritableFolderData]] = []
+
+
+class FolderCatalogRefreshResult(BaseModel):
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+class FileSyncResult(BaseModel):
+    path: str
+    folder: str
+    status: Literal["uploaded", "unchanged", "duplicate", "planned", "failed"]
+    size: int = 0
+    document_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class DirectorySyncResult(BaseModel):
+    files_scanned: int = 0
+    uploaded: int = 0
+    unchanged: int = 0
+    duplicates: int = 0
+    planned: int = 0
+    failed: int = 0
+    folders_created: List[str] = []
+    bytes_uploaded: int = 0
+    elapsed_seconds: float = 0.0
+    bytes_per_second: float = 0.0
+    failures: Dict[str, str] = {}
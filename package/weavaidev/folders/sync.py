@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+from weavaidev.folders.models import DirectorySyncResult, FileSyncResult
+from weavaidev.utils import iter_as_completed
+
+if TYPE_CHECKING:
+    from weavaidev.documents import DocumentOperations
+    from weavaidev.folders import FolderOperations
+
+MANIFEST_FILE_NAME = ".weavaidev-sync.json"
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int, FileSyncResult], None]
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DirectorySync:
+    """Mirrors a local directory tree into folders, uploading only new or changed files.
+
+    Every directory containing files maps to one folder, named after `folder_prefix`
+    (the root directory's name by default) followed by the directory's relative path,
+    e.g. `reports/2024/q1`. Folders are reused by name from `get_writable_folders` and
+    created with `create_folder` when missing. Hidden files and directories are ignored.
+
+    The size, modification time and SHA-256 of every uploaded file are kept in a JSON
+    manifest (`.weavaidev-sync.json` in the root by default). A file whose size and
+    modification time match the manifest is skipped without being read; otherwise it is
+    hashed and uploaded only if its content changed. Files whose content was already
+    uploaded to the same folder are skipped as duplicates. Uploads run in parallel on
+    `max_workers` threads. A changed file is uploaded as a new document; the document of
+    its previous version is left in place.
+    """
+
+    def __init__(
+        self,
+        folder_operations: "FolderOperations",
+        document_operations: "DocumentOperations",
+        root: str,
+        folder_prefix: Optional[str] = None,
+        manifest_path: Optional[str] = None,
+        max_workers: int = 4,
+        dry_run: bool = False,
+    ):
+        if not os.path.isdir(root):
+            raise NotADirectoryError(f"Directory '{root}' not found.")
+        self.folder_operations = folder_operations
+        self.document_operations = document_operations
+        self.root = os.path.abspath(root)
+        self.folder_prefix = (folder_prefix or os.path.basename(self.root)).strip("/")
+        self.manifest_path = manifest_path or os.path.join(
+            self.root, MANIFEST_FILE_NAME
+        )
+        self.max_workers = max_workers
+        self.dry_run = dry_run
+        self._lock = threading.Lock()
+        self._folder_locks: Dict[str, threading.Lock] = {}
+        self._folder_ids: Optional[Dict[str, str]] = None
+        self._created_folders: List[str] = []
+        self._manifest: Dict[str, dict] = {}
+        self._uploaded_hashes: Dict[Tuple[str, str], str] = {}
+        self._uploads_in_flight: Dict[Tuple[str, str], threading.Event] = {}
+
+    def scan(self) -> Iterator[Tuple[str, str]]:
+        """Yields `(relative_path, folder_name)` for every file to mirror."""
+        manifest_path = os.path.abspath(self.manifest_path)
+        for directory, directories, files in os.walk(self.root):
+            directories[:] = sorted(
+                name for name in directories if not name.startswith(".")
+            )
+            relative_directory = os.path.relpath(directory, self.root)
+            folder = self.folder_prefix
+            if relative_directory != ".":
+                folder = f"{folder}/{relative_directory.replace(os.sep, '/')}"
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                if name.startswith(".") or os.path.abspath(path) == manifest_path:
+                    continue
+                yield os.path.relpath(path, self.root).replace(os.sep, "/"), folder
+
+    def run(self, progress: Optional[ProgressCallback] = None) -> DirectorySyncResult:
+        """Synchronises the tree and returns a summary of what was uploaded and skipped.
+
+        Args:
+            progress (Optional[ProgressCallback]): A callable invoked after each file with the number of files
+                processed, the total and the file's `FileSyncResult`. Defaults to None.
+
+        Raises:
+            FolderProcessingException: Raised if listing or creating folders fails.
+
+        Returns:
+            DirectorySyncResult: The number of files uploaded, unchanged, duplicated, planned (in a dry run) and
+                failed, the folders created, and the upload throughput.
+        """
+        started_at = time.perf_counter()
+        self._load_manifest()
+        files = list(self.scan())
+        result = DirectorySyncResult(files_scanned=len(files))
+        try:
+            completed = iter_as_completed(
+                self._sync_file, files, max_workers=self.max_workers
+            )
+            for index, (_, future) in enumerate(completed, start=1):
+                file_result = future.result()
+                if file_result.status == "uploaded":
+                    result.uploaded += 1
+                    result.bytes_uploaded += file_result.size
+                elif file_result.status == "unchanged":
+                    result.unchanged += 1
+                elif file_result.status == "duplicate":
+                    result.duplicates += 1
+                elif file_result.status == "planned":
+                    result.planned += 1
+                else:
+                    result.failed += 1
+                    result.failures[file_result.path] = file_result.error
+                if progress is not None:
+                    progress(index, len(files), file_result)
+        finally:
+            if not self.dry_run:
+                self._save_manifest()
+        result.folders_created = list(self._created_folders)
+        result.elapsed_seconds = time.perf_counter() - started_at
+        if result.elapsed_seconds:
+            result.bytes_per_second = result.bytes_uploaded / result.elapsed_seconds
+        return result
+
+    def _sync_file(self, file: Tuple[str, str]) -> FileSyncResult:
+        relative_path, folder = file
+        path = os.path.join(self.root, relative_path)
+        result = FileSyncResult(path=relative_path, folder=folder, status="unchanged")
+        sha256 = None
+        claimed = False
+        try:
+            stat = os.stat(path)
+            result.size = stat.st_size
+            with self._lock:
+                entry = self._manifest.get(relative_path)
+            if (
+                entry is not None
+                and entry.get("document_id")
+                and entry["folder"] == folder
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                result.document_id = entry["document_id"]
+                return result
+
+            sha256 = file_sha256(path)
+            record = {
+                "folder": folder,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256,
+            }
+            uploaded_by = self._claim((folder, sha256), relative_path)
+            claimed = uploaded_by is None
+            if uploaded_by is not None:
+                result.status = (
+                    "unchanged" if uploaded_by == relative_path else "duplicate"
+                )
+                with self._lock:
+                    owner = self._manifest.get(uploaded_by) or {}
+                result.document_id = owner.get("document_id")
+                # Without the owner's document (in a dry run), nothing is recorded, so
+                # the next run checks this file again.
+                if result.document_id:
+                    with self._lock:
+                        self._manifest[relative_path] = {
+                            **record,
+                            "folder_id": owner.get("folder_id"),
+                            "document_id": result.document_id,
+                        }
+                return result
+
+            if self.dry_run:
+                result.status = "planned"
+                return result
+
+            folder_id = self._folder_id(folder)
+            document = self.document_operations.create_document(
+                file_path=path, folder_id=folder_id
+            )
+            result.status = "uploaded"
+            result.document_id = document.id
+            with self._lock:
+                self._manifest[relative_path] = {
+                    **record,
+                    "folder_id": folder_id,
+                    "document_id": document.id,
+                }
+        except Exception as exc:
+            # Any error, such as a folder that cannot be created, fails only this file.
+            result.status = "failed"
+            result.error = str(exc)
+            # Release the content claim so that a copy of this file can still upload it.
+            with self._lock:
+                if self._uploaded_hashes.get((folder, sha256)) == relative_path:
+                    del self._uploaded_hashes[(folder, sha256)]
+        finally:
+            if claimed:
+                # Wakes up the copies waiting on this upload; a failed upload released
+                # its claim above, so one of them claims the content next.
+                with self._lock:
+                    self._uploads_in_flight.pop((folder, sha256)).set()
+        return result
+
+    def _claim(self, key: Tuple[str, str], relative_path: str) -> Optional[str]:
+        """Claims uploading the content `key`, or returns the path that uploaded it.
+
+        While another file holding the same content is uploading, this waits for its
+        upload to finish, so that a duplicate is only recorded once the content has a
+        document; if that upload fails, the content is claimed again.
+        """
+        while True:
+            with self._lock:
+                uploaded_by = self._uploaded_hashes.get(key)
+                if uploaded_by is None:
+                    self._uploaded_hashes[key] = relative_path
+                    self._uploads_in_flight[key] = threading.Event()
+                    return None
+                in_flight = self._uploads_in_flight.get(key)
+            if in_flight is None or uploaded_by == relative_path:
+                return uploaded_by
+            in_flight.wait()
+
+    def _folder_id(self, name: str) -> str:
+        with self._lock:
+            if self._folder_ids is None:
+                self._folder_ids = {}
+                for folder in self.folder_operations.get_writable_folders().folders:
+                    self._folder_ids.setdefault(folder.name, folder.id)
+            folder_lock = self._folder_locks.setdefault(name, threading.Lock())
+        with folder_lock:
+            folder_id = self._folder_ids.get(name)
+            if folder_id is None:
+                folder_id = self.folder_operations.create_folder(name=name).id
+                with self._lock:
+                    self._folder_ids[name] = folder_id
+                    self._created_folders.append(name)
+            return folder_id
+
+    def _load_manifest(self) -> None:
+        self._manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as manifest_file:
+                self._manifest = json.load(manifest_file)["files"]
+        self._uploaded_hashes = {
+            (entry["folder"], entry["sha256"]): path
+            for path, entry in self._manifest.items()
+            if entry.get("document_id")
+        }
+
+    def _save_manifest(self) -> None:
+        temporary_path = f"{self.manifest_path}.part"
+        with self._lock:
+            manifest = {"version": 1, "files": dict(sorted(self._manifest.items()))}
+        with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temporary_path, self.manifest_path)
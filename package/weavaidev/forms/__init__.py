@@ -1,6 +1,17 @@
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import Literal, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
 import pandas as pd
 import requests
@@ -12,8 +23,10 @@ from weavaidev.config_models import (
     ServiceType,
     get_base_url,
 )
+from weavaidev.forms.cache import AnalyticsCache
 from weavaidev.forms.exceptions import FormProcessingException
 from weavaidev.forms.models import (
+    BulkFormOperationResult,
     CreateFormRequest,
     CreateFormResponse,
     DownloadQueryResultRequest,
@@ -24,16 +37,33 @@ from weavaidev.forms.models import (
     FilterFormInstanceResponse,
     FilterFormRequest,
     FilterFormResponse,
+    FormInstanceDetail,
+    FormInstanceSyncResult,
     GetFormDefinitonResponse,
     UpdateFormDefinitonRequest,
 )
+from weavaidev.forms.sync import FormInstanceSync
+from weavaidev.forms.tables import FormInstanceTables, build_form_instance_tables
+from weavaidev.utils import (
+    DEFAULT_CSV_CHUNK_SIZE,
+    iter_concurrently,
+    iter_csv_chunks,
+    write_dataframe_chunks,
+)
 
 
 class FormOperations:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        analytics_cache: Optional[AnalyticsCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.DOCUMENT)
+        self.analytics_cache = analytics_cache
 
     def create_form(self, form_data: CreateFormRequest) -> CreateFormResponse:
         """Creates a new form with the specified fields and metadata.
@@ -55,7 +85,7 @@ class FormOperations:
             CreateFormResponse: A response object containing the created form's details, including name, category, description, fields, and other metadata.
         """
         url = f"{self.base_url}/{self.endpoints.CREATE_FORM}"
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=form_data.model_dump(),
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -117,7 +147,7 @@ class FormOperations:
                 for k, v in filtered_params
             ]
         )
-        response = requests.get(
+        response = self.session.get(
             url=f"{url}?{query_string}",
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -161,9 +191,21 @@ class FormOperations:
         Returns:
             ExecuteFormAnalyticsResponse: A response object containing the results of the form analytics, including the summary, total count, and columns.
         """
+        if self.analytics_cache is None:
+            return self._execute_form_analytics(form_id, form_data)
+        key = AnalyticsCache.make_key(
+            "execute", form_data.query, skip=form_data.skip, limit=form_data.limit
+        )
+        return self.analytics_cache.get_or_load(
+            form_id, key, lambda: self._execute_form_analytics(form_id, form_data)
+        )
+
+    def _execute_form_analytics(
+        self, form_id: str, form_data: ExecuteFormAnalyticsRequest
+    ) -> ExecuteFormAnalyticsResponse:
         url = f"{self.base_url}/{self.endpoints.EXECUTE_FORM_ANALYTICS.format(FORM_ID=form_id)}"
         final_data = {data[0]: data[1] for data in form_data if data[1]}
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=final_data,
             headers={
@@ -197,6 +239,145 @@ class FormOperations:
             )
         return ExecuteFormAnalyticsResponse.model_validate(response.json())
 
+    def iter_form_analytics_pages(
+        self,
+        form_id: str,
+        form_data: ExecuteFormAnalyticsRequest,
+        page_size: int = 500,
+        max_workers: int = 4,
+        read_ahead: Optional[int] = None,
+    ) -> Iterator[ExecuteFormAnalyticsResponse]:
+        """Executes a form analytics query and iterates over every page of its results.
+
+        The first page is fetched to learn `total_count`; the remaining pages are then
+        requested in parallel with bounded read-ahead and yielded in order. The `skip` of
+        `form_data` is used as the starting offset and `limit` is replaced by `page_size`.
+
+        Args:
+            form_id (str): The ID of the form on which analytics are being executed.
+            form_data (ExecuteFormAnalyticsRequest): The request body containing the query.
+            page_size (int): The number of result rows requested per page. Defaults to 500.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 4.
+            read_ahead (Optional[int]): The maximum number of pages fetched ahead of the consumer. Defaults to twice `max_workers`.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), validation fails (status code 422),
+                or if any other error occurs while executing form analytics.
+
+        Returns:
+            Iterator[ExecuteFormAnalyticsResponse]: An iterator over the result pages, in order.
+        """
+        start = form_data.skip
+
+        def fetch_page(skip: int) -> ExecuteFormAnalyticsResponse:
+            return self.execute_form_analytics(
+                form_id, form_data.model_copy(update={"skip": skip, "limit": page_size})
+            )
+
+        first_page = fetch_page(start)
+        total_count = first_page.total_count
+        yield first_page
+        del first_page
+        yield from iter_concurrently(
+            fetch_page,
+            range(start + page_size, total_count, page_size),
+            max_workers=max_workers,
+            read_ahead=read_ahead,
+        )
+
+    def iter_form_analytics(
+        self,
+        form_id: str,
+        form_data: ExecuteFormAnalyticsRequest,
+        page_size: int = 500,
+        max_workers: int = 4,
+        read_ahead: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Executes a form analytics query and yields its results as one DataFrame per page.
+
+        Use this for results that do not fit in memory; see `iter_form_analytics_pages` for
+        the paging behaviour and `fetch_form_analytics` to build a single table.
+
+        Args:
+            form_id (str): The ID of the form on which analytics are being executed.
+            form_data (ExecuteFormAnalyticsRequest): The request body containing the query.
+            page_size (int): The number of result rows requested per page. Defaults to 500.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 4.
+            read_ahead (Optional[int]): The maximum number of pages fetched ahead of the consumer. Defaults to twice `max_workers`.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), validation fails (status code 422),
+                or if any other error occurs while executing form analytics.
+
+        Returns:
+            Iterator[pd.DataFrame]: An iterator over DataFrames whose columns follow the response `columns`.
+        """
+        pages = self.iter_form_analytics_pages(
+            form_id,
+            form_data,
+            page_size=page_size,
+            max_workers=max_workers,
+            read_ahead=read_ahead,
+        )
+        for page in pages:
+            columns = _analytics_columns(page)
+            yield pd.DataFrame(
+                {
+                    column: [row.get(column) for row in page.results]
+                    for column in columns
+                },
+                columns=columns,
+            )
+
+    def fetch_form_analytics(
+        self,
+        form_id: str,
+        form_data: ExecuteFormAnalyticsRequest,
+        page_size: int = 500,
+        max_workers: int = 4,
+        output_format: Literal["pandas", "arrow"] = "pandas",
+    ) -> Any:
+        """Executes a form analytics query and collects every page into a single table.
+
+        Pages are fetched concurrently (see `iter_form_analytics_pages`) and their rows are
+        appended column by column, so the table is built once from the response `columns`
+        without per-page frames or intermediate row records.
+
+        Args:
+            form_id (str): The ID of the form on which analytics are being executed.
+            form_data (ExecuteFormAnalyticsRequest): The request body containing the query.
+            page_size (int): The number of result rows requested per page. Defaults to 500.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 4.
+            output_format (Literal["pandas", "arrow"]): Whether to return a pandas DataFrame or a `pyarrow.Table`. Defaults to "pandas".
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), validation fails (status code 422),
+                or if any other error occurs while executing form analytics.
+            ImportError: Raised if Arrow output is requested and `pyarrow` is not installed.
+
+        Returns:
+            Union[pd.DataFrame, pyarrow.Table]: All result rows of the query.
+        """
+        columns: Dict[str, List[Any]] = {}
+        pages = self.iter_form_analytics_pages(
+            form_id, form_data, page_size=page_size, max_workers=max_workers
+        )
+        for page in pages:
+            if not columns:
+                columns = {column: [] for column in _analytics_columns(page)}
+            for column, values in columns.items():
+                values.extend(row.get(column) for row in page.results)
+
+        if output_format == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError as exc:
+                raise ImportError(
+                    "Arrow output requires pyarrow, install it with `pip install weavaidev[parquet]`"
+                ) from exc
+            return pa.table(columns)
+        return pd.DataFrame(columns, columns=list(columns))
+
     def filter_form_instances(
         self, form_data: FilterFormInstanceRequest
     ) -> FilterFormInstanceResponse:
@@ -242,7 +423,7 @@ class FormOperations:
             ]
         )
 
-        response = requests.get(
+        response = self.session.get(
             url=f"{url}?{query_string}",
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -266,6 +447,51 @@ class FormOperations:
             )
         return FilterFormInstanceResponse.model_validate(response.json())
 
+    def iter_form_instances(
+        self,
+        form_data: FilterFormInstanceRequest,
+        page_size: int = 100,
+        max_workers: int = 4,
+        read_ahead: Optional[int] = None,
+    ) -> Iterator[FormInstanceDetail]:
+        """Iterates over all form instances matching a filter, fetching pages concurrently.
+
+        The first page is fetched to learn `FilterFormInstanceResponse.total`; the remaining
+        pages are then requested in parallel with bounded read-ahead and their records are
+        yielded in order, so memory stays constant regardless of the number of matches.
+        The `skip` of `form_data` is used as the starting offset, while `limit` and `all`
+        are replaced by `page_size`.
+
+        Args:
+            form_data (FilterFormInstanceRequest): The filter parameters, as accepted by `filter_form_instances`.
+            page_size (int): The number of form instances requested per page. Defaults to 100.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 4.
+            read_ahead (Optional[int]): The maximum number of pages fetched ahead of the consumer. Defaults to twice `max_workers`.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), or if any other error occurs while filtering form instances.
+
+        Returns:
+            Iterator[FormInstanceDetail]: An iterator over the matching form instances, in server order.
+        """
+        start = form_data.skip or 0
+
+        def fetch_page(skip: int) -> FilterFormInstanceResponse:
+            return self.filter_form_instances(
+                form_data.model_copy(
+                    update={"skip": skip, "limit": page_size, "all": False}
+                )
+            )
+
+        first_page = fetch_page(start)
+        yield from first_page.form_instances or []
+        offsets = range(start + page_size, first_page.total, page_size)
+        del first_page
+        for page in iter_concurrently(
+            fetch_page, offsets, max_workers=max_workers, read_ahead=read_ahead
+        ):
+            yield from page.form_instances or []
+
     def get_form_definition(self, form_id: str) -> GetFormDefinitonResponse:
         """Retrieves the definition of a specific form by its ID.
 
@@ -279,7 +505,7 @@ class FormOperations:
             GetFormDefinitonResponse: A response object containing the form definition, including name, category, fields, and other metadata.
         """
         url = f"{self.base_url}/{self.endpoints.GET_FORM_DEFINITON.format(FORM_ID=form_id)}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -305,6 +531,65 @@ class FormOperations:
         final_response["id"] = final_response.pop("_id")
         return GetFormDefinitonResponse.model_validate(final_response)
 
+    def get_form_instance_tables(
+        self,
+        form_id: str,
+        instances: Optional[Iterable[FormInstanceDetail]] = None,
+    ) -> FormInstanceTables:
+        """Builds typed DataFrames of a form's instances from the form definition.
+
+        The field types of `get_form_definition` are used to cast every column once; Table
+        and array fields are exploded into child tables. See `build_form_instance_tables`.
+
+        Args:
+            form_id (str): The ID of the form whose definition describes the instances.
+            instances (Optional[Iterable[FormInstanceDetail]]): The form instances to convert. Defaults to all
+                instances of the form, fetched with `iter_form_instances`.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), or if the form definition
+                or its instances cannot be fetched.
+
+        Returns:
+            FormInstanceTables: The instance table and the child tables of Table and array fields.
+        """
+        definition = self.get_form_definition(form_id)
+        if instances is None:
+            instances = self.iter_form_instances(
+                FilterFormInstanceRequest(scope="all_documents", form_id=form_id)
+            )
+        return build_form_instance_tables(definition, instances)
+
+    def sync_form_instances(
+        self,
+        db_path: str,
+        form_data: Optional[FilterFormInstanceRequest] = None,
+        prune: bool = False,
+    ) -> FormInstanceSyncResult:
+        """Mirrors form instances into a local SQLite database, writing only changes.
+
+        Every run lists every instance matching the filter, because the API cannot
+        filter on `modified_at`, so the time and requests of a run scale with the
+        number of matching instances, not with the number of changes. Only the
+        instances whose `modified_at` or status changed since the previous run are
+        written. See `FormInstanceSync` for a reusable mirror with DataFrame export.
+
+        Args:
+            db_path (str): The path of the SQLite database holding the mirror. Created if missing.
+            form_data (Optional[FilterFormInstanceRequest]): The filter selecting the instances to mirror. Defaults to all documents.
+            prune (bool): A flag to delete mirrored instances of the filter's `form_id` that are no longer returned.
+                Requires a filter on `form_id` only, over all documents and every version. Defaults to False.
+
+        Raises:
+            FormProcessingException: Raised if listing the form instances fails.
+            ValueError: Raised if `prune` is set without a filter on `form_id` only, with the `all_documents`
+                scope and without `only_latest`.
+
+        Returns:
+            FormInstanceSyncResult: The number of instances seen, inserted, updated, unchanged and deleted.
+        """
+        return FormInstanceSync(self, db_path, form_data=form_data).run(prune=prune)
+
     def update_form_definition(
         self, form_id: str, form_data: UpdateFormDefinitonRequest
     ) -> GetFormDefinitonResponse:
@@ -321,7 +606,7 @@ class FormOperations:
             GetFormDefinitonResponse: A response object containing the updated form definition.
         """
         url = f"{self.base_url}/{self.endpoints.UPDATE_FORM_DEFINITON.format(FORM_ID=form_id)}"
-        response = requests.put(
+        response = self.session.put(
             url=url,
             json=form_data.model_dump(),
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -350,6 +635,8 @@ class FormOperations:
                 message="Failed to update form instances",
                 response_data=response.json(),
             )
+        if self.analytics_cache is not None:
+            self.analytics_cache.invalidate_form(form_id)
         final_response = response.json()
         final_response["id"] = final_response.pop("_id")
         return GetFormDefinitonResponse.model_validate(final_response)
@@ -367,7 +654,7 @@ class FormOperations:
             GetFormDefinitonResponse: A response object confirming the deletion of the form.
         """
         url = f"{self.base_url}/{self.endpoints.DELETE_FORM_DEFINITON.format(FORM_ID=form_id)}"
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
         )
@@ -383,10 +670,121 @@ class FormOperations:
                 message="Failed to delete form definition",
                 response_data=response.json(),
             )
+        if self.analytics_cache is not None:
+            self.analytics_cache.invalidate_form(form_id)
         final_response = response.json()
         final_response["id"] = final_response.pop("_id")
         return GetFormDefinitonResponse.model_validate(final_response)
 
+    def create_forms(
+        self,
+        forms: List[CreateFormRequest],
+        max_workers: int = 8,
+        dry_run: bool = False,
+    ) -> List[BulkFormOperationResult]:
+        """Creates many forms concurrently, collecting a result or error per form.
+
+        Args:
+            forms (List[CreateFormRequest]): The forms to create.
+            max_workers (int): The maximum number of forms created concurrently. Defaults to 8.
+            dry_run (bool): A flag to report the planned creations without sending any request. The forms are
+                not compared with the existing ones, so a dry run does not detect duplicate names. Defaults to False.
+
+        Returns:
+            List[BulkFormOperationResult]: One result per form, in input order. Failed creations carry
+                the error message instead of raising.
+        """
+
+        def create(index: int) -> BulkFormOperationResult:
+            result = BulkFormOperationResult(index=index, action="create")
+            if not dry_run:
+                result.response = self.create_form(forms[index])
+                result.form_id = result.response.id
+                result.applied = True
+            return result
+
+        return _run_bulk(create, len(forms), "create", max_workers)
+
+    def update_form_definitions(
+        self,
+        updates: Dict[str, UpdateFormDefinitonRequest],
+        max_workers: int = 8,
+        dry_run: bool = False,
+        skip_unchanged: bool = True,
+    ) -> List[BulkFormOperationResult]:
+        """Updates many form definitions concurrently, skipping forms that would not change.
+
+        Each form's current definition is fetched and compared with the requested update;
+        the differing attributes are reported in `changed_attributes`, and forms without
+        differences are skipped without a write when `skip_unchanged` is set.
+
+        Args:
+            updates (Dict[str, UpdateFormDefinitonRequest]): The requested definitions, keyed by form ID.
+            max_workers (int): The maximum number of forms processed concurrently. Defaults to 8.
+            dry_run (bool): A flag to only diff against the existing definitions without writing anything. Defaults to False.
+            skip_unchanged (bool): A flag to skip the write for forms whose definition already matches. Defaults to True.
+
+        Returns:
+            List[BulkFormOperationResult]: One result per form, in input order. Failed updates carry
+                the error message instead of raising.
+        """
+        items = list(updates.items())
+
+        def update(index: int) -> BulkFormOperationResult:
+            form_id, form_data = items[index]
+            result = BulkFormOperationResult(
+                index=index, form_id=form_id, action="update"
+            )
+            if skip_unchanged or dry_run:
+                existing = self.get_form_definition(form_id)
+                result.changed_attributes = _changed_attributes(existing, form_data)
+                if skip_unchanged and not result.changed_attributes:
+                    result.action = "skip"
+                    result.response = existing
+                    return result
+            if not dry_run:
+                result.response = self.update_form_definition(form_id, form_data)
+                result.applied = True
+            return result
+
+        return _run_bulk(
+            update, len(items), "update", max_workers, form_ids=list(updates)
+        )
+
+    def delete_form_definitions(
+        self,
+        form_ids: List[str],
+        max_workers: int = 8,
+        dry_run: bool = False,
+    ) -> List[BulkFormOperationResult]:
+        """Deletes many form definitions concurrently, collecting a result or error per form.
+
+        Args:
+            form_ids (List[str]): The IDs of the forms to delete.
+            max_workers (int): The maximum number of forms deleted concurrently. Defaults to 8.
+            dry_run (bool): A flag to only check that the forms exist without deleting them. Defaults to False.
+
+        Returns:
+            List[BulkFormOperationResult]: One result per form, in input order. Failed deletions carry
+                the error message instead of raising.
+        """
+
+        def delete(index: int) -> BulkFormOperationResult:
+            form_id = form_ids[index]
+            result = BulkFormOperationResult(
+                index=index, form_id=form_id, action="delete"
+            )
+            if dry_run:
+                result.response = self.get_form_definition(form_id)
+            else:
+                result.response = self.delete_form_definition(form_id)
+                result.applied = True
+            return result
+
+        return _run_bulk(
+            delete, len(form_ids), "delete", max_workers, form_ids=form_ids
+        )
+
     def download_query_result(
         self,
         form_id: str,
@@ -407,9 +805,26 @@ class FormOperations:
         Returns:
             Union[DownloadQueryResultResponse, pd.DataFrame]: The query result as a response object or as a pandas DataFrame if CSV format is requested.
         """
+        if self.analytics_cache is None:
+            return self._download_query_result(form_id, form_data, download_format)
+        key = AnalyticsCache.make_key(
+            "download", form_data.query, download_format=download_format
+        )
+        return self.analytics_cache.get_or_load(
+            form_id,
+            key,
+            lambda: self._download_query_result(form_id, form_data, download_format),
+        )
+
+    def _download_query_result(
+        self,
+        form_id: str,
+        form_data: DownloadQueryResultRequest,
+        download_format: Literal["JSON", "CSV"],
+    ) -> Union[DownloadQueryResultResponse, pd.DataFrame]:
         url = f"{self.base_url}/{self.endpoints.DOWNLOAD_QUERY_RESULT.format(FORM_ID=form_id)}"
         params = [("download_format", download_format)]
-        response = requests.post(
+        response = self.session.post(
             url=url,
             params=params,
             json={"query": form_data.query},
@@ -447,3 +862,157 @@ class FormOperations:
             return DownloadQueryResultResponse.model_validate(response.json())
         data = StringIO(response.text)
         return pd.read_csv(data)
+
+    def iter_query_result_csv(
+        self,
+        form_id: str,
+        form_data: DownloadQueryResultRequest,
+        chunksize: int = DEFAULT_CSV_CHUNK_SIZE,
+        dtype: Optional[Dict[str, str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the result of a form query as CSV and parses it in DataFrame chunks.
+
+        Unlike `download_query_result(download_format="CSV")`, the response body is parsed
+        as it arrives, so peak memory is proportional to `chunksize` rather than to the
+        size of the export.
+
+        Args:
+            form_id (str): The ID of the form whose query results are being downloaded.
+            form_data (DownloadQueryResultRequest): The request body containing the query for retrieving the form results.
+            chunksize (int): The maximum number of rows per yielded DataFrame. Defaults to 10000.
+            dtype (Optional[Dict[str, str]]): Column dtypes passed to `pd.read_csv`. Defaults to inferring per chunk.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), validation fails (status code 422),
+                or if any other error occurs while downloading the query result.
+
+        Returns:
+            Iterator[pd.DataFrame]: An iterator over DataFrame chunks of the query result.
+        """
+        url = f"{self.base_url}/{self.endpoints.DOWNLOAD_QUERY_RESULT.format(FORM_ID=form_id)}"
+        params = [("download_format", "CSV")]
+        response = self.session.post(
+            url=url,
+            params=params,
+            json={"query": form_data.query},
+            headers={
+                "Authorization": f"Bearer {self.config.auth_token._secret_value}",
+                "Content-Type": "application/json",
+            },
+            stream=True,
+        )
+
+        if response.status_code == 401:
+            raise FormProcessingException(
+                status_code=response.status_code,
+                message=AUTHENTICATION_FAILED_MESSAGE,
+                response_data=response.json(),
+            )
+        elif response.status_code == 422:
+            raise FormProcessingException(
+                status_code=response.status_code,
+                message=VALIDATION_FAILED_MESSAGE,
+                response_data=response.json(),
+            )
+        elif response.status_code == 404:
+            raise FormProcessingException(
+                status_code=response.status_code,
+                message="Could not find form",
+                response_data="Could not find form",
+            )
+        elif response.status_code != 200:
+            raise FormProcessingException(
+                status_code=response.status_code,
+                message="Failed to download form definition",
+                response_data=response.json(),
+            )
+        return iter_csv_chunks(response, chunksize=chunksize, dtype=dtype)
+
+    def download_query_result_to_file(
+        self,
+        form_id: str,
+        form_data: DownloadQueryResultRequest,
+        output_path: str,
+        file_format: Literal["CSV", "PARQUET"] = "CSV",
+        chunksize: int = DEFAULT_CSV_CHUNK_SIZE,
+        dtype: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Streams the result of a form query straight into a CSV or Parquet file.
+
+        Args:
+            form_id (str): The ID of the form whose query results are being downloaded.
+            form_data (DownloadQueryResultRequest): The request body containing the query for retrieving the form results.
+            output_path (str): The path of the file to write.
+            file_format (Literal["CSV", "PARQUET"]): The output file format. Parquet requires `pyarrow`. Defaults to "CSV".
+            chunksize (int): The maximum number of rows parsed and written at a time. Defaults to 10000.
+            dtype (Optional[Dict[str, str]]): Column dtypes passed to `pd.read_csv`. Defaults to inferring per chunk.
+
+        Raises:
+            FormProcessingException: Raised if authentication fails (status code 401), validation fails (status code 422),
+                or if any other error occurs while downloading the query result.
+            ImportError: Raised if Parquet output is requested and `pyarrow` is not installed.
+
+        Returns:
+            int: The number of rows written.
+        """
+        chunks = self.iter_query_result_csv(
+            form_id=form_id, form_data=form_data, chunksize=chunksize, dtype=dtype
+        )
+        return write_dataframe_chunks(chunks, output_path, file_format=file_format)
+
+
+def _analytics_columns(page: ExecuteFormAnalyticsResponse) -> List[str]:
+    if page.columns:
+        return page.columns
+    return list(page.results[0]) if page.results else []
+
+
+def _run_bulk(
+    func: Callable[[int], BulkFormOperationResult],
+    count: int,
+    action: str,
+    max_workers: int,
+    form_ids: Optional[List[str]] = None,
+) -> List[BulkFormOperationResult]:
+    def run(index: int) -> BulkFormOperationResult:
+        try:
+            return func(index)
+        except Exception as exc:
+            # Any error, including a response that does not validate, is reported for its
+            # item so that every input gets a result.
+            return BulkFormOperationResult(
+                index=index,
+                form_id=form_ids[index] if form_ids else "",
+                action=action,
+                error=str(exc),
+            )
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        return list(executor.map(run, range(count)))
+
+
+def _changed_attributes(
+    existing: GetFormDefinitonResponse, form_data: UpdateFormDefinitonRequest
+) -> List[str]:
+    changed = [
+        attribute
+        for attribute in (
+            "name",
+            "category",
+            "description",
+            "is_shared",
+            "is_searchable",
+        )
+        if getattr(existing, attribute) != getattr(form_data, attribute)
+    ]
+    existing_fields = [
+        (f.name, f.field_type, f.description, f.is_array, f.fill_by_search)
+        for f in existing.fields or []
+    ]
+    requested_fields = [
+        (f.name, f.field_type, f.description, f.is_array, f.fill_by_search)
+        for f in form_data.fields or []
+    ]
+    if existing_fields != requested_fields:
+        changed.append("fields")
+    return changed
@@ -0,0 +1,162 @@
+import ast
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from loguru import logger
+
+
+def normalize_query(query: str) -> str:
+    """Returns a canonical form of an analytics query string for use in cache keys.
+
+    JSON queries are re-serialised compactly, and other Python literals are replaced by
+    their `repr`, so quoting and whitespace outside of strings do not produce separate
+    cache entries. Key order is preserved because it is significant in pipeline stages
+    such as `$sort`, and the `repr` keeps integer and string keys, and tuples and lists,
+    apart. Anything else is used as is, since rewriting it could merge queries that
+    differ inside string values.
+    """
+    try:
+        return "json:" + json.dumps(
+            json.loads(query), separators=(",", ":"), ensure_ascii=False
+        )
+    except ValueError:
+        pass
+    try:
+        return "literal:" + repr(ast.literal_eval(query))
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return "raw:" + query
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at", "generation")
+
+    def __init__(self, value: Any, stored_at: float, generation: Tuple[int, int]):
+        self.value = value
+        self.stored_at = stored_at
+        self.generation = generation
+
+
+class AnalyticsCache:
+    """A TTL cache of form analytics results, keyed by form, normalized query and paging.
+
+    Entries younger than `ttl` seconds are returned directly. Entries older than `ttl`
+    but younger than `ttl + stale_ttl` are returned immediately while a refresh runs in
+    the background on up to `max_refresh_workers` threads (stale-while-revalidate); pass
+    `stale_ttl=0` to always reload expired entries synchronously. Older entries are
+    reloaded synchronously. All entries of a form are dropped by `invalidate_form`,
+    which `FormOperations` calls when that form's definition is updated or deleted.
+    `close` stops the refresh threads.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        stale_ttl: float = 60.0,
+        max_entries: int = 256,
+        max_refresh_workers: int = 2,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_refresh_workers = max_refresh_workers
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._generation = 0
+        self._generations: Dict[str, int] = {}
+        self._refreshing: Set[Tuple[str, Hashable]] = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def make_key(kind: str, query: str, **params: Any) -> Hashable:
+        return (kind, normalize_query(query), tuple(sorted(params.items())))
+
+    def get_or_load(
+        self, form_id: str, key: Hashable, loader: Callable[[], Any]
+    ) -> Any:
+        """Returns the cached value for `key`, calling `loader` when it is missing or expired."""
+        cache_key = (form_id, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            generation = self._generation_of(form_id)
+            if entry is not None and entry.generation == generation:
+                age = now - entry.stored_at
+                if age < self.ttl:
+                    self._entries.move_to_end(cache_key)
+                    return entry.value
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(cache_key)
+                    if cache_key not in self._refreshing:
+                        self._refreshing.add(cache_key)
+                        self._refresh_executor().submit(
+                            self._refresh, cache_key, loader, generation
+                        )
+                    return entry.value
+
+        value = loader()
+        self._store(cache_key, value, generation)
+        return value
+
+    def invalidate_form(self, form_id: str) -> None:
+        with self._lock:
+            self._generations[form_id] = self._generations.get(form_id, 0) + 1
+            for cache_key in [key for key in self._entries if key[0] == form_id]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            # Also discards the results of loads in flight, whatever their form.
+            self._generation += 1
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Shuts down the background refresh threads; a later refresh starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            # Cancelled refreshes never clear their keys themselves.
+            self._refreshing.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _generation_of(self, form_id: str) -> Tuple[int, int]:
+        return self._generation, self._generations.get(form_id, 0)
+
+    def _refresh_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_refresh_workers,
+                thread_name_prefix="weavaidev-analytics-cache",
+            )
+        return self._executor
+
+    def _refresh(
+        self,
+        cache_key: Tuple[str, Hashable],
+        loader: Callable[[], Any],
+        generation: Tuple[int, int],
+    ) -> None:
+        try:
+            self._store(cache_key, loader(), generation)
+        except Exception as exc:
+            logger.warning(f"Background refresh of analytics result failed: {exc}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(cache_key)
+
+    def _store(
+        self, cache_key: Tuple[str, Hashable], value: Any, generation: Tuple[int, int]
+    ):
+        with self._lock:
+            # A definition change or clear while loading makes the result unsafe to cache.
+            if self._generation_of(cache_key[0]) != generation:
+                return
+            self._entries[cache_key] = _Entry(value, time.monotonic(), generation)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
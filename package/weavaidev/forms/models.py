@@ -182,3 +182,21 @@ class FormInstances(BaseModel):
 
 class DownloadQueryResultResponse(BaseModel):
     docs: Optional[List[Dict[str, Any]]] = []
+
+
+class FormInstanceSyncResult(BaseModel):
+    seen: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+class BulkFormOperationResult(BaseModel):
+    index: int
+    form_id: Optional[str] = ""
+    action: Literal["create", "update", "delete", "skip"]
+    applied: bool = False
+    changed_attributes: List[str] = []
+    response: Optional[Union[CreateFormResponse, GetFormDefinitonResponse]] = None
+    error: Optional[str] = None
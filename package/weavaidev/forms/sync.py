@@ -0,0 +1,202 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from weavaidev.forms.models import (
+    FilterFormInstanceRequest,
+    FormInstanceDetail,
+    FormInstanceSyncResult,
+)
+
+if TYPE_CHECKING:
+    from weavaidev.forms import FormOperations
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS form_instances (
+    doc_id TEXT NOT NULL,
+    form_id TEXT NOT NULL,
+    file_name TEXT,
+    status TEXT,
+    category TEXT,
+    owner_id TEXT,
+    in_folders TEXT,
+    modified_at TEXT,
+    instance_status TEXT,
+    data TEXT,
+    synced_at TEXT,
+    PRIMARY KEY (doc_id, form_id)
+);
+"""
+
+_UPSERT = """
+INSERT INTO form_instances (
+    doc_id, form_id, file_name, status, category, owner_id, in_folders,
+    modified_at, instance_status, data, synced_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (doc_id, form_id) DO UPDATE SET
+    file_name = excluded.file_name,
+    status = excluded.status,
+    category = excluded.category,
+    owner_id = excluded.owner_id,
+    in_folders = excluded.in_folders,
+    modified_at = excluded.modified_at,
+    instance_status = excluded.instance_status,
+    data = excluded.data,
+    synced_at = excluded.synced_at
+"""
+
+
+class FormInstanceSync:
+    """Keeps a local SQLite mirror of form instances, keyed by `doc_id` and `form_id`.
+
+    Each `run` lists the instances matching `form_data` with `iter_form_instances` and
+    writes only the instances whose `WeavMetadata.modified_at` or status differ from the
+    mirror, so the cost of writing scales with the amount of change. The instance filter
+    can neither filter nor sort on `modified_at`, so every run still lists the whole
+    filter scope; the listing is paged concurrently.
+    """
+
+    def __init__(
+        self,
+        operations: "FormOperations",
+        db_path: str,
+        form_data: Optional[FilterFormInstanceRequest] = None,
+        page_size: int = 100,
+        max_workers: int = 4,
+        batch_size: int = 500,
+    ):
+        self.operations = operations
+        self.db_path = db_path
+        self.form_data = form_data or FilterFormInstanceRequest(scope="all_documents")
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def run(self, prune: bool = False) -> FormInstanceSyncResult:
+        """Synchronises the mirror with the server and returns what changed.
+
+        Args:
+            prune (bool): A flag to delete mirrored instances of the filter's `form_id` that are no longer
+                returned. Requires a filter on `form_id` only, over all documents and every version. Defaults to
+                False.
+
+        Raises:
+            FormProcessingException: Raised if listing the form instances fails.
+            ValueError: Raised if `prune` is set and the filter has no `form_id`, also filters on status,
+                category, query or document, has a scope other than `all_documents` or sets `only_latest`, since
+                mirrored instances outside the listing would be deleted.
+
+        Returns:
+            FormInstanceSyncResult: The number of instances seen, inserted, updated, unchanged and deleted.
+        """
+        if prune and (
+            not self.form_data.form_id
+            or self.form_data.scope != "all_documents"
+            or self.form_data.only_latest
+            or self.form_data.status
+            or self.form_data.category
+            or self.form_data.query
+            or self.form_data.doc_id
+        ):
+            raise ValueError(
+                "prune requires a filter on form_id only, with the all_documents "
+                "scope and without only_latest"
+            )
+        result = FormInstanceSyncResult()
+        synced_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as connection:
+            known = self._load_state(connection)
+            seen = set()
+            batch: List[Tuple] = []
+            instances = self.operations.iter_form_instances(
+                self.form_data, page_size=self.page_size, max_workers=self.max_workers
+            )
+            for detail in instances:
+                key = (detail.doc_id, detail.form_id)
+                seen.add(key)
+                state = _instance_state(detail)
+                result.seen += 1
+                if key not in known:
+                    result.inserted += 1
+                elif known[key] != state:
+                    result.updated += 1
+                else:
+                    result.unchanged += 1
+                    continue
+                batch.append(_instance_row(detail, state, synced_at))
+                if len(batch) >= self.batch_size:
+                    connection.executemany(_UPSERT, batch)
+                    batch.clear()
+            if batch:
+                connection.executemany(_UPSERT, batch)
+
+            if prune:
+                stale = [key for key in known if key not in seen]
+                connection.executemany(
+                    "DELETE FROM form_instances WHERE doc_id = ? AND form_id = ?", stale
+                )
+                result.deleted = len(stale)
+        return result
+
+    def _load_state(
+        self, connection: sqlite3.Connection
+    ) -> Dict[Tuple[str, str], Tuple[Optional[str], Optional[str], Optional[str]]]:
+        query = "SELECT doc_id, form_id, modified_at, instance_status, status FROM form_instances"
+        params: List[str] = []
+        if self.form_data.form_id:
+            query += " WHERE form_id = ?"
+            params.append(self.form_data.form_id)
+        return {
+            (doc_id, form_id): (modified_at, instance_status, status)
+            for doc_id, form_id, modified_at, instance_status, status in connection.execute(
+                query, params
+            )
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Reads the mirrored form instances into a DataFrame."""
+        with self._connect() as connection:
+            frame = pd.read_sql_query("SELECT * FROM form_instances", connection)
+        frame["in_folders"] = frame["in_folders"].map(json.loads)
+        frame["data"] = frame["data"].map(json.loads)
+        return frame
+
+
+def _instance_state(
+    detail: FormInstanceDetail,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    metadata = detail.form_instance.metadata if detail.form_instance else None
+    if not metadata:
+        return None, None, detail.status
+    return metadata.modified_at, metadata.status, detail.status
+
+
+def _instance_row(detail: FormInstanceDetail, state: Tuple, synced_at: str) -> Tuple:
+    data = detail.form_instance.data if detail.form_instance else []
+    return (
+        detail.doc_id,
+        detail.form_id,
+        detail.file_name,
+        detail.status,
+        detail.category,
+        detail.owner_id,
+        json.dumps(detail.in_folders or []),
+        state[0],
+        state[1],
+        json.dumps([item.model_dump() for item in data or []], default=str),
+        synced_at,
+    )
@@ -0,0 +1,150 @@
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+import pandas as pd
+from weavaidev.forms.models import Field, FormInstanceDetail, GetFormDefinitonResponse
+
+INSTANCE_COLUMNS = [
+    "doc_id",
+    "form_id",
+    "file_name",
+    "status",
+    "category",
+    "owner_id",
+    "modified_at",
+]
+
+
+class FormInstanceTables(NamedTuple):
+    """Typed tables built from form instances.
+
+    `instances` has one row per form instance and one column per scalar field. A field
+    named like one of the `INSTANCE_COLUMNS` gets the column `field_<name>` instead.
+    `children` maps the name of every Table or array field to a child table keyed by
+    `doc_id`, `form_id` and `item_index`.
+    """
+
+    instances: pd.DataFrame
+    children: Dict[str, pd.DataFrame]
+
+
+def build_form_instance_tables(
+    definition: GetFormDefinitonResponse, instances: Iterable[FormInstanceDetail]
+) -> FormInstanceTables:
+    """Converts form instances into typed, columnar DataFrames using the form definition.
+
+    Values are gathered column by column in a single pass over the instances and each
+    column is then cast once according to its field type: Number fields become nullable
+    floats, Date fields UTC datetimes and Text fields strings. Values that cannot be cast
+    become missing. Table fields and `is_array` fields are exploded into child tables,
+    one row per table row or array item.
+
+    Args:
+        definition (GetFormDefinitonResponse): The form definition, as returned by `get_form_definition`.
+        instances (Iterable[FormInstanceDetail]): The form instances to convert.
+
+    Returns:
+        FormInstanceTables: The instance table and the child tables of Table and array fields.
+    """
+    fields = definition.fields or []
+    scalar_fields = [field for field in fields if not _is_child_field(field)]
+    child_fields = [field for field in fields if _is_child_field(field)]
+
+    metadata_columns: Dict[str, List[Any]] = {name: [] for name in INSTANCE_COLUMNS}
+    field_columns: Dict[str, List[Any]] = {field.name: [] for field in scalar_fields}
+    child_rows: Dict[str, Dict[str, List[Any]]] = {
+        field.name: {"doc_id": [], "form_id": [], "item_index": [], "value": []}
+        for field in child_fields
+    }
+
+    for detail in instances:
+        form_instance = detail.form_instance
+        values = {}
+        metadata = None
+        if form_instance is not None:
+            values = {item.name: item.value for item in form_instance.data or []}
+            metadata = form_instance.metadata or None
+        metadata_columns["doc_id"].append(detail.doc_id)
+        metadata_columns["form_id"].append(detail.form_id)
+        metadata_columns["file_name"].append(detail.file_name)
+        metadata_columns["status"].append(detail.status)
+        metadata_columns["category"].append(detail.category)
+        metadata_columns["owner_id"].append(detail.owner_id)
+        metadata_columns["modified_at"].append(
+            metadata.modified_at if metadata else None
+        )
+        for name, column in field_columns.items():
+            column.append(values.get(name))
+        for field in child_fields:
+            value = values.get(field.name)
+            if value is None:
+                continue
+            items = value if isinstance(value, list) else [value]
+            rows = child_rows[field.name]
+            rows["doc_id"].extend([detail.doc_id] * len(items))
+            rows["form_id"].extend([detail.form_id] * len(items))
+            rows["item_index"].extend(range(len(items)))
+            rows["value"].extend(items)
+
+    instance_frame = pd.DataFrame(metadata_columns, columns=INSTANCE_COLUMNS)
+    instance_frame["modified_at"] = pd.to_datetime(
+        instance_frame["modified_at"], errors="coerce", utc=True, format="mixed"
+    )
+    column_names = _field_column_names(field_columns)
+    field_types = {field.name: field.field_type for field in scalar_fields}
+    field_frame = pd.DataFrame(
+        {
+            column_names[name]: _cast(
+                pd.Series(column, dtype=object), field_types[name]
+            )
+            for name, column in field_columns.items()
+        },
+        index=instance_frame.index,
+    )
+    instance_frame = pd.concat([instance_frame, field_frame], axis=1)
+
+    children = {}
+    for field in child_fields:
+        rows = child_rows[field.name]
+        child = pd.DataFrame(
+            {key: rows[key] for key in ("doc_id", "form_id", "item_index")}
+        )
+        if field.field_type == "Table":
+            records = pd.DataFrame.from_records(
+                [
+                    row if isinstance(row, dict) else {"value": row}
+                    for row in rows["value"]
+                ]
+            )
+            child = pd.concat([child, records.convert_dtypes()], axis=1)
+        else:
+            child["value"] = _cast(
+                pd.Series(rows["value"], dtype=object), field.field_type
+            )
+        children[field.name] = child
+    return FormInstanceTables(instances=instance_frame, children=children)
+
+
+def _is_child_field(field: Field) -> bool:
+    return field.field_type == "Table" or field.is_array
+
+
+def _field_column_names(field_names: Iterable[str]) -> Dict[str, str]:
+    taken = set(INSTANCE_COLUMNS)
+    names = {}
+    for name in field_names:
+        column = name
+        while column in taken:
+            column = f"field_{column}"
+        taken.add(column)
+        names[name] = column
+    return names
+
+
+def _cast(values: pd.Series, field_type: str) -> pd.Series:
+    if field_type == "Number":
+        return pd.to_numeric(values, errors="coerce").astype("Float64")
+    if field_type == "Date":
+        return pd.to_datetime(values, errors="coerce", utc=True, format="mixed")
+    if field_type == "Text":
+        return values.astype("string")
+    return values
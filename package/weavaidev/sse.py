@@ -0,0 +1,262 @@
+import time
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import requests
+from pydantic import BaseModel
+from weavaidev.utils import aiter_in_thread
+
+DEFAULT_RETRY_MILLISECONDS = 3000
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class ServerSentEvent(NamedTuple):
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class StreamMetrics(BaseModel):
+    """Timings of a streamed response, in seconds since the request was sent."""
+
+    time_to_headers: Optional[float] = None
+    time_to_first_byte: Optional[float] = None
+    time_to_first_event: Optional[float] = None
+    time_to_last_byte: Optional[float] = None
+    bytes_received: int = 0
+    events_received: int = 0
+    reconnects: int = 0
+
+
+class SSEDecoder:
+    """An incremental decoder of `text/event-stream` bodies, fed with raw byte chunks.
+
+    Framing follows the HTML event-stream rules: lines end with CR, LF or CRLF (also
+    across chunk boundaries), a leading UTF-8 BOM is dropped, lines starting with `:`
+    are comments, consecutive `data` fields are joined with newlines, and an event is
+    dispatched on a blank line only if it has data. Fields are kept as bytes until an
+    event is dispatched, so each event costs a single decode of its data.
+
+    `last_event_id` persists across events and is what a client sends back in the
+    `Last-Event-ID` header when reconnecting; `retry` holds the latest reconnection
+    delay, in milliseconds, announced by the server. A trailing event that is not
+    terminated by a blank line when the stream ends is discarded.
+    """
+
+    __slots__ = (
+        "last_event_id",
+        "retry",
+        "_pending",
+        "_pending_cr",
+        "_started",
+        "_event",
+        "_data",
+        "_event_retry",
+    )
+
+    def __init__(self, last_event_id: Optional[str] = None):
+        self.last_event_id = last_event_id
+        self.retry: Optional[int] = None
+        self._pending: List[bytes] = []
+        self._pending_cr = False
+        self._started = False
+        self._event = b""
+        self._data: List[bytes] = []
+        self._event_retry: Optional[int] = None
+
+    def reset(self) -> None:
+        """Drops any partially received event while keeping `last_event_id` and `retry`."""
+        self._pending.clear()
+        self._pending_cr = False
+        self._started = False
+        self._event = b""
+        self._data = []
+        self._event_retry = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Decodes a chunk of the body and returns the events it completes."""
+        chunk = self._complete_lines(chunk)
+        if chunk is None:
+            return []
+
+        events = []
+        data = self._data
+        for line in chunk.split(b"\n"):
+            if not line:
+                if data:
+                    events.append(
+                        ServerSentEvent(
+                            self._event.decode("utf-8", "replace") or "message",
+                            b"\n".join(data).decode("utf-8", "replace"),
+                            self.last_event_id,
+                            self._event_retry,
+                        )
+                    )
+                    data = self._data = []
+                self._event = b""
+                self._event_retry = None
+                continue
+            if line[0] == 0x3A:
+                continue
+            field, colon, value = line.partition(b":")
+            if colon and value[:1] == b" ":
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            else:
+                self._set_field(field, value)
+        return events
+
+    def _complete_lines(self, chunk: bytes) -> Optional[bytes]:
+        # Strips the BOM, normalizes line endings to LF and returns the complete lines
+        # received so far without their final LF, keeping any unterminated line pending.
+        if not self._started:
+            head = b"".join(self._pending) + chunk
+            self._pending.clear()
+            if len(head) < len(_BOM) and _BOM.startswith(head):
+                self._pending.append(head)
+                return None
+            self._started = True
+            chunk = head[len(_BOM) :] if head.startswith(_BOM) else head
+
+        if self._pending_cr and chunk[:1] == b"\n":
+            chunk = chunk[1:]
+        self._pending_cr = chunk[-1:] == b"\r"
+        if b"\r" in chunk:
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if b"\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return None
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = b"".join(self._pending)
+            self._pending.clear()
+
+        complete, _, rest = chunk.rpartition(b"\n")
+        if rest:
+            self._pending.append(rest)
+        return complete
+
+    def _set_field(self, field: bytes, value: bytes) -> None:
+        if field == b"event":
+            self._event = value
+        elif field == b"id":
+            if b"\0" not in value:
+                self.last_event_id = value.decode("utf-8", "replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = self._event_retry = int(value)
+
+
+def iter_sse_events(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    """Decodes an iterable of body chunks into server-sent events."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+
+class EventStream:
+    """Reads server-sent events from a streamed `requests` response as they arrive.
+
+    The response must have been requested with `stream=True`; `started_at` is the
+    `time.perf_counter()` value taken just before sending the request and is the origin
+    of the timings in `metrics`. The connection is closed when iteration ends, or
+    earlier with `close`, which also makes the stream usable as a context manager.
+
+    When `reconnect` is given, a connection lost mid-stream is re-established up to
+    `max_reconnects` times: after waiting for the server's `retry` delay (or
+    `DEFAULT_RETRY_MILLISECONDS`), `reconnect` is called with the last event ID, which
+    it should send as the `Last-Event-ID` header, and must return the new response.
+    Attempts whose request fails to connect are retried the same way while attempts
+    remain. `reconnect` usually sends the original request again, so a server that
+    ignores `Last-Event-ID` starts the response over.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        started_at: float,
+        reconnect: Optional[Callable[[Optional[str]], requests.Response]] = None,
+        max_reconnects: int = 0,
+    ):
+        self.response = response
+        self.started_at = started_at
+        self.reconnect = reconnect
+        self.max_reconnects = max_reconnects
+        self.decoder = SSEDecoder()
+        self.metrics = StreamMetrics(time_to_headers=self.elapsed())
+
+    def __enter__(self) -> "EventStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[ServerSentEvent]:
+        metrics = self.metrics
+        try:
+            while True:
+                try:
+                    for chunk in self.iter_bytes():
+                        for event in self.decoder.feed(chunk):
+                            if metrics.time_to_first_event is None:
+                                metrics.time_to_first_event = self.elapsed()
+                            metrics.events_received += 1
+                            yield event
+                    return
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                ) as exc:
+                    if self.reconnect is None:
+                        raise
+                    error = exc
+                self._reconnect(error)
+        finally:
+            self.close()
+
+    def __aiter__(self) -> AsyncIterator[ServerSentEvent]:
+        return aiter_in_thread(iter(self), self.close)
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Yields raw body chunks as they are received, recording byte timings."""
+        for chunk in self.response.iter_content(chunk_size=None):
+            if not chunk:
+                continue
+            if self.metrics.time_to_first_byte is None:
+                self.metrics.time_to_first_byte = self.elapsed()
+            self.metrics.bytes_received += len(chunk)
+            yield chunk
+        self.metrics.time_to_last_byte = self.elapsed()
+
+    def close(self) -> None:
+        self.response.close()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def _reconnect(self, error: Exception) -> None:
+        # Every attempt, including one whose request fails to connect, counts against
+        # `max_reconnects`; the last connection error is raised once they run out.
+        self.response.close()
+        self.decoder.reset()
+        while self.metrics.reconnects < self.max_reconnects:
+            self.metrics.reconnects += 1
+            retry = self.decoder.retry
+            time.sleep((DEFAULT_RETRY_MILLISECONDS if retry is None else retry) / 1000)
+            try:
+                self.response = self.reconnect(self.decoder.last_event_id)
+                return
+            except requests.exceptions.ConnectionError as exc:
+                error = exc
+        raise error
@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from weavaidev.utils import RateLimiter
+
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class TransportMetrics(BaseModel):
+    """Counters of the requests sent through a `WeavSession`."""
+
+    requests: int = 0
+    failures: int = 0
+    responses_by_status: Dict[int, int] = Field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    rate_limited_seconds: float = 0.0
+
+
+class WeavSession(requests.Session):
+    """A `requests.Session` shared by the operations of a `WeavClient`.
+
+    Connections to each host are kept alive in a pool of up to `pool_maxsize`
+    connections, so concurrent helpers such as `iter_concurrently` reuse them instead of
+    opening a connection per request. When `requests_per_second` is given, every request
+    first waits on a token bucket allowing bursts of `burst` requests. Every request is
+    counted in `metrics`: `failures` are requests that raised before a response arrived,
+    `elapsed_seconds` sums the time until the response headers and
+    `rate_limited_seconds` the time spent waiting on the rate limit.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+    ):
+        super().__init__()
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.rate_limiter = None
+        if requests_per_second is not None:
+            self.rate_limiter = RateLimiter(requests_per_second, burst=burst)
+        self._metrics = TransportMetrics()
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def metrics(self) -> TransportMetrics:
+        """A copy of the counters accumulated since creation or the last `reset_metrics`."""
+        with self._metrics_lock:
+            return self._metrics.model_copy(deep=True)
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self._metrics = TransportMetrics()
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        waited = 0.0
+        if self.rate_limiter is not None:
+            started_at = time.perf_counter()
+            self.rate_limiter.acquire()
+            waited = time.perf_counter() - started_at
+        started_at = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            self._record(None, time.perf_counter() - started_at, waited)
+            raise
+        self._record(response.status_code, time.perf_counter() - started_at, waited)
+        return response
+
+    def _record(
+        self, status_code: Optional[int], elapsed: float, rate_limited: float
+    ) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics
+            metrics.requests += 1
+            metrics.elapsed_seconds += elapsed
+            metrics.rate_limited_seconds += rate_limited
+            if status_code is None:
+                metrics.failures += 1
+            else:
+                metrics.responses_by_status[status_code] = (
+                    metrics.responses_by_status.get(status_code, 0) + 1
+                )
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import requests
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_CSV_CHUNK_SIZE = 10_000
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+    read_ahead: Optional[int] = None,
+) -> Iterator[R]:
+    """Applies `func` to `items` in a thread pool and yields the results in input order.
+
+    At most `read_ahead` calls (default `2 * max_workers`) are in flight or buffered at
+    any time, so memory stays bounded however many items there are. Pending calls are
+    cancelled if the consumer stops iterating early, and the first exception raised by
+    `func` propagates to the consumer.
+    """
+    read_ahead = max(read_ahead or 2 * max_workers, 1)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+    try:
+        pending = deque(
+            executor.submit(func, item) for item in islice(items, read_ahead)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(items, 1):
+                pending.append(executor.submit(func, item))
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_as_completed(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+    read_ahead: Optional[int] = None,
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    """Applies `func` to `items` in a thread pool and yields `(item, future)` as calls finish.
+
+    Unlike `iter_concurrently`, results are yielded in completion order and exceptions
+    are not raised, so the caller can inspect each future. At most `read_ahead` calls
+    (default `2 * max_workers`) are outstanding at a time.
+    """
+    read_ahead = max(read_ahead or 2 * max_workers, 1)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+    try:
+        pending = {
+            executor.submit(func, item): item for item in islice(items, read_ahead)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(items, 1):
+                    pending[executor.submit(func, next_item)] = next_item
+                yield item, future
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_in_thread(
+    iterator: Iterator[T], close: Optional[Callable[[], None]] = None
+) -> AsyncIterator[T]:
+    """Exposes a blocking iterator as an async iterator, advancing it in a worker thread.
+
+    Each item is produced by the default executor of the running loop, so the event loop
+    is never blocked on network reads. `close` is called once iteration ends, including
+    when the consumer stops early or is cancelled; closing the underlying connection
+    there also unblocks a read that is still in progress.
+    """
+    loop = asyncio.get_running_loop()
+    exhausted = object()
+    try:
+        while True:
+            item = await loop.run_in_executor(None, next, iterator, exhausted)
+            if item is exhausted:
+                return
+            yield item
+    finally:
+        if close is not None:
+            close()
+
+
+class RateLimiter:
+    """A thread-safe token bucket allowing `rate` calls per second with bursts of `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+def iter_csv_chunks(
+    response: requests.Response,
+    chunksize: int = DEFAULT_CSV_CHUNK_SIZE,
+    dtype: Optional[Dict[str, str]] = None,
+) -> Iterator["pd.DataFrame"]:
+    """Parses a streamed CSV response body into DataFrames of at most `chunksize` rows.
+
+    The body is read from the open connection as the parser consumes it, so only the
+    rows of the current chunk are held in memory. The response is closed once the
+    iterator is exhausted or discarded. A body with a header but no rows yields one
+    empty DataFrame with the header's columns; an empty body yields nothing.
+    """
+    # Imported here so that the helpers of services without DataFrames do not import pandas.
+    import pandas as pd
+
+    response.raw.decode_content = True
+    with response:
+        try:
+            reader = pd.read_csv(response.raw, chunksize=chunksize, dtype=dtype)
+        except pd.errors.EmptyDataError:
+            return
+        with reader:
+            yield from reader
+
+
+def write_dataframe_chunks(
+    chunks: Iterable["pd.DataFrame"],
+    output_path: str,
+    file_format: Literal["CSV", "PARQUET"] = "CSV",
+    schema: Optional[Any] = None,
+) -> int:
+    """Writes DataFrame chunks to a single CSV or Parquet file and returns the row count.
+
+    Parquet output requires the optional `pyarrow` dependency; unless a `pyarrow.Schema`
+    is given as `schema`, it is taken from the first chunk, so pass explicit dtypes when
+    columns may be empty in early chunks. The file is written even without chunks: an
+    empty CSV file, or a Parquet file without rows with `schema`, or no columns.
+    """
+    rows = 0
+    if file_format == "CSV":
+        written = False
+        for index, chunk in enumerate(chunks):
+            chunk.to_csv(
+                output_path,
+                mode="w" if index == 0 else "a",
+                header=index == 0,
+                index=False,
+            )
+            rows += len(chunk)
+            written = True
+        if not written:
+            open(output_path, "w").close()
+        return rows
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output requires pyarrow, install it with `pip install weavaidev[parquet]`"
+        ) from exc
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                writer = pq.ParquetWriter(output_path, table.schema)
+            else:
+                table = pa.Table.from_pandas(
+                    chunk, schema=writer.schema, preserve_index=False
+                )
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        pq.write_table((schema or pa.schema([])).empty_table(), output_path)
+    return rows
@@ -1,6 +1,8 @@
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
+import pandas as pd
 import requests
+import urllib3
 from loguru import logger
 from weavaidev import Config
 from weavaidev.config_models import (
@@ -9,8 +11,18 @@ from weavaidev.config_models import (
     ServiceType,
     get_base_url,
 )
+from weavaidev.utils import RateLimiter, iter_as_completed, iter_concurrently
+from weavaidev.workflows.analysis import analyze_workflow_runs
 from weavaidev.workflows.exceptions import WorkflowException
+from weavaidev.workflows.journal import (
+    ACCEPTED,
+    DISPATCHING,
+    FAILED,
+    UNKNOWN,
+    DispatchJournal,
+)
 from weavaidev.workflows.models import (
+    DocumentRun,
     DocumentWorkflowRunsResponse,
     GetAllWorkflowsResponse,
     RunWorkflowResponse,
@@ -18,13 +30,16 @@ from weavaidev.workflows.models import (
     Workflow,
     WorkflowRequest,
     WorkflowStatusResponse,
+    WorkflowTimingReport,
 )
+from weavaidev.workflows.tracker import WorkflowRunTracker
 
 
 class WorkflowOperations:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[requests.Session] = None):
         self.config = config
         self.endpoints = ServiceEndpoints()
+        self.session = session if session is not None else requests.Session()
         self.base_url = get_base_url(config=config, service=ServiceType.WORKFLOWS)
 
     def get_all_workflows(
@@ -50,7 +65,7 @@ class WorkflowOperations:
             workflows. The workflows are retrieved in JSON format.
         """
         url = f"{self.base_url}/{self.endpoints.GET_ALL_WORKFLOWS}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             params=[("show_internal_steps", show_internal_steps)],
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -93,7 +108,7 @@ class WorkflowOperations:
             `Workflow` model.
         """
         url = f"{self.base_url}{self.endpoints.GET_SINGLE_WORKFLOW.format(WORKFLOW_NAME=workflow_name)}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             params=[("show_internal_steps", show_internal_steps)],
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -143,7 +158,7 @@ class WorkflowOperations:
         """
         request_data = SkipStepsInWorkflowRequest(tasks=list(tasks))
         url = f"{self.base_url}/{self.endpoints.SKIP_TASK_IN_WORKFLOW.format(WORKFLOW_NAME=workflow_name)}"
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=request_data.tasks,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -196,7 +211,7 @@ class WorkflowOperations:
         """
         request_data = WorkflowRequest(doc_id=doc_id, data=data)
         url = f"{self.base_url}/{self.endpoints.RERUN_WORKFLOW.format(WORKFLOW_NAME=workflow_name)}"
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=request_data.model_dump(),
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -248,7 +263,7 @@ class WorkflowOperations:
         """
         request_data = WorkflowRequest(doc_id=doc_id, data=data)
         url = f"{self.base_url}/{self.endpoints.RUN_WORKFLOW.format(WORKFLOW_NAME=workflow_name)}"
-        response = requests.post(
+        response = self.session.post(
             url=url,
             json=request_data.model_dump(),
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -304,7 +319,7 @@ class WorkflowOperations:
             the `WorkflowStatusResponse` model.
         """
         url = f"{self.base_url}/{self.endpoints.WORKFLOW_STATUS.format(WORKFLOW_ID=workflow_id,WORKFLOW_RUN_ID=workflow_run_id)}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             params=[("show_internal_steps", show_internal_steps)],
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -365,7 +380,7 @@ class WorkflowOperations:
             (name, value) for name, value in params if value not in ("", None)
         ]
         url = f"{self.base_url}/{self.endpoints.WORKFLOW_RUNS}"
-        response = requests.get(
+        response = self.session.get(
             url=url,
             params=filtered_params,
             headers={"Authorization": f"Bearer {self.config.auth_token._secret_value}"},
@@ -389,3 +404,307 @@ class WorkflowOperations:
                 response_data=response.json(),
             )
         return DocumentWorkflowRunsResponse.model_validate(response.json())
+
+    def iter_workflow_runs_for_document(
+        self,
+        doc_id: str,
+        state: str = "success",
+        query: str = "",
+        page_size: int = 100,
+        max_workers: int = 4,
+    ) -> Iterator[DocumentRun]:
+        """Iterates over every workflow run of a document, fetching pages concurrently.
+
+        The first page is fetched to learn `DocumentWorkflowRunsResponse.total`; the
+        remaining pages are then requested in parallel and their runs yielded in order.
+
+        Args:
+            doc_id (str): The document ID for which workflow runs are to be fetched.
+            state (str, optional): Filter the workflow runs by their state. Defaults to "success".
+            query (str, optional): A search query to filter the workflow runs. Defaults to "".
+            page_size (int, optional): The number of runs requested per page. Defaults to 100.
+            max_workers (int, optional): The maximum number of pages fetched concurrently. Defaults to 4.
+
+        Raises:
+            WorkflowException: Raised if authentication fails (status code 401), or if any other error
+                occurs while fetching the workflow runs.
+
+        Returns:
+            Iterator[DocumentRun]: An iterator over the workflow runs of the document.
+        """
+
+        def fetch_page(skip: int) -> DocumentWorkflowRunsResponse:
+            return self.get_workflow_runs_for_document(
+                doc_id, state=state, query=query, skip=skip, limit=page_size
+            )
+
+        first_page = fetch_page(0)
+        yield from first_page.docs
+        offsets = range(page_size, first_page.total, page_size)
+        for page in iter_concurrently(fetch_page, offsets, max_workers=max_workers):
+            yield from page.docs
+
+    def get_workflow_runs_dataframe(
+        self,
+        doc_ids: Iterable[str],
+        state: str = "success",
+        query: str = "",
+        page_size: int = 100,
+        max_workers: int = 8,
+    ) -> pd.DataFrame:
+        """Collects the workflow runs of many documents into a single DataFrame.
+
+        Documents are processed in parallel, each paged with `iter_workflow_runs_for_document`,
+        and runs are appended column by column as they arrive. `start_date`, `end_date` and
+        `created_at` are parsed into UTC datetimes; unparseable values become `NaT`.
+
+        Args:
+            doc_ids (Iterable[str]): The IDs of the documents whose runs are fetched.
+            state (str, optional): Filter the workflow runs by their state. Defaults to "success".
+            query (str, optional): A search query to filter the workflow runs. Defaults to "".
+            page_size (int, optional): The number of runs requested per page. Defaults to 100.
+            max_workers (int, optional): The maximum number of documents fetched concurrently. Defaults to 8.
+
+        Raises:
+            WorkflowException: Raised if the workflow runs of any document cannot be fetched.
+
+        Returns:
+            pd.DataFrame: One row per `DocumentRun`.
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in DocumentRun.model_fields}
+        runs_per_document = iter_concurrently(
+            lambda doc_id: list(
+                self.iter_workflow_runs_for_document(
+                    doc_id, state=state, query=query, page_size=page_size, max_workers=1
+                )
+            ),
+            doc_ids,
+            max_workers=max_workers,
+        )
+        for runs in runs_per_document:
+            for run in runs:
+                for name, values in columns.items():
+                    values.append(getattr(run, name))
+        frame = pd.DataFrame(columns, columns=list(columns))
+        for name in ("start_date", "end_date", "created_at"):
+            frame[name] = pd.to_datetime(
+                frame[name].replace("", None), errors="coerce", utc=True, format="mixed"
+            )
+        return frame
+
+    def run_workflow_many(
+        self,
+        workflow_name: str,
+        doc_ids: Iterable[str],
+        data: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = None,
+        journal_path: Optional[str] = None,
+        retry_unknown: bool = False,
+    ) -> Iterator[RunWorkflowResponse]:
+        """Runs a workflow on many documents concurrently, yielding runs as they are accepted.
+
+        Requests are dispatched by up to `max_workers` threads and optionally throttled to
+        `requests_per_second`. With a `journal_path`, every dispatch is recorded in a
+        `DispatchJournal` so that a restarted dispatcher does not submit the same document
+        twice. Documents whose request was never sent or was rejected with a 4xx status
+        are logged, journaled as failed and retried on the next run. When the outcome is
+        ambiguous, such as after a read timeout or a 5xx status, the run may have started
+        anyway, so the document is journaled as unknown and, like a document left
+        dispatching by a crash, only dispatched again with `retry_unknown`. A document
+        listed more than once in `doc_ids` is dispatched once.
+
+        Args:
+            workflow_name (str): The name of the workflow to be executed.
+            doc_ids (Iterable[str]): The IDs of the documents to run the workflow on.
+            data (Optional[Dict[str, Any]]): The data passed to every run. Defaults to an empty dictionary.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 8.
+            requests_per_second (Optional[float]): The maximum request rate, or None for no limit. Defaults to None.
+            journal_path (Optional[str]): The path of a JSON Lines journal used to resume interrupted dispatches. Defaults to None.
+            retry_unknown (bool): Whether to dispatch the journaled documents whose outcome is unknown again. Defaults to
+                False.
+
+        Returns:
+            Iterator[RunWorkflowResponse]: The accepted runs, in completion order.
+        """
+        return self._dispatch_many(
+            "run",
+            self.run_workflow,
+            workflow_name,
+            doc_ids,
+            data,
+            max_workers,
+            requests_per_second,
+            journal_path,
+            retry_unknown,
+        )
+
+    def rerun_workflow_many(
+        self,
+        workflow_name: str,
+        doc_ids: Iterable[str],
+        data: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = None,
+        journal_path: Optional[str] = None,
+        retry_unknown: bool = False,
+    ) -> Iterator[RunWorkflowResponse]:
+        """Re-runs a workflow on many documents concurrently, yielding runs as they are accepted.
+
+        Behaves like `run_workflow_many`, using `rerun_workflow` for each document.
+
+        Args:
+            workflow_name (str): The name of the workflow to be re-run.
+            doc_ids (Iterable[str]): The IDs of the documents to re-run the workflow on.
+            data (Optional[Dict[str, Any]]): The data passed to every re-run. Defaults to an empty dictionary.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 8.
+            requests_per_second (Optional[float]): The maximum request rate, or None for no limit. Defaults to None.
+            journal_path (Optional[str]): The path of a JSON Lines journal used to resume interrupted dispatches. Defaults to None.
+            retry_unknown (bool): Whether to dispatch the journaled documents whose outcome is unknown again. Defaults to
+                False.
+
+        Returns:
+            Iterator[RunWorkflowResponse]: The accepted re-runs, in completion order.
+        """
+        return self._dispatch_many(
+            "rerun",
+            self.rerun_workflow,
+            workflow_name,
+            doc_ids,
+            data,
+            max_workers,
+            requests_per_second,
+            journal_path,
+            retry_unknown,
+        )
+
+    def _dispatch_many(
+        self,
+        action: str,
+        dispatch: Callable[[str, str, Dict[str, Any]], RunWorkflowResponse],
+        workflow_name: str,
+        doc_ids: Iterable[str],
+        data: Optional[Dict[str, Any]],
+        max_workers: int,
+        requests_per_second: Optional[float],
+        journal_path: Optional[str],
+        retry_unknown: bool,
+    ) -> Iterator[RunWorkflowResponse]:
+        journal = DispatchJournal(journal_path) if journal_path else None
+        limiter = RateLimiter(requests_per_second) if requests_per_second else None
+
+        def pending_doc_ids() -> Iterator[str]:
+            seen = set()
+            for doc_id in doc_ids:
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                if journal is None or journal.should_dispatch(
+                    action, workflow_name, doc_id, retry_unknown=retry_unknown
+                ):
+                    yield doc_id
+                elif journal.state(action, workflow_name, doc_id)["state"] in (
+                    DISPATCHING,
+                    UNKNOWN,
+                ):
+                    logger.warning(
+                        f"Skipping {doc_id}: the outcome of a previous {action} of "
+                        f"{workflow_name} is unknown, pass retry_unknown=True to "
+                        "dispatch it again"
+                    )
+
+        def submit(doc_id: str) -> RunWorkflowResponse:
+            if limiter is not None:
+                limiter.acquire()
+            if journal is not None:
+                journal.record(action, workflow_name, doc_id, DISPATCHING)
+            return dispatch(workflow_name, doc_id, data or {})
+
+        completed = iter_as_completed(
+            submit, pending_doc_ids(), max_workers=max_workers
+        )
+        for doc_id, future in completed:
+            error = future.exception()
+            if error is not None:
+                logger.warning(
+                    f"Failed to {action} {workflow_name} for {doc_id}: {error}"
+                )
+                if journal is not None:
+                    state = FAILED if _was_not_accepted(error) else UNKNOWN
+                    journal.record(
+                        action, workflow_name, doc_id, state, error=str(error)
+                    )
+                continue
+            result = future.result()
+            if journal is not None:
+                journal.record(
+                    action, workflow_name, doc_id, ACCEPTED, run_id=result.run_id
+                )
+            yield result
+
+    def analyze_workflow_runs(
+        self,
+        workflow_name: str,
+        runs: Iterable[RunWorkflowResponse],
+        max_workers: int = 8,
+        show_internal_steps: bool = False,
+    ) -> WorkflowTimingReport:
+        """Fetches a workflow and the statuses of many of its runs and analyzes their timing.
+
+        Statuses are fetched concurrently and combined with the workflow's task DAG by
+        `analyze_workflow_runs` in `weavaidev.workflows.analysis`.
+
+        Args:
+            workflow_name (str): The name of the workflow whose runs are analyzed.
+            runs (Iterable[RunWorkflowResponse]): The runs to analyze.
+            max_workers (int): The maximum number of statuses fetched concurrently. Defaults to 8.
+            show_internal_steps (bool): A flag to include internal steps in the DAG and statuses. Defaults to False.
+
+        Raises:
+            WorkflowException: Raised if the workflow or any run status cannot be fetched.
+
+        Returns:
+            WorkflowTimingReport: Per-task duration percentiles, queue versus run time, the critical path and the bottlenecks.
+        """
+        workflow = self.get_single_workflow(
+            workflow_name, show_internal_steps=show_internal_steps
+        )
+        statuses = iter_concurrently(
+            lambda run: self.get_workflow_status(
+                run.workflow_id, run.run_id, show_internal_steps=show_internal_steps
+            ),
+            runs,
+            max_workers=max_workers,
+        )
+        return analyze_workflow_runs(workflow, statuses)
+
+    def track_workflow_runs(
+        self, runs: Iterable[RunWorkflowResponse], **tracker_options: Any
+    ) -> WorkflowRunTracker:
+        """Starts polling the status of many workflow runs from a single scheduler.
+
+        Args:
+            runs (Iterable[RunWorkflowResponse]): The runs returned by `run_workflow` or `rerun_workflow`.
+            **tracker_options: Polling options passed to `WorkflowRunTracker`, such as `min_interval`,
+                `max_interval` or `max_workers`.
+
+        Returns:
+            WorkflowRunTracker: The tracker polling the runs. More runs can be added with `track`, and
+            completions observed with `as_completed`, `wait`, `wait_for` or callbacks.
+        """
+        tracker = WorkflowRunTracker(self, **tracker_options)
+        tracker.track_many(runs)
+        return tracker
+
+
+def _was_not_accepted(error: BaseException) -> bool:
+    """Whether a dispatch error proves that the server did not start the run."""
+    if isinstance(error, WorkflowException):
+        return isinstance(error.status_code, int) and 400 <= error.status_code < 500
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        # Refused connections and failed DNS lookups never sent the request.
+        reason = getattr(error.args[0], "reason", None)
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
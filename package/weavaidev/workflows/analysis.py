@@ -0,0 +1,170 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from weavaidev.workflows.models import (
+    TaskTiming,
+    Workflow,
+    WorkflowStatusResponse,
+    WorkflowTimingReport,
+)
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def analyze_workflow_runs(
+    workflow: Workflow,
+    statuses: Iterable[WorkflowStatusResponse],
+    max_bottlenecks: int = 3,
+) -> WorkflowTimingReport:
+    """Combines a workflow's task DAG with the statuses of many runs into a timing report.
+
+    For every task, the run time is the time between its `start_date` and `end_date`,
+    and the queue time is the time between the moment it became ready (the latest end of
+    its upstream tasks, or the start of the run for root tasks) and its `start_date`.
+    The critical path is the longest path through the DAG weighted by each task's median
+    queue plus run time; its heaviest tasks are reported as bottlenecks, the natural
+    candidates for `skip_steps_in_workflow`.
+
+    Args:
+        workflow (Workflow): The workflow definition, as returned by `get_single_workflow`.
+        statuses (Iterable[WorkflowStatusResponse]): The statuses of the runs to analyze.
+        max_bottlenecks (int): The maximum number of bottleneck tasks to report. Defaults to 3.
+
+    Returns:
+        WorkflowTimingReport: Per-task duration percentiles, the critical path and the bottlenecks.
+            Use `to_dataframe()` for a per-task DataFrame or `model_dump_json()` for a JSON report.
+    """
+    upstream: Dict[str, List[str]] = defaultdict(list)
+    for task in workflow.tasks:
+        for downstream in task.downstream_tasks:
+            upstream[downstream].append(task.name)
+
+    run_seconds: Dict[str, List[float]] = defaultdict(list)
+    queue_seconds: Dict[str, List[float]] = defaultdict(list)
+    failed: Dict[str, int] = defaultdict(int)
+    seen: Dict[str, int] = defaultdict(int)
+    totals: List[float] = []
+    runs = 0
+
+    for status in statuses:
+        runs += 1
+        tasks = status.tasks or []
+        ends = {task.name: task.end_date for task in tasks if task.end_date}
+        starts = [task.start_date for task in tasks if task.start_date]
+        run_start = status.start_date or (min(starts) if starts else None)
+        run_end = status.end_date or (max(ends.values()) if ends else None)
+        if run_start and run_end:
+            totals.append(_seconds(run_start, run_end))
+        for task in tasks:
+            seen[task.name] += 1
+            if task.status.lower() == "failed" or task.task_status_summary.failed:
+                failed[task.name] += 1
+            if not task.start_date:
+                continue
+            if task.end_date:
+                run_seconds[task.name].append(_seconds(task.start_date, task.end_date))
+            upstream_ends = [ends[name] for name in upstream[task.name] if name in ends]
+            ready_at = max(upstream_ends) if upstream_ends else run_start
+            if ready_at:
+                queue_seconds[task.name].append(
+                    max(_seconds(ready_at, task.start_date), 0.0)
+                )
+
+    names = [task.name for task in workflow.tasks]
+    names += sorted(name for name in seen if name not in set(names))
+    weights = {
+        name: _quantile(queue_seconds[name], 0.5, 0.0)
+        + _quantile(run_seconds[name], 0.5, 0.0)
+        for name in names
+    }
+    critical_path = _critical_path(workflow, names, weights)
+    critical_seconds = sum(weights[name] for name in critical_path)
+
+    timings = []
+    for name in names:
+        timing = TaskTiming(
+            name=name,
+            runs=seen[name],
+            failed=failed[name],
+            on_critical_path=name in critical_path,
+            critical_path_share=(
+                weights[name] / critical_seconds
+                if name in critical_path and critical_seconds
+                else 0.0
+            ),
+        )
+        for quantile in PERCENTILES:
+            suffix = f"p{int(quantile * 100)}"
+            setattr(
+                timing, f"run_seconds_{suffix}", _quantile(run_seconds[name], quantile)
+            )
+            setattr(
+                timing,
+                f"queue_seconds_{suffix}",
+                _quantile(queue_seconds[name], quantile),
+            )
+        timings.append(timing)
+
+    bottlenecks = sorted(critical_path, key=lambda name: weights[name], reverse=True)
+    return WorkflowTimingReport(
+        workflow_name=workflow.name,
+        runs=runs,
+        total_seconds_p50=_quantile(totals, 0.5),
+        total_seconds_p90=_quantile(totals, 0.9),
+        critical_path=critical_path,
+        critical_path_seconds=critical_seconds,
+        bottlenecks=[name for name in bottlenecks if weights[name] > 0][
+            :max_bottlenecks
+        ],
+        tasks=timings,
+    )
+
+
+def _seconds(start: datetime, end: datetime) -> float:
+    return (end - start).total_seconds()
+
+
+def _quantile(
+    values: List[float], quantile: float, default: Optional[float] = None
+) -> Optional[float]:
+    if not values:
+        return default
+    return float(pd.Series(values).quantile(quantile))
+
+
+def _critical_path(
+    workflow: Workflow, names: List[str], weights: Dict[str, float]
+) -> List[str]:
+    downstream = {task.name: task.downstream_tasks for task in workflow.tasks}
+    indegree = {name: 0 for name in names}
+    for name in names:
+        for child in downstream.get(name, []):
+            if child in indegree:
+                indegree[child] += 1
+
+    order = [name for name in names if indegree[name] == 0]
+    for name in order:
+        for child in downstream.get(name, []):
+            if child in indegree:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    order.append(child)
+
+    # Longest path over the topological order; tasks caught in a cycle are ignored.
+    distance = {name: weights[name] for name in order}
+    previous: Dict[str, Optional[str]] = {name: None for name in order}
+    for name in order:
+        for child in downstream.get(name, []):
+            if child in distance and distance[name] + weights[child] > distance[child]:
+                distance[child] = distance[name] + weights[child]
+                previous[child] = name
+    if not distance:
+        return []
+    node: Optional[str] = max(distance, key=distance.get)
+    path = []
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    return path[::-1]
@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+DISPATCHING = "dispatching"
+ACCEPTED = "accepted"
+FAILED = "failed"
+UNKNOWN = "unknown"
+
+JournalKey = Tuple[str, str, str]
+
+
+class DispatchJournal:
+    """An append-only JSON Lines journal of bulk workflow dispatches.
+
+    Every document is recorded as `dispatching` before its request is sent and as
+    `accepted`, `failed` or `unknown` once the outcome is known. `failed` is only
+    recorded when the server cannot have accepted the run: the connection was never
+    established or the request was rejected with a 4xx status. Other errors, such as a
+    read timeout or a 5xx status, are recorded as `unknown`, since the run may have
+    started anyway.
+
+    When a dispatcher is restarted with the same journal, accepted documents are not
+    submitted again and failed documents are retried. Documents left `unknown`, or in
+    `dispatching` by a crash, are skipped unless `retry_unknown` is set; `unresolved`
+    lists them so that they can be checked first, for example with
+    `WorkflowOperations.iter_workflow_runs_for_document`, and recorded as `accepted`.
+
+    Every record is flushed and fsynced before the dispatch proceeds. A line left
+    incomplete by a crash while it was written is dropped when the journal is opened,
+    and the file is truncated after the last complete record.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._states: Dict[JournalKey, dict] = {}
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        valid_size = 0
+        with open(self.path, "rb") as journal:
+            for number, line in enumerate(journal, start=1):
+                if not line.endswith(b"\n"):
+                    # An unterminated last line is a write interrupted by a crash.
+                    logger.warning(
+                        f"Dropping incomplete line {number} of journal {self.path}"
+                    )
+                    break
+                valid_size += len(line)
+                try:
+                    entry = json.loads(line)
+                    key = (entry["action"], entry["workflow_name"], entry["doc_id"])
+                except (ValueError, KeyError, TypeError):
+                    if line.strip():
+                        logger.warning(
+                            f"Skipping malformed line {number} of journal {self.path}"
+                        )
+                    continue
+                self._states[key] = entry
+        if os.path.getsize(self.path) != valid_size:
+            # Truncated so that the next record starts on a line of its own.
+            os.truncate(self.path, valid_size)
+
+    def state(self, action: str, workflow_name: str, doc_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._states.get((action, workflow_name, doc_id))
+
+    def should_dispatch(
+        self,
+        action: str,
+        workflow_name: str,
+        doc_id: str,
+        retry_unknown: bool = False,
+    ) -> bool:
+        entry = self.state(action, workflow_name, doc_id)
+        if entry is None or entry["state"] == FAILED:
+            return True
+        return retry_unknown and entry["state"] in (DISPATCHING, UNKNOWN)
+
+    def unresolved(self, action: str, workflow_name: str) -> List[str]:
+        """The IDs of the documents whose dispatch outcome is `dispatching` or `unknown`."""
+        with self._lock:
+            return [
+                doc_id
+                for (
+                    entry_action,
+                    entry_workflow,
+                    doc_id,
+                ), entry in self._states.items()
+                if entry_action == action
+                and entry_workflow == workflow_name
+                and entry["state"] in (DISPATCHING, UNKNOWN)
+            ]
+
+    def record(
+        self,
+        action: str,
+        workflow_name: str,
+        doc_id: str,
+        state: str,
+        run_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        entry = {
+            "action": action,
+            "workflow_name": workflow_name,
+            "doc_id": doc_id,
+            "state": state,
+            "run_id": run_id,
+            "error": error,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as journal:
+                journal.write(json.dumps(entry) + "\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+            self._states[(action, workflow_name, doc_id)] = entry
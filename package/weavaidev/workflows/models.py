@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Any, List, Optional
 
+import pandas as pd
 from pydantic import BaseModel
 
 
@@ -81,3 +82,34 @@ class DocumentRun(BaseModel):
 class DocumentWorkflowRunsResponse(BaseModel):
     docs: List[DocumentRun]
     total: int
+
+
+class TaskTiming(BaseModel):
+    name: str
+    runs: int
+    failed: int
+    run_seconds_p50: Optional[float] = None
+    run_seconds_p90: Optional[float] = None
+    run_seconds_p99: Optional[float] = None
+    queue_seconds_p50: Optional[float] = None
+    queue_seconds_p90: Optional[float] = None
+    queue_seconds_p99: Optional[float] = None
+    on_critical_path: bool = False
+    critical_path_share: float = 0.0
+
+
+class WorkflowTimingReport(BaseModel):
+    workflow_name: str
+    runs: int
+    total_seconds_p50: Optional[float] = None
+    total_seconds_p90: Optional[float] = None
+    critical_path: List[str] = []
+    critical_path_seconds: float = 0.0
+    bottlenecks: List[str] = []
+    tasks: List[TaskTiming] = []
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [task.model_dump() for task in self.tasks],
+            columns=list(TaskTiming.model_fields),
+        ).set_index("name")
@@ -0,0 +1,314 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    InvalidStateError,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from loguru import logger
+from weavaidev.workflows.models import RunWorkflowResponse, WorkflowStatusResponse
+
+if TYPE_CHECKING:
+    from weavaidev.workflows import WorkflowOperations
+
+TERMINAL_STATES = frozenset({"success", "failed", "upstream_failed", "skipped"})
+
+RunKey = Tuple[str, str]
+CompletionCallback = Callable[
+    [RunWorkflowResponse, Optional[WorkflowStatusResponse]], None
+]
+
+
+class _TrackedRun:
+    __slots__ = (
+        "run",
+        "future",
+        "callbacks",
+        "interval",
+        "signature",
+        "errors",
+        "finished",
+        "final_status",
+    )
+
+    def __init__(self, run: RunWorkflowResponse, interval: float):
+        self.run = run
+        self.future: Future = Future()
+        self.callbacks: List[CompletionCallback] = []
+        self.interval = interval
+        self.signature = None
+        self.errors = 0
+        self.finished = False
+        self.final_status: Optional[WorkflowStatusResponse] = None
+
+
+class WorkflowRunTracker:
+    """Polls the status of many workflow runs from a single scheduler thread.
+
+    Every tracked run gets its own polling interval: it is reset to `min_interval`
+    while tasks are running (or `queued_interval` while they are only queued) whenever
+    the status changes, and grows by `backoff` up to `max_interval` while nothing
+    changes. Status requests are issued by a small pool of `max_workers` threads, so
+    thousands of runs do not need thousands of threads.
+
+    Completion can be observed through the `Future` returned by `track`, by iterating
+    `as_completed`, by awaiting `wait_for`, or with callbacks, which are invoked with the
+    run and its final `WorkflowStatusResponse` once a terminal state is reached. A run
+    whose status requests fail `max_errors` times in a row is given up: its future
+    raises the last error and its callbacks are invoked with a None status. Cancelling
+    the future of a run stops polling it.
+    """
+
+    def __init__(
+        self,
+        operations: "WorkflowOperations",
+        min_interval: float = 2.0,
+        queued_interval: float = 10.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        max_workers: int = 4,
+        max_errors: int = 5,
+        terminal_states: Iterable[str] = TERMINAL_STATES,
+    ):
+        self.operations = operations
+        self.min_interval = min_interval
+        self.queued_interval = queued_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.max_errors = max_errors
+        self.terminal_states = {state.lower() for state in terminal_states}
+        self._runs: Dict[RunKey, _TrackedRun] = {}
+        self._callbacks: List[CompletionCallback] = []
+        self._schedule: List[Tuple[float, int, RunKey, _TrackedRun]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __enter__(self) -> "WorkflowRunTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def track(
+        self,
+        run: RunWorkflowResponse,
+        callback: Optional[CompletionCallback] = None,
+    ) -> Future:
+        """Starts tracking a run and returns a future resolving to its final status.
+
+        A `callback` given for a run that has already finished, or was given up, is invoked
+        immediately. A run whose future was cancelled is tracked again with a new future.
+        """
+        key = (run.workflow_id, run.run_id)
+        finished = False
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("WorkflowRunTracker has been stopped")
+            tracked = self._runs.get(key)
+            if tracked is None or (tracked.future.cancelled() and not tracked.finished):
+                tracked = _TrackedRun(run, self.min_interval)
+                self._runs[key] = tracked
+                self._push(key, tracked, 0.0)
+            if callback is not None:
+                finished = tracked.finished
+                if not finished:
+                    tracked.callbacks.append(callback)
+            self._ensure_started()
+        if finished:
+            self._invoke(callback, tracked.run, tracked.final_status)
+        return tracked.future
+
+    def track_many(self, runs: Iterable[RunWorkflowResponse]) -> List[Future]:
+        return [self.track(run) for run in runs]
+
+    def add_callback(self, callback: CompletionCallback) -> None:
+        """Registers a callback invoked when any tracked run finishes or is given up."""
+        with self._condition:
+            self._callbacks.append(callback)
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return sum(
+                1 for tracked in self._runs.values() if not tracked.future.done()
+            )
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[Tuple[RunWorkflowResponse, WorkflowStatusResponse]]:
+        """Yields `(run, final_status)` pairs for the currently tracked runs as they finish."""
+        with self._condition:
+            futures = {tracked.future: tracked.run for tracked in self._runs.values()}
+        for future in as_completed(futures, timeout=timeout):
+            yield futures[future], future.result()
+
+    def wait(
+        self, timeout: Optional[float] = None
+    ) -> Dict[str, WorkflowStatusResponse]:
+        """Blocks until every tracked run has finished and returns the statuses by run ID."""
+        return {
+            run.run_id: status for run, status in self.as_completed(timeout=timeout)
+        }
+
+    async def wait_for(self, run: RunWorkflowResponse) -> WorkflowStatusResponse:
+        """Awaits the final status of a run, tracking it if needed."""
+        return await asyncio.wrap_future(self.track(run))
+
+    def stop(self) -> None:
+        """Stops polling; runs that have not finished are cancelled."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._condition:
+            futures = [tracked.future for tracked in self._runs.values()]
+        for future in futures:
+            future.cancel()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="weavaidev-run-poll"
+            )
+            self._thread = threading.Thread(
+                target=self._run_scheduler, name="weavaidev-run-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def _push(self, key: RunKey, tracked: _TrackedRun, delay: float) -> None:
+        heapq.heappush(
+            self._schedule,
+            (time.monotonic() + delay, next(self._sequence), key, tracked),
+        )
+        self._condition.notify()
+
+    def _reschedule(self, key: RunKey, tracked: _TrackedRun) -> None:
+        with self._condition:
+            if not self._stopped and not tracked.future.cancelled():
+                self._push(key, tracked, tracked.interval)
+
+    def _run_scheduler(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    if self._schedule and self._schedule[0][0] <= now:
+                        break
+                    timeout = self._schedule[0][0] - now if self._schedule else None
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, key, tracked = heapq.heappop(self._schedule)
+                if tracked.future.cancelled() or self._runs.get(key) is not tracked:
+                    continue
+            self._executor.submit(self._poll, key, tracked)
+
+    def _poll(self, key: RunKey, tracked: _TrackedRun) -> None:
+        try:
+            status = self.operations.get_workflow_status(
+                workflow_id=key[0], workflow_run_id=key[1]
+            )
+        except Exception as exc:
+            tracked.errors += 1
+            if tracked.errors >= self.max_errors:
+                logger.warning(
+                    f"Giving up on workflow run {key[1]} after {tracked.errors} "
+                    f"failed polls: {exc}"
+                )
+                self._complete(tracked, None, exc)
+                return
+            logger.warning(f"Failed to poll workflow run {key[1]}: {exc}")
+            tracked.interval = min(tracked.interval * self.backoff, self.max_interval)
+            self._reschedule(key, tracked)
+            return
+
+        tracked.errors = 0
+        if status.status.lower() in self.terminal_states:
+            self._complete(tracked, status)
+            return
+
+        tracked.interval = self._next_interval(tracked, status)
+        self._reschedule(key, tracked)
+
+    def _next_interval(
+        self, tracked: _TrackedRun, status: WorkflowStatusResponse
+    ) -> float:
+        running = sum(task.task_status_summary.running for task in status.tasks or [])
+        queued = sum(task.task_status_summary.queued for task in status.tasks or [])
+        signature = (
+            status.status,
+            tuple(
+                (
+                    task.name,
+                    task.status,
+                    tuple(task.task_status_summary.model_dump().values()),
+                )
+                for task in status.tasks or []
+            ),
+        )
+        changed = signature != tracked.signature
+        tracked.signature = signature
+        if changed:
+            if running:
+                return self.min_interval
+            if queued:
+                return self.queued_interval
+        return min(
+            max(tracked.interval * self.backoff, self.min_interval), self.max_interval
+        )
+
+    def _complete(
+        self,
+        tracked: _TrackedRun,
+        status: Optional[WorkflowStatusResponse],
+        error: Optional[Exception] = None,
+    ) -> None:
+        with self._condition:
+            tracked.finished = True
+            tracked.final_status = status
+            callbacks = tracked.callbacks + self._callbacks
+            tracked.callbacks = []
+        for callback in callbacks:
+            self._invoke(callback, tracked.run, status)
+        try:
+            if error is not None:
+                tracked.future.set_exception(error)
+            else:
+                tracked.future.set_result(status)
+        except InvalidStateError:
+            # The future was cancelled while its last status request was in flight.
+            pass
+
+    @staticmethod
+    def _invoke(
+        callback: CompletionCallback,
+        run: RunWorkflowResponse,
+        status: Optional[WorkflowStatusResponse],
+    ) -> None:
+        try:
+            callback(run, status)
+        except Exception as exc:
+            logger.warning(f"Workflow run callback failed: {exc}")